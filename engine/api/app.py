@@ -12,6 +12,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from engine.core.orderblock import (
     detect_orderblock,
+    detect_latest_orderblock,
     find_all_fvgs,
     OrderBlock,
     FVG,
@@ -820,11 +821,16 @@ def analyze_at_bar(data: OHLCVData, bar_index: int, filter_weak: bool = False) -
     current_volume = float(volume[-1]) if volume is not None and len(volume) > 0 else 0.0
 
     # Detect order block with volume analysis
-    ob, filtered_weak_count = detect_orderblock(
-        open_, high, low, close,
-        volume=volume,
-        filter_weak=filter_weak,
-    )
+    if filter_weak:
+        ob, filtered_weak_count = detect_orderblock(
+            open_, high, low, close,
+            volume=volume,
+            filter_weak=True,
+        )
+    else:
+        # Nothing is filtered, so only the most recent fresh OB is needed
+        ob = detect_latest_orderblock(open_, high, low, close, volume=volume)
+        filtered_weak_count = 0
 
     # Detect FVGs independently
     fvgs = find_all_fvgs(open_, high, low, close, fresh_only=True)
@@ -3262,7 +3268,7 @@ async def ai_lh_analysis(
         ema200 = calculate_ema(ohlcv.close, 200)
 
         # Detect Order Blocks and FVGs
-        ob, _ = detect_orderblock(ohlcv.open, ohlcv.high, ohlcv.low, ohlcv.close, ohlcv.volume)
+        ob = detect_latest_orderblock(ohlcv.open, ohlcv.high, ohlcv.low, ohlcv.close, ohlcv.volume)
         fvgs = find_all_fvgs(ohlcv.open, ohlcv.high, ohlcv.low, ohlcv.close)
 
         # Get latest values
@@ -4382,6 +4388,9 @@ from typing import List as PyList
 _trading_bot = None
 _trading_task = None
 
+# Full trade history, anchored to the repo root rather than the cwd
+TRADE_LOG_PATH = Path(__file__).resolve().parents[2] / "logs" / "trades.jsonl"
+
 
 class TradingStartRequest(BaseModel):
     """Request to start trading bot"""
@@ -4410,10 +4419,16 @@ async def start_trading(request: TradingStartRequest):
         raise HTTPException(400, "Trading bot already running")
 
     try:
-        from engine.trading.bot import TradingBot
+        from engine.trading import TradingBot, start_trading_log
+
+        # Bot logs go through a background listener, off the event loop
+        start_trading_log()
 
         # Create bot (default: paper trading)
-        _trading_bot = TradingBot(use_real_account=request.use_real)
+        _trading_bot = TradingBot(
+            use_real_account=request.use_real,
+            trade_log_path=str(TRADE_LOG_PATH),
+        )
         _trading_bot.set_check_interval(request.interval_minutes)
         _trading_bot.set_strategy_params(
             stop_loss=request.stop_loss,
@@ -4502,11 +4517,14 @@ async def get_trading_positions():
         return []
 
     positions = _trading_bot.om.get_all_positions()
+    prices = _trading_bot.om._get_current_prices({
+        symbol: pos.get('market', 'KR') for symbol, pos in positions.items()
+    })
 
     result = []
     for symbol, pos in positions.items():
         market = pos.get('market', 'KR')
-        current_price = _trading_bot.om._get_current_price(symbol, market)
+        current_price = prices[symbol]
         avg_price = pos['avg_price']
         quantity = pos['quantity']
 
@@ -1,12 +1,12 @@
 """CSV data loader for OHLCV data with dynamic yfinance fetching."""
 
-import csv
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Optional, Tuple
 
 import numpy as np
+import pandas as pd
 
 
 @dataclass
@@ -233,35 +233,45 @@ def load_csv(symbol: str, timeframe: str, data_dir: str = "data") -> OHLCVData:
     raise FileNotFoundError(f"Data file not found: {filepath} and yfinance fetch failed")
 
 
+# Date column names accepted in data CSVs, in lookup order
+DATE_COLUMNS = ("Date", "timestamp", "date")
+
+
 def _load_csv_file(filepath: Path) -> OHLCVData:
     """Load OHLCV data from an existing CSV file."""
-    timestamps = []
-    opens = []
-    highs = []
-    lows = []
-    closes = []
-    volumes = []
-
-    with open(filepath, "r") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            # Handle both "Date" and "timestamp" column names
-            date_val = row.get("Date") or row.get("timestamp") or row.get("date", "")
-            timestamps.append(date_val)
-            # Handle both capitalized and lowercase column names
-            opens.append(float(row.get("Open") or row.get("open", 0)))
-            highs.append(float(row.get("High") or row.get("high", 0)))
-            lows.append(float(row.get("Low") or row.get("low", 0)))
-            closes.append(float(row.get("Close") or row.get("close", 0)))
-            volumes.append(float(row.get("Volume") or row.get("volume", 0)))
+    # One C-engine parse into typed columns instead of a Python row loop
+    # Dates stay verbatim strings (no float coercion of numeric timestamps)
+    df = pd.read_csv(
+        filepath,
+        engine="c",
+        memory_map=True,
+        dtype={name: str for name in DATE_COLUMNS},
+    )
+
+    def column(*names: str) -> Optional[pd.Series]:
+        # Handle both capitalized and lowercase column names
+        for name in names:
+            if name in df.columns:
+                return df[name]
+        return None
+
+    def prices(*names: str) -> np.ndarray:
+        values = column(*names)
+        if values is None:
+            return np.zeros(len(df))
+        return pd.to_numeric(values).fillna(0.0).to_numpy(dtype=np.float64)
+
+    # Handle both "Date" and "timestamp" column names
+    dates = column(*DATE_COLUMNS)
+    timestamps = [""] * len(df) if dates is None else dates.fillna("").tolist()
 
     return OHLCVData(
         timestamps=timestamps,
-        open=np.array(opens),
-        high=np.array(highs),
-        low=np.array(lows),
-        close=np.array(closes),
-        volume=np.array(volumes),
+        open=prices("Open", "open"),
+        high=prices("High", "high"),
+        low=prices("Low", "low"),
+        close=prices("Close", "close"),
+        volume=prices("Volume", "volume"),
     )
 
 
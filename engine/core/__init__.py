@@ -1,13 +1,14 @@
 """Core engine modules for market structure and order block detection."""
 
 from .structure import find_pivot_swings, detect_bos, Swing, BOS
-from .orderblock import detect_orderblock, OrderBlock
+from .orderblock import detect_orderblock, detect_latest_orderblock, OrderBlock
 from .screener import screen_symbol, screen_watchlist, ScreenResult
 
 __all__ = [
     "find_pivot_swings",
     "detect_bos",
     "detect_orderblock",
+    "detect_latest_orderblock",
     "Swing",
     "BOS",
     "OrderBlock",
@@ -0,0 +1,36 @@
+"""
+Ahead-of-time build of the screener and structure kernels (requires Numba).
+
+Compiles the numeric kernels into the `kernels_native` extension module
+next to this file, so tests and app startup skip the JIT compile
+entirely:
+
+    python -m engine.core._kernels_aot
+
+screener.py and structure.py fall back to the JIT / NumPy paths when the
+extension has not been built.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from engine.core.screener import _ema_recurrence
+from engine.core.structure import _pivot_masks_jit
+
+cc = CC("kernels_native")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+@cc.export("ema_recurrence", "void(f8[::1], f8[::1], i8, f8)")
+def ema_recurrence(closes, out, start, multiplier):
+    _ema_recurrence(closes, out, start, multiplier)
+
+
+@cc.export("pivot_masks", "void(f8[::1], f8[::1], i8, i8, b1[::1], b1[::1])")
+def pivot_masks(high, low, left_bars, right_bars, is_high, is_low):
+    _pivot_masks_jit(high, low, left_bars, right_bars, is_high, is_low)
+
+
+if __name__ == "__main__":
+    cc.compile()
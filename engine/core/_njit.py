@@ -0,0 +1,23 @@
+"""
+Optional Numba support for the core detection kernels.
+
+`njit` is numba.njit when Numba is installed and a pass-through decorator
+otherwise (`prange` likewise falls back to range). Callers check
+NUMBA_AVAILABLE to choose between a compiled scalar kernel and the
+equivalent NumPy code, since a scalar loop run without Numba is slower
+than NumPy.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (bare or with options)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    prange = range
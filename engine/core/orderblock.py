@@ -30,7 +30,7 @@ class OBDirection(Enum):
     SELL = "sell"
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class FVG:
     """Fair Value Gap (3-candle, BODY based)."""
     index: int  # Index of the third candle (candle[i])
@@ -56,7 +56,7 @@ class OBAgeStatus(Enum):
     AGED = "aged"        # > 50 candles (weakening)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class OrderBlock:
     """Represents an order block zone."""
     index: int  # Bar index of the engulfed candle (OB zone)
@@ -267,6 +267,40 @@ def _check_ob(
     return None
 
 
+def _scan_ob_patterns(open_: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """
+    Vectorized _check_ob over every bar.
+
+    Returns an int8 array: 1 where bar i is a Buy OB engulfing, -1 where it
+    is a Sell OB engulfing, 0 otherwise (the OB zone is bar i - 1). Scans
+    iterate np.flatnonzero() of this instead of testing every bar.
+    """
+    open_ = np.asarray(open_, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+    n = len(close)
+    pattern = np.zeros(n, dtype=np.int8)
+    if n < 2:
+        return pattern
+
+    curr_open, curr_close = open_[1:], close[1:]
+    prev_open, prev_close = open_[:-1], close[:-1]
+
+    # Engulfing body contains the engulfed body
+    engulfs = (
+        (np.maximum(curr_open, curr_close) >= np.maximum(prev_open, prev_close)) &
+        (np.minimum(curr_open, curr_close) <= np.minimum(prev_open, prev_close))
+    )
+
+    # Buy OB: Bullish engulfs previous bearish
+    buy = (curr_close > curr_open) & (prev_close < prev_open) & engulfs
+    # Sell OB: Bearish engulfs previous bullish
+    sell = (curr_close < curr_open) & (prev_close > prev_open) & engulfs
+
+    pattern[1:][buy] = 1
+    pattern[1:][sell] = -1
+    return pattern
+
+
 def _check_fvg(
     open_: np.ndarray,
     high: np.ndarray,
@@ -331,6 +365,64 @@ def _check_fvg(
     return None
 
 
+def _scan_fvg_patterns(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Vectorized _check_fvg over every bar.
+
+    Returns an int8 array: 1 where bar i completes a Buy FVG, -1 where it
+    completes a Sell FVG, 0 otherwise. Candles i-2, i-1 and i are compared
+    through aligned views, so the whole series is one set of array ops.
+    """
+    open_ = np.asarray(open_, dtype=np.float64)
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+    n = len(close)
+    pattern = np.zeros(n, dtype=np.int8)
+    if n < 3:
+        return pattern
+
+    bullish = close > open_
+    bearish = close < open_
+    all_bullish = bullish[:-2] & bullish[1:-1] & bullish[2:]
+    all_bearish = bearish[:-2] & bearish[1:-1] & bearish[2:]
+
+    # Buy FVG: all bullish + current low > prev2 high (gap above)
+    buy = all_bullish & (low[2:] > high[:-2])
+    # Sell FVG: all bearish + current high < prev2 low (gap below)
+    sell = all_bearish & (high[2:] < low[:-2])
+
+    pattern[2:][buy] = 1
+    pattern[2:][sell] = -1
+    return pattern
+
+
+def _nearest_fvg(
+    fvg_pattern: np.ndarray,
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    direction: OBDirection,
+    search_start: int,
+    search_end: int,
+) -> Optional[FVG]:
+    """
+    Most recent FVG in [search_start, search_end) matching `direction`,
+    looked up in a _scan_fvg_patterns array.
+    """
+    code = 1 if direction == OBDirection.BUY else -1
+    hits = np.flatnonzero(fvg_pattern[search_start:search_end] == code)
+    if hits.size == 0:
+        return None
+    return _check_fvg(open_, high, low, close, search_start + int(hits[-1]))
+
+
 def _is_ob_fresh(
     high: np.ndarray,
     low: np.ndarray,
@@ -358,35 +450,63 @@ def _is_ob_fresh(
     Returns:
         True if OB is still fresh/valid
     """
+    # Bars after formation, as views (no copy)
+    bar_high = high[from_idx + 1:to_idx]
+    bar_low = low[from_idx + 1:to_idx]
+
     if strict:
         # Original strict mode - any touch invalidates
-        for i in range(from_idx + 1, to_idx):
-            bar_high = high[i]
-            bar_low = low[i]
-
-            # Check if price intersects the OB body zone
-            if bar_low <= ob.zone_top and bar_high >= ob.zone_bottom:
-                return False
-        return True
+        # (price intersects the OB body zone)
+        touched = (bar_low <= ob.zone_top) & (bar_high >= ob.zone_bottom)
+        return not touched.any()
 
     # Relaxed mode - only full mitigation invalidates
     # OB is mitigated when price closes through the opposite side of the zone
-    for i in range(from_idx + 1, to_idx):
-        bar_low = low[i]
-        bar_high = high[i]
+    if ob.direction == OBDirection.BUY:
+        # Buy OB is mitigated if price closes below zone_bottom
+        # (sellers overwhelm the buy zone)
+        return not (bar_low < ob.zone_bottom).any()
 
-        if ob.direction == OBDirection.BUY:
-            # Buy OB is mitigated if price closes below zone_bottom
-            # (sellers overwhelm the buy zone)
-            if bar_low < ob.zone_bottom:
-                return False
-        else:
-            # Sell OB is mitigated if price closes above zone_top
-            # (buyers overwhelm the sell zone)
-            if bar_high > ob.zone_top:
-                return False
+    # Sell OB is mitigated if price closes above zone_top
+    # (buyers overwhelm the sell zone)
+    return not (bar_high > ob.zone_top).any()
 
-    return True
+
+def _later_extremes(high: np.ndarray, low: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Lowest low and highest high strictly after each bar.
+
+    later_low[i] = min(low[i + 1:]) and later_high[i] = max(high[i + 1:])
+    (+inf / -inf when no bars follow; NaN bars are ignored). With these,
+    the relaxed _is_ob_fresh(high, low, ob, i, n) check is O(1) per OB:
+      Buy OB:  later_low[i] >= zone_bottom
+      Sell OB: later_high[i] <= zone_top
+    """
+    low = np.asarray(low, dtype=np.float64)
+    high = np.asarray(high, dtype=np.float64)
+    n = len(low)
+    later_low = np.full(n, np.inf)
+    later_high = np.full(n, -np.inf)
+    if n > 1:
+        later_low[:-1] = np.minimum.accumulate(
+            np.where(np.isnan(low), np.inf, low)[:0:-1]
+        )[::-1]
+        later_high[:-1] = np.maximum.accumulate(
+            np.where(np.isnan(high), -np.inf, high)[:0:-1]
+        )[::-1]
+    return later_low, later_high
+
+
+def _is_fresh_after(
+    ob: OrderBlock,
+    later_low: np.ndarray,
+    later_high: np.ndarray,
+    from_idx: int,
+) -> bool:
+    """Relaxed _is_ob_fresh to the end of the series, via _later_extremes."""
+    if ob.direction == OBDirection.BUY:
+        return bool(later_low[from_idx] >= ob.zone_bottom)
+    return bool(later_high[from_idx] <= ob.zone_top)
 
 
 def _is_fvg_fresh(
@@ -430,10 +550,8 @@ def find_all_fvgs(
 
     fvgs: List[FVG] = []
 
-    for i in range(2, n):
+    for i in np.flatnonzero(_scan_fvg_patterns(open_, high, low, close)).tolist():
         fvg = _check_fvg(open_, high, low, close, i)
-        if fvg is None:
-            continue
 
         if fresh_only and not _is_fvg_fresh(high, low, fvg, n):
             continue
@@ -479,14 +597,14 @@ def detect_orderblock(
     patterns_stale = 0
     patterns_weak = 0
 
-    # Scan for OB patterns
-    for i in range(1, n):
-        ob_result = _check_ob(open_, close, i)
-        if ob_result is None:
-            continue
-
+    # Scan for OB patterns (only bars that are engulfings)
+    pattern = _scan_ob_patterns(open_, close)
+    fvg_pattern = _scan_fvg_patterns(open_, high, low, close)
+    later_low, later_high = _later_extremes(high, low)
+    for i in np.flatnonzero(pattern).tolist():
         patterns_found += 1
-        ob_idx, direction = ob_result
+        ob_idx = i - 1
+        direction = OBDirection.BUY if pattern[i] > 0 else OBDirection.SELL
 
         # Create OB zone from engulfed candle's BODY
         ob_open = open_[ob_idx]
@@ -498,19 +616,14 @@ def detect_orderblock(
         vol_strength, vol_ratio = _calculate_volume_strength(volume, i)
 
         # Check for FVG in a window around the OB (5 bars before to 5 bars after)
-        # Search backward first (most recent FVG near OB), then forward
-        fvg = None
-        has_fvg = False
+        # Most recent FVG in the window whose direction matches the OB
         search_start = max(2, ob_idx - 5)
         search_end = min(i + 6, n)
-        for fvg_idx in range(search_end - 1, search_start - 1, -1):  # Search backward
-            candidate_fvg = _check_fvg(open_, high, low, close, fvg_idx)
-            if candidate_fvg is not None:
-                # Match FVG direction with OB direction
-                if candidate_fvg.direction == direction:
-                    fvg = candidate_fvg
-                    has_fvg = True
-                    break
+        fvg = _nearest_fvg(
+            fvg_pattern, open_, high, low, close,
+            direction, search_start, search_end,
+        )
+        has_fvg = fvg is not None
 
         ob = OrderBlock(
             index=ob_idx,
@@ -525,7 +638,7 @@ def detect_orderblock(
         )
 
         # Check freshness: OB must not be touched after formation
-        if not _is_ob_fresh(high, low, ob, i, n):
+        if not _is_fresh_after(ob, later_low, later_high, i):
             patterns_stale += 1
             continue
 
@@ -556,6 +669,75 @@ def detect_orderblock(
     return selected_ob, filtered_weak_count
 
 
+def detect_latest_orderblock(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: Optional[np.ndarray] = None,
+    filter_weak: bool = False,
+) -> Optional[OrderBlock]:
+    """
+    Fast path for the OB detect_orderblock selects (the most recent valid one).
+
+    Scans engulfings right-to-left and returns the first that is fresh (and
+    not weak, if filter_weak), so only the bars after each candidate are
+    examined. Unlike detect_orderblock it does not count filtered weak OBs.
+
+    Args:
+        open_: Open prices
+        high: High prices
+        low: Low prices
+        close: Close prices
+        volume: Volume data (optional, for volume strength analysis)
+        filter_weak: If True, skip weak volume OBs
+
+    Returns:
+        OrderBlock or None
+    """
+    n = len(close)
+    if n < 3:
+        return None
+
+    pattern = _scan_ob_patterns(open_, close)
+    fvg_pattern = None
+
+    for i in reversed(np.flatnonzero(pattern).tolist()):
+        ob_idx = i - 1
+        direction = OBDirection.BUY if pattern[i] > 0 else OBDirection.SELL
+
+        ob_open = open_[ob_idx]
+        ob_close = close[ob_idx]
+        ob = OrderBlock(
+            index=ob_idx,
+            direction=direction,
+            zone_top=_body_high(ob_open, ob_close),
+            zone_bottom=_body_low(ob_open, ob_close),
+            displacement_index=i,
+            has_fvg=False,
+        )
+
+        # Freshness only looks at bars after i: short near the right edge
+        if not _is_ob_fresh(high, low, ob, i, n):
+            continue
+
+        ob.volume_strength, ob.volume_ratio = _calculate_volume_strength(volume, i)
+        if filter_weak and ob.volume_strength == VolumeStrength.WEAK:
+            continue
+
+        # Most recent FVG in the window whose direction matches the OB
+        if fvg_pattern is None:
+            fvg_pattern = _scan_fvg_patterns(open_, high, low, close)
+        ob.fvg = _nearest_fvg(
+            fvg_pattern, open_, high, low, close,
+            direction, max(2, ob_idx - 5), min(i + 6, n),
+        )
+        ob.has_fvg = ob.fvg is not None
+        return ob
+
+    return None
+
+
 def find_all_orderblocks(
     open_: np.ndarray,
     high: np.ndarray,
@@ -587,12 +769,13 @@ def find_all_orderblocks(
     orderblocks: List[OrderBlock] = []
     filtered_weak_count = 0
 
-    for i in range(1, n):
-        ob_result = _check_ob(open_, close, i)
-        if ob_result is None:
-            continue
-
-        ob_idx, direction = ob_result
+    pattern = _scan_ob_patterns(open_, close)
+    fvg_pattern = _scan_fvg_patterns(open_, high, low, close)
+    if fresh_only:
+        later_low, later_high = _later_extremes(high, low)
+    for i in np.flatnonzero(pattern).tolist():
+        ob_idx = i - 1
+        direction = OBDirection.BUY if pattern[i] > 0 else OBDirection.SELL
 
         ob_open = open_[ob_idx]
         ob_close = close[ob_idx]
@@ -603,17 +786,13 @@ def find_all_orderblocks(
         vol_strength, vol_ratio = _calculate_volume_strength(volume, i)
 
         # Check for FVG in a window around the OB (5 bars before to 5 bars after)
-        fvg = None
-        has_fvg = False
         search_start = max(2, ob_idx - 5)
         search_end = min(i + 6, n)
-        for fvg_idx in range(search_end - 1, search_start - 1, -1):
-            candidate_fvg = _check_fvg(open_, high, low, close, fvg_idx)
-            if candidate_fvg is not None:
-                if candidate_fvg.direction == direction:
-                    fvg = candidate_fvg
-                    has_fvg = True
-                    break
+        fvg = _nearest_fvg(
+            fvg_pattern, open_, high, low, close,
+            direction, search_start, search_end,
+        )
+        has_fvg = fvg is not None
 
         ob = OrderBlock(
             index=ob_idx,
@@ -627,7 +806,7 @@ def find_all_orderblocks(
             volume_ratio=vol_ratio,
         )
 
-        if fresh_only and not _is_ob_fresh(high, low, ob, i, n):
+        if fresh_only and not _is_fresh_after(ob, later_low, later_high, i):
             continue
 
         # Filter weak OBs if requested
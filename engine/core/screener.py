@@ -8,6 +8,15 @@ from typing import Callable, List, Optional
 
 import numpy as np
 
+from ._njit import njit, prange, NUMBA_AVAILABLE
+
+# Ahead-of-time build of the kernels (python -m engine.core._kernels_aot)
+try:
+    from .kernels_native import ema_recurrence as _ema_recurrence_native
+    NATIVE_AVAILABLE = True
+except ImportError:
+    NATIVE_AVAILABLE = False
+
 
 @dataclass
 class ScreenResult:
@@ -24,12 +33,22 @@ class ScreenResult:
     reason: str
 
 
+@njit("void(f8[::1], f8[::1], i8, f8)", cache=True)
+def _ema_recurrence(closes, out, start, multiplier):
+    """Fill out[start:] with the EMA recurrence seeded by out[start - 1]."""
+    prev = out[start - 1]
+    for i in range(start, len(closes)):
+        prev = (closes[i] - prev) * multiplier + prev
+        out[i] = prev
+
+
 def ema(closes: np.ndarray, period: int) -> np.ndarray:
     """
     Calculate EMA using pure numpy.
 
     Returns array of same length, with NaN for insufficient data.
     """
+    closes = np.ascontiguousarray(closes, dtype=np.float64)
     n = len(closes)
     if n < period:
         return np.full(n, np.nan)
@@ -40,9 +59,18 @@ def ema(closes: np.ndarray, period: int) -> np.ndarray:
     # SMA for first value
     result[period - 1] = np.mean(closes[:period])
 
-    # EMA for rest
-    for i in range(period, n):
-        result[i] = (closes[i] - result[i - 1]) * multiplier + result[i - 1]
+    # EMA for rest (serial recurrence: compiled when Numba is available,
+    # otherwise stepped on Python floats, which beats ndarray indexing)
+    if NATIVE_AVAILABLE or NUMBA_AVAILABLE:
+        kernel = _ema_recurrence_native if NATIVE_AVAILABLE else _ema_recurrence
+        kernel(closes, result, period, multiplier)
+    else:
+        prev = float(result[period - 1])
+        values = []
+        for close in closes[period:].tolist():
+            prev = (close - prev) * multiplier + prev
+            values.append(prev)
+        result[period:] = values
 
     return result
 
@@ -157,6 +185,11 @@ def forecast_cross_days(ema20: np.ndarray, ema200: np.ndarray) -> Optional[int]:
     d0 = ema200[-1] - ema20[-1]
     v = (ema20[-1] - ema20[-6]) - (ema200[-1] - ema200[-6])
 
+    return _cross_days(d0, v)
+
+
+def _cross_days(d0: float, v: float) -> Optional[int]:
+    """Days to cross from gap d0 and slope difference v (see forecast_cross_days)."""
     if d0 <= 0:
         return 0  # Already crossed or touching
     elif v <= 0:
@@ -200,6 +233,41 @@ def score_candidate(
     return int(max(0, min(100, raw)))
 
 
+def score_candidates(
+    days_to_cross: np.ndarray,
+    d0: np.ndarray,
+    v: np.ndarray,
+    ema_slow_last: np.ndarray,
+) -> np.ndarray:
+    """
+    Vectorized score_candidate: one score per element.
+
+    NaN in days_to_cross stands for None. Results are identical to
+    calling score_candidate on each element.
+    """
+    days_to_cross = np.asarray(days_to_cross, dtype=np.float64)
+    d0 = np.asarray(d0, dtype=np.float64)
+    v = np.asarray(v, dtype=np.float64)
+    ema_slow_last = np.asarray(ema_slow_last, dtype=np.float64)
+
+    abs_ema = np.abs(ema_slow_last)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = v / abs_ema
+        raw = (
+            100
+            - 5 * days_to_cross
+            - 20 * (d0 / abs_ema)
+            + 10 * np.where(ratio < 3, ratio, 3)
+        )
+
+    # Same comparisons as max(0, min(100, raw)), NaN included
+    raw = np.where(raw < 100, raw, 100)
+    raw = np.where(raw > 0, raw, 0)
+
+    valid = ~np.isnan(days_to_cross) & (ema_slow_last != 0)
+    return np.where(valid, raw, 0).astype(np.int64)
+
+
 def screen_symbol(
     symbol: str,
     market: str,
@@ -233,10 +301,35 @@ def screen_symbol(
     ema20_arr = ema(closes, 20)
     ema200_arr = ema(closes, 200)
 
-    ema20_val = float(ema20_arr[-1])
-    ema200_val = float(ema200_arr[-1])
-    last_close = float(closes[-1])
+    return _screen_from_emas(
+        symbol,
+        market,
+        float(closes[-1]),
+        float(ema20_arr[-1]),
+        float(ema20_arr[-6]) if len(ema20_arr) >= 6 else np.nan,
+        float(ema200_arr[-1]),
+        float(ema200_arr[-6]) if len(ema200_arr) >= 6 else np.nan,
+    )
+
 
+def _screen_from_emas(
+    symbol: str,
+    market: str,
+    last_close: float,
+    ema20_val: float,
+    ema20_prev: float,
+    ema200_val: float,
+    ema200_prev: float,
+    score: Optional[int] = None,
+) -> ScreenResult:
+    """
+    Classify a symbol from its latest EMAs and the EMAs 5 bars earlier.
+
+    This is everything screen_symbol needs from the EMA series, so
+    screen_watchlist can compute just these values for a whole batch.
+    A precomputed score (from score_candidates) is used for OK results
+    when given.
+    """
     if np.isnan(ema20_val) or np.isnan(ema200_val):
         return ScreenResult(
             symbol=symbol,
@@ -255,18 +348,15 @@ def screen_symbol(
     d0 = ema200_val - ema20_val
 
     # v = slope_diff
-    if len(ema20_arr) >= 6 and len(ema200_arr) >= 6:
-        if not np.isnan(ema20_arr[-6]) and not np.isnan(ema200_arr[-6]):
-            v = (ema20_arr[-1] - ema20_arr[-6]) - (ema200_arr[-1] - ema200_arr[-6])
-        else:
-            v = 0.0
+    if not np.isnan(ema20_prev) and not np.isnan(ema200_prev):
+        v = (ema20_val - ema20_prev) - (ema200_val - ema200_prev)
+        days = _cross_days(d0, v)
     else:
         v = 0.0
+        days = None
 
     gap = d0  # ema200 - ema20
 
-    days = forecast_cross_days(ema20_arr, ema200_arr)
-
     # Determine reason
     if days is None:
         # NO_CONVERGENCE: d0 > 0 and v <= 0
@@ -283,7 +373,8 @@ def screen_symbol(
     else:
         # OK: days_to_cross in [1..30], EMA20 below EMA200 and approaching
         reason = "OK"
-        score = score_candidate(days, d0, v, ema200_val)
+        if score is None:
+            score = score_candidate(days, d0, v, ema200_val)
 
     return ScreenResult(
         symbol=symbol,
@@ -299,6 +390,65 @@ def screen_symbol(
     )
 
 
+def _ema_tails(
+    series: List[np.ndarray],
+    period: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Last EMA value and the value 5 bars earlier for each close series.
+
+    Matches ema(closes, period)[-1] and [-6] exactly. Series must have at
+    least max(period, 6) bars. The serial recurrence runs once for the
+    whole batch: per series in parallel when Numba is available,
+    otherwise bar by bar across all series at once.
+    """
+    k = len(series)
+    lengths = np.array([len(c) for c in series], dtype=np.int64)
+
+    # Time-major (bars x series), NaN-padded past each series' end
+    closes_tm = np.full((int(lengths.max()), k), np.nan)
+    for col, c in enumerate(series):
+        closes_tm[:len(c), col] = c
+
+    # SMA seeds per series (np.mean's summation order, as in ema())
+    seeds = np.array([np.mean(c[:period]) for c in series], dtype=np.float64)
+
+    if NUMBA_AVAILABLE:
+        last = np.empty(k)
+        prev = np.empty(k)
+        _ema_tails_jit(closes_tm, lengths, period, seeds, last, prev)
+        return last, prev
+
+    multiplier = 2.0 / (period + 1)
+    out = np.full_like(closes_tm, np.nan)
+    value = seeds
+    out[period - 1] = value
+    for i in range(period, len(closes_tm)):
+        value = (closes_tm[i] - value) * multiplier + value
+        out[i] = value
+
+    cols = np.arange(k)
+    return out[lengths - 1, cols], out[lengths - 6, cols]
+
+
+@njit("void(f8[:, ::1], i8[::1], i8, f8[::1], f8[::1], f8[::1])", cache=True, parallel=True)
+def _ema_tails_jit(closes_tm, lengths, period, seeds, last, prev):
+    """Per-series version of the _ema_tails recurrence (compiled by Numba)."""
+    multiplier = 2.0 / (period + 1)
+
+    # Series are independent, so they run in parallel
+    for col in prange(len(lengths)):
+        n = lengths[col]
+        value = seeds[col]
+        back = value if n - 6 == period - 1 else np.nan
+        for i in range(period, n):
+            value = (closes_tm[i, col] - value) * multiplier + value
+            if i == n - 6:
+                back = value
+        last[col] = value
+        prev[col] = back
+
+
 def screen_watchlist(
     symbols: List[str],
     market: str,
@@ -310,7 +460,14 @@ def screen_watchlist(
 
     Returns top N candidates (OK results only) sorted by score desc, then days asc.
     """
-    all_results: List[ScreenResult] = []
+    all_results: List[Optional[ScreenResult]] = []
+
+    # Fetch sequentially (I/O); full-length series are screened as a batch
+    batch: List[tuple[int, int]] = []  # (result position, batch column)
+    batch_closes: List[np.ndarray] = []
+    # A series returned for several symbols gets one column; the source
+    # object is kept here so its id cannot be reused during the call
+    columns: dict = {}
 
     for symbol in symbols:
         closes = get_closes_fn(symbol)
@@ -330,13 +487,70 @@ def screen_watchlist(
             ))
             continue
 
-        result = screen_symbol(symbol, market, closes)
-        all_results.append(result)
+        if len(closes) < 250:  # screen_symbol's default min_bars
+            all_results.append(screen_symbol(symbol, market, closes))
+            continue
+
+        seen = columns.get(id(closes))
+        if seen is None:
+            seen = columns[id(closes)] = (closes, len(batch_closes))
+            batch_closes.append(np.ascontiguousarray(closes, dtype=np.float64))
+        batch.append((len(all_results), seen[1]))
+        all_results.append(None)
+
+    if batch:
+        ema20_last, ema20_prev = _ema_tails(batch_closes, 20)
+        ema200_last, ema200_prev = _ema_tails(batch_closes, 200)
+
+        # Scores for the whole batch in one pass; only OK results use them
+        d0 = ema200_last - ema20_last
+        v = (ema20_last - ema20_prev) - (ema200_last - ema200_prev)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            days = np.where((d0 > 0) & (v > 0), np.ceil(d0 / v), np.nan)
+        scores = score_candidates(days, d0, v, ema200_last).tolist()
+
+        for pos, j in batch:
+            all_results[pos] = _screen_from_emas(
+                symbols[pos],
+                market,
+                float(batch_closes[j][-1]),
+                float(ema20_last[j]),
+                float(ema20_prev[j]),
+                float(ema200_last[j]),
+                float(ema200_prev[j]),
+                score=scores[j],
+            )
 
     # Keep only OK results as candidates
     candidates = [r for r in all_results if r.reason == "OK"]
 
+    if 0 < top_n < len(candidates):
+        return _top_candidates(candidates, top_n)
+
     # Sort by score desc, then days_to_cross asc
     candidates.sort(key=lambda r: (-r.score, r.days_to_cross if r.days_to_cross is not None else 999))
 
     return candidates[:top_n]
+
+
+def _top_candidates(candidates: List[ScreenResult], top_n: int) -> List[ScreenResult]:
+    """
+    First top_n of candidates in (score desc, days_to_cross asc) order.
+
+    Same result as a stable full sort, but only the top_n selected by
+    np.argpartition get sorted.
+    """
+    k = len(candidates)
+    scores = np.array([r.score for r in candidates], dtype=np.int64)
+    days = np.array(
+        [r.days_to_cross if r.days_to_cross is not None else 999 for r in candidates],
+        dtype=np.int64,
+    )
+
+    # One unique integer rank: score desc, then days asc, then input
+    # order (what the stable sort keeps for ties)
+    rank = ((scores.max() - scores) * (days.max() + 1) + days) * k + np.arange(k)
+
+    top = np.argpartition(rank, top_n - 1)[:top_n]
+    top = top[np.argsort(rank[top])]
+    return [candidates[i] for i in top.tolist()]
@@ -11,6 +11,16 @@ from enum import Enum
 from typing import List, Optional
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from ._njit import njit, prange, NUMBA_AVAILABLE
+
+# Ahead-of-time build of the kernels (python -m engine.core._kernels_aot)
+try:
+    from .kernels_native import pivot_masks as _pivot_masks_native
+    NATIVE_AVAILABLE = True
+except ImportError:
+    NATIVE_AVAILABLE = False
 
 
 class SwingType(Enum):
@@ -67,6 +77,10 @@ def find_pivot_swings(
     if len(high) != len(low):
         raise ValueError("high and low arrays must have same length")
 
+    # One conversion at the boundary; every path below reads these
+    high = np.ascontiguousarray(high, dtype=np.float64)
+    low = np.ascontiguousarray(low, dtype=np.float64)
+
     n = len(high)
     swings: List[Swing] = []
 
@@ -75,25 +89,84 @@ def find_pivot_swings(
     if n < min_bars:
         return swings
 
-    # Check each potential pivot point
-    for i in range(left_bars, n - right_bars):
-        # Check swing high
-        left_high_max = np.max(high[i - left_bars:i])
-        right_high_max = np.max(high[i + 1:i + right_bars + 1])
+    if NATIVE_AVAILABLE or NUMBA_AVAILABLE:
+        kernel = _pivot_masks_native if NATIVE_AVAILABLE else _pivot_masks_jit
+        is_high = np.zeros(n, dtype=np.bool_)
+        is_low = np.zeros(n, dtype=np.bool_)
+        kernel(high, low, left_bars, right_bars, is_high, is_low)
+    else:
+        is_high, is_low = _pivot_masks(high, low, left_bars, right_bars)
+
+    # Emit in index order, high before low on the same bar
+    high_values = high.tolist()
+    low_values = low.tolist()
+    for i in np.flatnonzero(is_high | is_low).tolist():
+        if is_high[i]:
+            swings.append(Swing(index=i, price=high_values[i], swing_type=SwingType.HIGH))
+        if is_low[i]:
+            swings.append(Swing(index=i, price=low_values[i], swing_type=SwingType.LOW))
 
-        if high[i] > left_high_max and high[i] > right_high_max:
-            swings.append(Swing(index=i, price=high[i], swing_type=SwingType.HIGH))
+    return swings
 
-        # Check swing low
-        left_low_min = np.min(low[i - left_bars:i])
-        right_low_min = np.min(low[i + 1:i + right_bars + 1])
 
-        if low[i] < left_low_min and low[i] < right_low_min:
-            swings.append(Swing(index=i, price=low[i], swing_type=SwingType.LOW))
+def _pivot_masks(
+    high: np.ndarray,
+    low: np.ndarray,
+    left_bars: int,
+    right_bars: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Per-bar pivot flags: is_high[i] / is_low[i] mark swing highs / lows.
 
-    # Sort by index
-    swings.sort(key=lambda s: s.index)
-    return swings
+    Each window of left_bars + 1 + right_bars bars is compared against its
+    centre bar in one pass; bars without a full window are never pivots.
+    """
+    n = len(high)
+    is_high = np.zeros(n, dtype=bool)
+    is_low = np.zeros(n, dtype=bool)
+
+    width = left_bars + 1 + right_bars
+    high_win = sliding_window_view(high, width)
+    low_win = sliding_window_view(low, width)
+
+    centre = slice(left_bars, n - right_bars)
+    high_c = high_win[:, left_bars]
+    low_c = low_win[:, left_bars]
+
+    high_left = high_win[:, :left_bars].max(axis=1, initial=-np.inf)
+    high_right = high_win[:, left_bars + 1:].max(axis=1, initial=-np.inf)
+    is_high[centre] = (high_c > high_left) & (high_c > high_right)
+
+    low_left = low_win[:, :left_bars].min(axis=1, initial=np.inf)
+    low_right = low_win[:, left_bars + 1:].min(axis=1, initial=np.inf)
+    is_low[centre] = (low_c < low_left) & (low_c < low_right)
+
+    return is_high, is_low
+
+
+@njit("void(f8[::1], f8[::1], i8, i8, b1[::1], b1[::1])", cache=True, parallel=True)
+def _pivot_masks_jit(high, low, left_bars, right_bars, is_high, is_low):
+    """Scalar-loop version of _pivot_masks, filling zeroed is_high/is_low."""
+    n = len(high)
+
+    # Each bar's test is independent, so the outer loop runs in parallel
+    for i in prange(left_bars, n - right_bars):
+        h = high[i]
+        lo = low[i]
+        pivot_high = True
+        pivot_low = True
+        for j in range(i - left_bars, i + right_bars + 1):
+            if j == i:
+                continue
+            # Negated compares so a NaN anywhere rejects the pivot
+            if not h > high[j]:
+                pivot_high = False
+            if not lo < low[j]:
+                pivot_low = False
+            if not pivot_high and not pivot_low:
+                break
+        is_high[i] = pivot_high
+        is_low[i] = pivot_low
 
 
 def detect_bos(
@@ -126,62 +199,80 @@ def detect_bos(
     if not swings:
         return []
 
-    n = len(close)
-    bos_events: List[BOS] = []
-
-    # Track last confirmed swing high and low
-    last_swing_high: Optional[Swing] = None
-    last_swing_low: Optional[Swing] = None
-
-    # Create a map of swing index to swing for quick lookup
-    swing_map = {s.index: s for s in swings}
-
-    for i in range(n):
-        # Update last confirmed swings if we've passed their confirmation point
-        # A swing at index j is confirmed after j + right_bars (2)
-        for swing in swings:
-            # Swing is confirmed once we're past index + right_bars
-            confirmation_index = swing.index + 2  # right_bars = 2
-            if i >= confirmation_index:
-                if swing.swing_type == SwingType.HIGH:
-                    if last_swing_high is None or swing.index > last_swing_high.index:
-                        last_swing_high = swing
-                elif swing.swing_type == SwingType.LOW:
-                    if last_swing_low is None or swing.index > last_swing_low.index:
-                        last_swing_low = swing
-
-        # Check for BOS
-        # Bullish BOS: close breaks above last swing high
-        if last_swing_high is not None and i > last_swing_high.index:
-            if close[i] > last_swing_high.price:
-                # Check we haven't already recorded this break
-                already_broken = any(
-                    b.broken_swing.index == last_swing_high.index
-                    for b in bos_events
-                )
-                if not already_broken:
-                    bos_events.append(BOS(
-                        index=i,
-                        direction=BOSDirection.BULLISH,
-                        broken_swing=last_swing_high,
-                        close_price=close[i],
-                    ))
-
-        # Bearish BOS: close breaks below last swing low
-        if last_swing_low is not None and i > last_swing_low.index:
-            if close[i] < last_swing_low.price:
-                # Check we haven't already recorded this break
-                already_broken = any(
-                    b.broken_swing.index == last_swing_low.index
-                    for b in bos_events
-                )
-                if not already_broken:
-                    bos_events.append(BOS(
-                        index=i,
-                        direction=BOSDirection.BEARISH,
-                        broken_swing=last_swing_low,
-                        close_price=close[i],
-                    ))
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    bars = np.arange(len(close))
+
+    bullish = _first_breaks(
+        [s for s in swings if s.swing_type == SwingType.HIGH], close, bars, bullish=True
+    )
+    bearish = _first_breaks(
+        [s for s in swings if s.swing_type == SwingType.LOW], close, bars, bullish=False
+    )
+
+    # A swing index can be broken only once across both directions; when a
+    # bar is both a swing high and a swing low, the earlier break wins
+    # (bullish on a tie, as it is checked first)
+    bull_at = {swing.index: i for i, swing in bullish}
+    bear_at = {swing.index: i for i, swing in bearish}
+    for idx in bull_at.keys() & bear_at.keys():
+        if bull_at[idx] <= bear_at[idx]:
+            bearish = [(i, s) for i, s in bearish if s.index != idx]
+        else:
+            bullish = [(i, s) for i, s in bullish if s.index != idx]
+
+    close_values = close.tolist()
+    bos_events: List[BOS] = [
+        BOS(index=i, direction=BOSDirection.BULLISH, broken_swing=swing,
+            close_price=close_values[i])
+        for i, swing in bullish
+    ] + [
+        BOS(index=i, direction=BOSDirection.BEARISH, broken_swing=swing,
+            close_price=close_values[i])
+        for i, swing in bearish
+    ]
 
     bos_events.sort(key=lambda b: b.index)
     return bos_events
+
+
+def _first_breaks(
+    swings: List[Swing],
+    close: np.ndarray,
+    bars: np.ndarray,
+    bullish: bool,
+) -> List[tuple[int, Swing]]:
+    """
+    First close beyond each swing while it is the last confirmed one.
+
+    The active swing at bar i is the latest swing confirmed by then
+    (index + 2 <= i, right_bars = 2). Active indices never decrease, so
+    each swing owns one contiguous run of bars and only the first break
+    in that run counts.
+
+    Returns:
+        (bar index, broken swing) pairs in bar order
+    """
+    if not swings:
+        return []
+
+    # One swing per index (the first listed), sorted by index
+    swing_idx, first = np.unique([s.index for s in swings], return_index=True)
+    prices = np.array([swings[k].price for k in first], dtype=np.float64)
+
+    # Swing is confirmed once we're past index + right_bars (2)
+    active = np.searchsorted(swing_idx, bars - 2, side="right") - 1
+    has_swing = active >= 0
+    level = prices[np.maximum(active, 0)]
+
+    broke = close > level if bullish else close < level
+    hit_bars = np.flatnonzero(broke & has_swing)
+    hit_swings = active[hit_bars]
+
+    # Keep the first hit of each active run
+    keep = np.ones(len(hit_bars), dtype=bool)
+    keep[1:] = hit_swings[1:] != hit_swings[:-1]
+
+    return [
+        (i, swings[first[k]])
+        for i, k in zip(hit_bars[keep].tolist(), hit_swings[keep].tolist())
+    ]
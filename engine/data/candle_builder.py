@@ -3,7 +3,7 @@ Build OHLC candles from tick data
 Aggregates real-time ticks into 1min/5min/15min/1h/1D candles
 """
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional, List
 import os
 import sys
@@ -276,29 +276,30 @@ class CandleBuilderService:
 
         while self.running:
             try:
-                now = datetime.utcnow()
+                now = datetime.now(timezone.utc)
+                minute, hour, second = now.minute, now.hour, now.second
 
                 # Build 1min candles every minute
                 self.builder.build_candles('1min')
 
                 # Build 5min candles every 5 minutes
-                if now.minute % 5 == 0:
+                if minute % 5 == 0:
                     self.builder.build_candles('5min')
 
                 # Build 15min candles every 15 minutes
-                if now.minute % 15 == 0:
+                if minute % 15 == 0:
                     self.builder.build_candles('15min')
 
                 # Build 1h candles every hour
-                if now.minute == 0:
+                if minute == 0:
                     self.builder.build_candles('1h')
 
                 # Build 1D candles at midnight UTC
-                if now.hour == 0 and now.minute == 0:
+                if hour == 0 and minute == 0:
                     self.builder.build_candles('1D')
 
                 # Sleep until next minute
-                sleep_seconds = 60 - now.second
+                sleep_seconds = 60 - second
                 time.sleep(sleep_seconds)
 
             except KeyboardInterrupt:
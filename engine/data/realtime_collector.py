@@ -8,7 +8,9 @@ DYNAMIC SYMBOL DISCOVERY:
 - Supports unlimited stocks
 """
 import time
+import asyncio
 import logging
+import threading
 from datetime import datetime, timezone
 from typing import List, Dict, Optional, Any
 import os
@@ -54,6 +56,10 @@ class RealtimeCollector:
         self.symbols_kr: List[str] = []
         self.symbols_us: List[str] = []
 
+        # Set whenever a tick is persisted; consumers (candle builder)
+        # clear it once they have processed the new ticks
+        self.tick_event = threading.Event()
+
     @property
     def kis_client(self):
         """Lazy-load KIS client"""
@@ -215,13 +221,15 @@ class RealtimeCollector:
         except Exception:
             return False
 
-    def start(self):
-        """Start continuous collection"""
+    def _startup(self):
+        """Open connections, load the initial symbols and log the banner"""
         self.running = True
         self.stats['start_time'] = datetime.now(timezone.utc)
 
-        # Initialize database
+        # Initialize database and KIS client up front so the first
+        # collection cycle is not charged for connection/token setup
         _ = self.db_conn
+        _ = self.kis_client
 
         # Initial symbol load
         self._refresh_symbols()
@@ -235,19 +243,27 @@ class RealtimeCollector:
         logger.info(f"⏱️  Interval: {self.interval} seconds")
         logger.info("=" * 60)
 
+    def _run_cycle(self, cycle_count: int):
+        """One collection pass; symbols are refreshed every 10 cycles"""
+        # Refresh symbols every 10 cycles (10 minutes) to pick up new ones
+        if cycle_count % 10 == 0:
+            self._refresh_symbols()
+            logger.info(f"🔄 Symbols refreshed: {len(self.symbols_kr)} KR + {len(self.symbols_us)} US")
+
+        self.collect_all()
+
+    def start(self):
+        """Start continuous collection"""
+        self._startup()
+
         cycle_count = 0
 
         while self.running:
             try:
                 start_time = time.time()
 
-                # Refresh symbols every 10 cycles (10 minutes) to pick up new ones
                 cycle_count += 1
-                if cycle_count % 10 == 0:
-                    self._refresh_symbols()
-                    logger.info(f"🔄 Symbols refreshed: {len(self.symbols_kr)} KR + {len(self.symbols_us)} US")
-
-                self.collect_all()
+                self._run_cycle(cycle_count)
                 elapsed = time.time() - start_time
 
                 # Sleep remaining time
@@ -265,6 +281,38 @@ class RealtimeCollector:
 
         self._shutdown()
 
+    async def run(self):
+        """
+        Continuous collection as an asyncio task
+
+        Same schedule as start(), for services that share one event loop.
+        Blocking DB/KIS work runs in worker threads; cancelling the task
+        stops the collector.
+        """
+        await asyncio.to_thread(self._startup)
+
+        cycle_count = 0
+
+        try:
+            while self.running:
+                try:
+                    start_time = time.time()
+
+                    cycle_count += 1
+                    await asyncio.to_thread(self._run_cycle, cycle_count)
+                    elapsed = time.time() - start_time
+
+                    # Sleep remaining time
+                    await asyncio.sleep(max(0, self.interval - elapsed))
+
+                except Exception as e:
+                    self.stats['errors'] += 1
+                    logger.error(f"❌ Collection error: {e}")
+                    await asyncio.sleep(5)
+        finally:
+            self.running = False
+            self._shutdown()
+
     def stop(self):
         """Stop the collector gracefully"""
         self.running = False
@@ -359,6 +407,7 @@ class RealtimeCollector:
                 is_extended
             ))
             cur.close()
+            self.tick_event.set()
         except Exception as e:
             logger.error(f"Database save error: {e}")
 
@@ -6,10 +6,14 @@ Converts results into the standard OHLCVData format with Unix-second timestamps.
 """
 
 import os
+import time
 import logging
+import threading
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import requests
 from dotenv import load_dotenv
 
@@ -23,6 +27,18 @@ ALPACA_API_KEY = os.getenv("ALPACA_API_KEY", "")
 ALPACA_API_SECRET = os.getenv("ALPACA_API_SECRET", "")
 ALPACA_DATA_URL = "https://data.alpaca.markets/v2"
 
+# Local cache of default-window downloads (one .npy file per request)
+CACHE_DIR = Path(__file__).resolve().parents[2] / "data" / "cache" / "us"
+
+# Seconds a cached download stays fresh, by Alpaca timeframe unit
+CACHE_TTL = {
+    "Min": 60,
+    "Hour": 300,
+    "Day": 3600,
+    "Week": 3600,
+    "Month": 3600,
+}
+
 # Timeframe mapping: our codes -> Alpaca API codes
 # CASE-SENSITIVE: 1m=minute, 1M=month
 TIMEFRAME_MAP = {
@@ -73,10 +89,12 @@ class AlpacaRepository(MarketDataRepository):
         self,
         api_key: Optional[str] = None,
         api_secret: Optional[str] = None,
+        cache_dir: Optional[Path] = CACHE_DIR,
     ):
         self.api_key = api_key or ALPACA_API_KEY
         self.api_secret = api_secret or ALPACA_API_SECRET
         self.base_url = ALPACA_DATA_URL
+        self.cache_dir = cache_dir  # None disables the .npy cache
 
     @property
     def is_configured(self) -> bool:
@@ -121,6 +139,19 @@ class AlpacaRepository(MarketDataRepository):
             logger.warning(f"[AlpacaRepo] Unsupported timeframe: {timeframe}")
             return self._empty()
 
+        # Default-window requests are served from the local cache while
+        # fresh (file named by Alpaca code: 1m and 1M differ only in case)
+        cache_path = None
+        if self.cache_dir is not None and start is None and end is None:
+            cache_path = self.cache_dir / f"{symbol.upper()}_{alpaca_tf}_{limit}.npy"
+            cached = self._read_cache(cache_path, alpaca_tf)
+            if cached is not None:
+                logger.info(
+                    f"[AlpacaRepo] {symbol} {timeframe}: "
+                    f"{len(cached)} bars from cache"
+                )
+                return cached
+
         # Calculate start date if not provided
         if start is None:
             days_back = DEFAULT_LOOKBACK.get(timeframe, 30)
@@ -174,6 +205,9 @@ class AlpacaRepository(MarketDataRepository):
             # Ensure ascending sort
             data = self._sort_ascending(data)
 
+            if cache_path is not None and not data.is_empty():
+                self._write_cache(cache_path, data)
+
             logger.info(
                 f"[AlpacaRepo] {symbol} {timeframe}: "
                 f"{len(data)} bars returned"
@@ -312,6 +346,36 @@ class AlpacaRepository(MarketDataRepository):
             logger.warning(f"[AlpacaRepo] Failed to parse timestamp: {ts_str}")
             return 0
 
+    @staticmethod
+    def _read_cache(path: Path, alpaca_tf: str) -> Optional[OHLCVData]:
+        """Load a cached download if it exists and is still fresh."""
+        ttl = next(
+            (sec for unit, sec in CACHE_TTL.items() if alpaca_tf.endswith(unit)), 0
+        )
+        try:
+            if time.time() - path.stat().st_mtime > ttl:
+                return None
+            # Memory-mapped: the columns are copied straight out of the page cache
+            return OHLCVData.from_records(np.load(path, mmap_mode="r"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"[AlpacaRepo] Unreadable cache file {path}: {e}")
+            return None
+
+    @staticmethod
+    def _write_cache(path: Path, data: OHLCVData) -> None:
+        """Save a download to the cache (atomic replace, failures only logged)."""
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "wb") as f:
+                np.save(f, data.to_records())
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"[AlpacaRepo] Could not write cache file {path}: {e}")
+            tmp.unlink(missing_ok=True)
+
     @staticmethod
     def _empty() -> OHLCVData:
         """Return empty OHLCVData."""
@@ -326,22 +390,9 @@ class AlpacaRepository(MarketDataRepository):
             return data
 
         # Check if already sorted
-        is_sorted = all(
-            data.timestamps[i] <= data.timestamps[i + 1]
-            for i in range(len(data.timestamps) - 1)
-        )
-        if is_sorted:
+        ts = data.array("timestamps")
+        if np.all(ts[:-1] <= ts[1:]):
             return data
 
-        # Sort by timestamp
-        indices = sorted(
-            range(len(data.timestamps)), key=lambda i: data.timestamps[i]
-        )
-        return OHLCVData(
-            timestamps=[data.timestamps[i] for i in indices],
-            open=[data.open[i] for i in indices],
-            high=[data.high[i] for i in indices],
-            low=[data.low[i] for i in indices],
-            close=[data.close[i] for i in indices],
-            volume=[data.volume[i] for i in indices],
-        )
+        # Stable sort by timestamp
+        return data.take(np.argsort(ts, kind="stable"))
@@ -1,27 +1,118 @@
-from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from datetime import datetime
 
+import numpy as np
+
 
-@dataclass
 class OHLCVData:
     """
     Standard data format returned by ALL repositories.
     No matter where the data comes from (KIS, Alpaca, PostgreSQL),
     it MUST be converted to this format before returning.
+
+    Columns are stored as contiguous NumPy arrays (int64 timestamps,
+    float64 prices and volume) so indicator code can use them without
+    another conversion; see array(). The list attributes (timestamps,
+    open, ...) are built on first access and must be treated as
+    read-only.
     """
-    timestamps: List[int]    # Unix seconds (int). Always. No exceptions.
-    open: List[float]
-    high: List[float]
-    low: List[float]
-    close: List[float]
-    volume: List[float]
+
+    FIELDS = ("timestamps", "open", "high", "low", "close", "volume")
+
+    # One-buffer layout for storage (e.g. np.save), in FIELDS order
+    RECORD_DTYPE = np.dtype([
+        ("ts", "i8"), ("o", "f8"), ("h", "f8"),
+        ("l", "f8"), ("c", "f8"), ("v", "f8"),
+    ])
+
+    __slots__ = ("_arrays", "_lists")
+
+    def __init__(
+        self,
+        timestamps: Sequence[int],    # Unix seconds (int). Always. No exceptions.
+        open: Sequence[float],
+        high: Sequence[float],
+        low: Sequence[float],
+        close: Sequence[float],
+        volume: Sequence[float],
+    ):
+        ts = np.asarray(timestamps)
+        # Reject floats/strings instead of silently flooring them
+        if ts.size and ts.dtype.kind not in "iu":
+            raise TypeError(f"timestamps must be int Unix seconds, got {ts.dtype}")
+        self._arrays = {
+            "timestamps": ts.astype(np.int64, copy=False),
+            "open": np.asarray(open, dtype=np.float64),
+            "high": np.asarray(high, dtype=np.float64),
+            "low": np.asarray(low, dtype=np.float64),
+            "close": np.asarray(close, dtype=np.float64),
+            "volume": np.asarray(volume, dtype=np.float64),
+        }
+        self._lists = {}
+
+    def array(self, field: str) -> np.ndarray:
+        """Column as a NumPy array (no copy)."""
+        return self._arrays[field]
+
+    def to_records(self) -> np.ndarray:
+        """All columns packed into one structured array (RECORD_DTYPE)."""
+        records = np.empty(len(self), dtype=self.RECORD_DTYPE)
+        for name, field in zip(self.RECORD_DTYPE.names, self.FIELDS):
+            records[name] = self._arrays[field]
+        return records
+
+    @classmethod
+    def from_records(cls, records: np.ndarray) -> "OHLCVData":
+        """Inverse of to_records(); columns are copied out contiguously."""
+        return cls(**{
+            field: np.ascontiguousarray(records[name])
+            for name, field in zip(cls.RECORD_DTYPE.names, cls.FIELDS)
+        })
+
+    def take(self, indices) -> "OHLCVData":
+        """New OHLCVData with the bars selected by an index array or mask."""
+        return OHLCVData(**{
+            field: arr[indices] for field, arr in self._arrays.items()
+        })
+
+    def _list(self, field: str) -> list:
+        values = self._lists.get(field)
+        if values is None:
+            values = self._lists[field] = self._arrays[field].tolist()
+        return values
+
+    @property
+    def timestamps(self) -> List[int]:
+        return self._list("timestamps")
+
+    @property
+    def open(self) -> List[float]:
+        return self._list("open")
+
+    @property
+    def high(self) -> List[float]:
+        return self._list("high")
+
+    @property
+    def low(self) -> List[float]:
+        return self._list("low")
+
+    @property
+    def close(self) -> List[float]:
+        return self._list("close")
+
+    @property
+    def volume(self) -> List[float]:
+        return self._list("volume")
 
     def __len__(self):
-        return len(self.timestamps)
+        return len(self._arrays["timestamps"])
+
+    def __repr__(self):
+        return f"OHLCVData({len(self)} bars)"
 
     def is_empty(self):
-        return len(self.timestamps) == 0
+        return len(self) == 0
 
 
 class MarketDataRepository:
@@ -10,6 +10,8 @@ from collections import OrderedDict
 from datetime import datetime
 from typing import Optional
 
+import numpy as np
+
 from engine.repositories.base import OHLCVData, MarketDataRepository
 from engine.data.kis_api import get_kis_client, KISAPIError
 
@@ -360,18 +362,11 @@ class KISRepository(MarketDataRepository):
         if data.is_empty():
             return data
 
-        valid_indices = [i for i, ts in enumerate(data.timestamps) if ts > 0]
-        if len(valid_indices) == len(data.timestamps):
+        valid = data.array("timestamps") > 0
+        if valid.all():
             return data  # All valid, no filtering needed
 
-        return OHLCVData(
-            timestamps=[data.timestamps[i] for i in valid_indices],
-            open=[data.open[i] for i in valid_indices],
-            high=[data.high[i] for i in valid_indices],
-            low=[data.low[i] for i in valid_indices],
-            close=[data.close[i] for i in valid_indices],
-            volume=[data.volume[i] for i in valid_indices],
-        )
+        return data.take(valid)
 
     @staticmethod
     def _sort_ascending(data: OHLCVData) -> OHLCVData:
@@ -380,20 +375,9 @@ class KISRepository(MarketDataRepository):
             return data
 
         # Check if already sorted
-        is_sorted = all(
-            data.timestamps[i] <= data.timestamps[i + 1]
-            for i in range(len(data.timestamps) - 1)
-        )
-        if is_sorted:
+        ts = data.array("timestamps")
+        if np.all(ts[:-1] <= ts[1:]):
             return data
 
-        # Sort by timestamp
-        indices = sorted(range(len(data.timestamps)), key=lambda i: data.timestamps[i])
-        return OHLCVData(
-            timestamps=[data.timestamps[i] for i in indices],
-            open=[data.open[i] for i in indices],
-            high=[data.high[i] for i in indices],
-            low=[data.low[i] for i in indices],
-            close=[data.close[i] for i in indices],
-            volume=[data.volume[i] for i in indices],
-        )
+        # Stable sort by timestamp
+        return data.take(np.argsort(ts, kind="stable"))
@@ -7,8 +7,10 @@ and calculates all technical indicators.
 This replaces the inline logic in app.py's /ohlcv endpoint.
 """
 
+import os
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 import numpy as np
@@ -30,6 +32,14 @@ from engine.indicators.keltner import calculate_keltner_channel, calculate_ttm_s
 
 logger = logging.getLogger(__name__)
 
+# Shared pool for the independent indicator groups in _calculate_indicators.
+# NumPy releases the GIL inside its kernels, so groups overlap on multi-core
+# hosts; the pool is bounded so concurrent requests cannot oversubscribe.
+_INDICATOR_POOL = ThreadPoolExecutor(
+    max_workers=min(4, os.cpu_count() or 1),
+    thread_name_prefix="indicators",
+)
+
 
 def _nan_to_val(arr: np.ndarray, default=0) -> List:
     """Convert numpy array to list, replacing NaN with a default value."""
@@ -137,17 +147,15 @@ class MarketDataService:
         if data.is_empty():
             return self._empty_response(symbol, market, timeframe, source)
 
-        # Build bars list (timestamps already Unix int from repositories)
-        bars = []
-        for i in range(len(data.timestamps)):
-            bars.append({
-                "time": data.timestamps[i],
-                "open": data.open[i],
-                "high": data.high[i],
-                "low": data.low[i],
-                "close": data.close[i],
-                "volume": data.volume[i],
-            })
+        # Build bars list (timestamps already Unix int from repositories);
+        # one zip over the columns instead of six indexed lookups per bar
+        bars = [
+            {"time": t, "open": o, "high": h, "low": l, "close": c, "volume": v}
+            for t, o, h, l, c, v in zip(
+                data.timestamps, data.open, data.high,
+                data.low, data.close, data.volume,
+            )
+        ]
 
         # Calculate indicators
         indicators = self._calculate_indicators(data, timeframe)
@@ -205,172 +213,225 @@ class MarketDataService:
 
         Concatenates, deduplicates by timestamp (today wins), sorts ascending.
         """
-        merged: dict = {}
+        # Today's bars go last so np.unique's first hit, taken on the
+        # reversed arrays, is today's bar for any duplicate timestamp
+        ts = np.concatenate([past.array("timestamps"), today.array("timestamps")])
+        _, last = np.unique(ts[::-1], return_index=True)
+        order = len(ts) - 1 - last  # ascending timestamp order
 
-        for i in range(len(past.timestamps)):
-            ts = past.timestamps[i]
-            merged[ts] = (
-                past.open[i], past.high[i], past.low[i],
-                past.close[i], past.volume[i],
-            )
-
-        # Today's data overwrites any duplicates from past
-        for i in range(len(today.timestamps)):
-            ts = today.timestamps[i]
-            merged[ts] = (
-                today.open[i], today.high[i], today.low[i],
-                today.close[i], today.volume[i],
-            )
-
-        sorted_ts = sorted(merged.keys())
-        return OHLCVData(
-            timestamps=sorted_ts,
-            open=[merged[ts][0] for ts in sorted_ts],
-            high=[merged[ts][1] for ts in sorted_ts],
-            low=[merged[ts][2] for ts in sorted_ts],
-            close=[merged[ts][3] for ts in sorted_ts],
-            volume=[merged[ts][4] for ts in sorted_ts],
-        )
+        return OHLCVData(**{
+            field: np.concatenate([past.array(field), today.array(field)])[order]
+            for field in OHLCVData.FIELDS
+        })
 
     def _calculate_indicators(self, data: OHLCVData, timeframe: str) -> dict:
         """
         Calculate all technical indicators from OHLCV data.
 
         Uses the same functions and parameters as app.py's /ohlcv endpoint.
+        The indicator groups are independent, so they run concurrently on
+        the shared indicator pool; only the TTM squeeze, which combines
+        BB2 and the Keltner Channel, is evaluated after they finish.
         """
         n = len(data.timestamps)
-        close = np.array(data.close, dtype=np.float64)
-        high = np.array(data.high, dtype=np.float64)
-        low = np.array(data.low, dtype=np.float64)
-        volume = np.array(data.volume, dtype=np.float64)
+        close = data.array("close")
+        high = data.array("high")
+        low = data.array("low")
+        volume = data.array("volume")
+
+        # Raw BB2 / KC arrays for the TTM squeeze (zeros mirror the
+        # fallback lists when the bands are not computed)
+        raw = {
+            "bb2_upper": np.zeros(n), "bb2_lower": np.zeros(n),
+            "kc_upper": None, "kc_lower": None,
+        }
 
+        # Indicators whose warm-up is longer than the series are all-NaN,
+        # so those branches emit the placeholder directly instead of
+        # computing and converting N NaNs (short intraday series).
+
+        def moving_averages() -> dict:
+            out = {}
+            # EMA (20, 200)
+            try:
+                out["ema20"] = _nan_to_none(ema(close, 20)) if n >= 20 else [None] * n
+                out["ema200"] = _nan_to_none(ema(close, 200)) if n >= 200 else [None] * n
+            except Exception as e:
+                logger.warning(f"EMA calculation failed: {e}")
+                out["ema20"] = [None] * n
+                out["ema200"] = [None] * n
+
+            # SMA (20, 200)
+            try:
+                out["sma20"] = _nan_to_none(_sma(close, 20)) if n >= 20 else [None] * n
+                out["sma200"] = _nan_to_none(_sma(close, 200)) if n >= 200 else [None] * n
+            except Exception as e:
+                logger.warning(f"SMA calculation failed: {e}")
+                out["sma20"] = [None] * n
+                out["sma200"] = [None] * n
+            return out
+
+        def oscillators() -> dict:
+            out = {}
+            # RSI (14) + Signal(9)
+            try:
+                rsi_values = rsi(close, 14)
+                rsi_signal_values = _sma(rsi_values, 9)
+                out["rsi"] = _nan_to_val(rsi_values, 50)
+                out["rsi_signal"] = _nan_to_val(rsi_signal_values, 50)
+            except Exception as e:
+                logger.warning(f"RSI calculation failed: {e}")
+                out["rsi"] = [50] * n
+                out["rsi_signal"] = [50] * n
+
+            # MACD (12, 26, 9)
+            try:
+                if n >= 26:
+                    ml, ms, mh = macd(close, 12, 26, 9)
+                    out["macd_line"] = _nan_to_val(ml, 0)
+                    out["macd_signal"] = _nan_to_val(ms, 0)
+                    out["macd_hist"] = _nan_to_val(mh, 0)
+                else:
+                    out["macd_line"] = [0] * n
+                    out["macd_signal"] = [0] * n
+                    out["macd_hist"] = [0] * n
+            except Exception as e:
+                logger.warning(f"MACD calculation failed: {e}")
+                out["macd_line"] = [0] * n
+                out["macd_signal"] = [0] * n
+                out["macd_hist"] = [0] * n
+            return out
+
+        def stochastics() -> dict:
+            out = {}
+            # Stochastic: Slow (20,12,12), Med (10,6,6), Fast (5,3,3)
+            try:
+                for name, fastk, slowk, slowd in (
+                    ("slow", 20, 12, 12),
+                    ("med", 10, 6, 6),
+                    ("fast", 5, 3, 3),
+                ):
+                    # Slow %K needs fastk + slowk - 1 bars before its first value
+                    if n >= fastk + slowk - 1:
+                        k, d = _stochastic(high, low, close, fastk, slowk, slowd)
+                        out[f"stoch_{name}_k"] = _nan_to_val(k, 50)
+                        out[f"stoch_{name}_d"] = _nan_to_val(d, 50)
+                    else:
+                        out[f"stoch_{name}_k"] = [50] * n
+                        out[f"stoch_{name}_d"] = [50] * n
+            except Exception as e:
+                logger.warning(f"Stochastic calculation failed: {e}")
+                for k in ("stoch_slow_k", "stoch_slow_d", "stoch_med_k",
+                           "stoch_med_d", "stoch_fast_k", "stoch_fast_d"):
+                    out[k] = [50] * n
+            return out
+
+        def bollinger() -> dict:
+            out = {}
+            # Bollinger Bands: BB1 (20,0.5), BB2 (20,3.0)
+            try:
+                if n >= 20:
+                    b1u, b1m, b1l = calculate_bb1(close)
+                    out["bb1_upper"] = _nan_to_val(b1u, 0)
+                    out["bb1_lower"] = _nan_to_val(b1l, 0)
+
+                    b2u, b2m, b2l = calculate_bb2(close)
+                    raw["bb2_upper"], raw["bb2_lower"] = b2u, b2l
+                    out["bb2_upper"] = _nan_to_val(b2u, 0)
+                    out["bb2_lower"] = _nan_to_val(b2l, 0)
+                else:
+                    for k in ("bb1_upper", "bb1_lower", "bb2_upper", "bb2_lower"):
+                        out[k] = [0] * n
+            except Exception as e:
+                logger.warning(f"BB calculation failed: {e}")
+                out["bb1_upper"] = [0] * n
+                out["bb1_lower"] = [0] * n
+                out["bb2_upper"] = [0] * n
+                out["bb2_lower"] = [0] * n
+            return out
+
+        def rsi_bands() -> dict:
+            out = {}
+            # RSI with Bollinger Band (14, 30, 2.0) — for subchart
+            try:
+                # First band value needs 14 RSI warm-up bars + a 30-bar window
+                if n >= 14 + 30:
+                    _, rsi_bb_u, rsi_bb_m, rsi_bb_l = calculate_rsi_with_bb(
+                        close, rsi_period=14, bb_length=30, bb_std_dev=2.0
+                    )
+                    out["rsi_bb_upper"] = _nan_to_val(rsi_bb_u, 50)
+                    out["rsi_bb_lower"] = _nan_to_val(rsi_bb_l, 50)
+                else:
+                    out["rsi_bb_upper"] = [50] * n
+                    out["rsi_bb_lower"] = [50] * n
+            except Exception as e:
+                logger.warning(f"RSI BB calculation failed: {e}")
+                out["rsi_bb_upper"] = [50] * n
+                out["rsi_bb_lower"] = [50] * n
+            return out
+
+        def vwap() -> dict:
+            # VWAP (intraday only)
+            try:
+                # VWAP expects timestamps as list (str or int)
+                vwap_values = calculate_vwap(
+                    timestamps=[str(t) for t in data.timestamps],
+                    high=high,
+                    low=low,
+                    close=close,
+                    volume=volume,
+                    timeframe=timeframe,
+                )
+                return {"vwap": _nan_to_val(vwap_values, 0)}
+            except Exception as e:
+                logger.warning(f"VWAP calculation failed: {e}")
+                return {"vwap": [0] * n}
+
+        def keltner() -> dict:
+            # Keltner Channel
+            try:
+                kc_u, kc_m, kc_l = calculate_keltner_channel(
+                    high=high, low=low, close=close,
+                    ema_period=20, atr_period=10, multiplier=1.5,
+                )
+                raw["kc_upper"], raw["kc_lower"] = kc_u, kc_l
+                return {
+                    "kc_upper": _nan_to_val(kc_u, 0),
+                    "kc_lower": _nan_to_val(kc_l, 0),
+                }
+            except Exception as e:
+                logger.warning(f"KC calculation failed: {e}")
+                return {"kc_upper": [0] * n, "kc_lower": [0] * n}
+
+        groups = (moving_averages, oscillators, stochastics,
+                  bollinger, rsi_bands, vwap, keltner)
+        futures = [_INDICATOR_POOL.submit(group) for group in groups]
+
+        # Merge in submission order so the response key order is stable
         result = {}
+        for future in futures:
+            result.update(future.result())
 
-        # EMA (20, 200)
-        try:
-            result["ema20"] = _nan_to_none(ema(close, 20))
-            result["ema200"] = _nan_to_none(ema(close, 200))
-        except Exception as e:
-            logger.warning(f"EMA calculation failed: {e}")
-            result["ema20"] = [None] * n
-            result["ema200"] = [None] * n
-
-        # SMA (20, 200)
-        try:
-            result["sma20"] = _nan_to_none(_sma(close, 20))
-            result["sma200"] = _nan_to_none(_sma(close, 200))
-        except Exception as e:
-            logger.warning(f"SMA calculation failed: {e}")
-            result["sma20"] = [None] * n
-            result["sma200"] = [None] * n
+        # TTM Squeeze (BB2 inside KC); a KC failure was already logged
+        # by keltner(), which also zeroed the KC outputs
+        if raw["kc_upper"] is None:
+            result["squeeze"] = [0] * n
+            return result
 
-        # RSI (14) + Signal(9)
         try:
-            rsi_values = rsi(close, 14)
-            rsi_signal_values = _sma(rsi_values, 9)
-            result["rsi"] = _nan_to_val(rsi_values, 50)
-            result["rsi_signal"] = _nan_to_val(rsi_signal_values, 50)
-        except Exception as e:
-            logger.warning(f"RSI calculation failed: {e}")
-            result["rsi"] = [50] * n
-            result["rsi_signal"] = [50] * n
-
-        # MACD (12, 26, 9)
-        try:
-            ml, ms, mh = macd(close, 12, 26, 9)
-            result["macd_line"] = _nan_to_val(ml, 0)
-            result["macd_signal"] = _nan_to_val(ms, 0)
-            result["macd_hist"] = _nan_to_val(mh, 0)
-        except Exception as e:
-            logger.warning(f"MACD calculation failed: {e}")
-            result["macd_line"] = [0] * n
-            result["macd_signal"] = [0] * n
-            result["macd_hist"] = [0] * n
-
-        # Stochastic: Slow (20,12,12), Med (10,6,6), Fast (5,3,3)
-        try:
-            sk, sd = _stochastic(high, low, close, 20, 12, 12)
-            result["stoch_slow_k"] = _nan_to_val(sk, 50)
-            result["stoch_slow_d"] = _nan_to_val(sd, 50)
-
-            mk, md = _stochastic(high, low, close, 10, 6, 6)
-            result["stoch_med_k"] = _nan_to_val(mk, 50)
-            result["stoch_med_d"] = _nan_to_val(md, 50)
-
-            fk, fd = _stochastic(high, low, close, 5, 3, 3)
-            result["stoch_fast_k"] = _nan_to_val(fk, 50)
-            result["stoch_fast_d"] = _nan_to_val(fd, 50)
-        except Exception as e:
-            logger.warning(f"Stochastic calculation failed: {e}")
-            for k in ("stoch_slow_k", "stoch_slow_d", "stoch_med_k",
-                       "stoch_med_d", "stoch_fast_k", "stoch_fast_d"):
-                result[k] = [50] * n
-
-        # Bollinger Bands: BB1 (20,0.5), BB2 (20,3.0)
-        try:
-            b1u, b1m, b1l = calculate_bb1(close)
-            result["bb1_upper"] = _nan_to_val(b1u, 0)
-            result["bb1_lower"] = _nan_to_val(b1l, 0)
-
-            b2u, b2m, b2l = calculate_bb2(close)
-            result["bb2_upper"] = _nan_to_val(b2u, 0)
-            result["bb2_lower"] = _nan_to_val(b2l, 0)
-        except Exception as e:
-            logger.warning(f"BB calculation failed: {e}")
-            result["bb1_upper"] = [0] * n
-            result["bb1_lower"] = [0] * n
-            result["bb2_upper"] = [0] * n
-            result["bb2_lower"] = [0] * n
-
-        # RSI with Bollinger Band (14, 30, 2.0) — for subchart
-        try:
-            _, rsi_bb_u, rsi_bb_m, rsi_bb_l = calculate_rsi_with_bb(
-                close, rsi_period=14, bb_length=30, bb_std_dev=2.0
-            )
-            result["rsi_bb_upper"] = _nan_to_val(rsi_bb_u, 50)
-            result["rsi_bb_lower"] = _nan_to_val(rsi_bb_l, 50)
-        except Exception as e:
-            logger.warning(f"RSI BB calculation failed: {e}")
-            result["rsi_bb_upper"] = [50] * n
-            result["rsi_bb_lower"] = [50] * n
-
-        # VWAP (intraday only)
-        try:
-            # VWAP expects timestamps as list (str or int)
-            vwap_values = calculate_vwap(
-                timestamps=[str(t) for t in data.timestamps],
-                high=high,
-                low=low,
-                close=close,
-                volume=volume,
-                timeframe=timeframe,
-            )
-            result["vwap"] = _nan_to_val(vwap_values, 0)
-        except Exception as e:
-            logger.warning(f"VWAP calculation failed: {e}")
-            result["vwap"] = [0] * n
-
-        # Keltner Channel + TTM Squeeze
-        try:
-            kc_u, kc_m, kc_l = calculate_keltner_channel(
-                high=high, low=low, close=close,
-                ema_period=20, atr_period=10, multiplier=1.5,
-            )
-            result["kc_upper"] = _nan_to_val(kc_u, 0)
-            result["kc_lower"] = _nan_to_val(kc_l, 0)
-
             squeeze = calculate_ttm_squeeze(
-                bb_upper=np.array(result["bb2_upper"]),
-                bb_lower=np.array(result["bb2_lower"]),
-                kc_upper=kc_u,
-                kc_lower=kc_l,
+                bb_upper=raw["bb2_upper"],
+                bb_lower=raw["bb2_lower"],
+                kc_upper=raw["kc_upper"],
+                kc_lower=raw["kc_lower"],
             )
-            result["squeeze"] = [bool(v) for v in squeeze]
+            # 0/1 ints in one C-level cast instead of N bool() calls
+            result["squeeze"] = squeeze.astype(np.uint8).tolist()
         except Exception as e:
             logger.warning(f"KC/Squeeze calculation failed: {e}")
             result["kc_upper"] = [0] * n
             result["kc_lower"] = [0] * n
-            result["squeeze"] = [False] * n
+            result["squeeze"] = [0] * n
 
         return result
 
@@ -2,5 +2,6 @@
 from .order_manager import OrderManager
 from .strategy import TradingStrategy
 from .bot import TradingBot
+from .log import start_trading_log
 
-__all__ = ['OrderManager', 'TradingStrategy', 'TradingBot']
+__all__ = ['OrderManager', 'TradingStrategy', 'TradingBot', 'start_trading_log']
@@ -2,6 +2,7 @@
 Trading Bot - Main orchestrator for automated trading
 """
 import asyncio
+import logging
 from datetime import datetime
 from typing import List, Dict, Optional
 import requests
@@ -9,6 +10,8 @@ import requests
 from engine.trading.order_manager import OrderManager
 from engine.trading.strategy import TradingStrategy
 
+logger = logging.getLogger(__name__)
+
 
 class TradingBot:
     """
@@ -17,14 +20,16 @@ class TradingBot:
     Monitors signals and executes trades based on SMC strategy
     """
 
-    def __init__(self, use_real_account: bool = False):
+    def __init__(self, use_real_account: bool = False, trade_log_path: Optional[str] = None):
         self.om = OrderManager(use_real_account=use_real_account)
-        self.strategy = TradingStrategy(self.om)
+        self.strategy = TradingStrategy(self.om, trade_log_path=trade_log_path)
 
         self.running = False
         self.check_interval_seconds = 300  # Default 5 minutes
 
         self.api_base_url = "http://localhost:8000"
+        # Shared session keeps the connection to the API alive between polls
+        self._session = requests.Session()
 
         # Statistics
         self.last_check_time: Optional[datetime] = None
@@ -34,7 +39,7 @@ class TradingBot:
     def set_check_interval(self, minutes: int):
         """Set check interval in minutes"""
         self.check_interval_seconds = max(minutes * 60, 30)  # Minimum 30 seconds
-        print(f"[Bot] Check interval: {minutes} min")
+        logger.info(f"[Bot] Check interval: {minutes} min")
 
     def set_strategy_params(
         self,
@@ -53,21 +58,21 @@ class TradingBot:
         """Set entry mode: MARKET or LIMIT"""
         self.strategy.entry_mode = mode.upper()
         self.strategy.limit_price = limit_price
-        print(f"[Bot] Entry mode: {mode}" + (f" @ {limit_price:,.0f}" if mode == 'LIMIT' else ""))
+        logger.info(f"[Bot] Entry mode: {mode}" + (f" @ {limit_price:,.0f}" if mode == 'LIMIT' else ""))
 
     async def start(self):
         """Start the bot"""
 
-        print("=" * 60)
-        print("TRADING BOT STARTING")
-        print("=" * 60)
-        print(f"Mode: {'REAL' if self.om.use_real else 'PAPER TRADING'}")
-        print(f"Entry: {self.strategy.entry_mode}" + (f" @ {self.strategy.limit_price:,.0f}" if self.strategy.entry_mode == 'LIMIT' else ""))
-        print(f"Interval: {self.check_interval_seconds}s")
-        print(f"Symbols: {[s['symbol'] for s in self.strategy.get_symbols()]}")
-        print(f"Stop Loss: {self.strategy.stop_loss_pct}%")
-        print(f"Take Profit: {self.strategy.take_profit_pct}%")
-        print("=" * 60)
+        logger.info("=" * 60)
+        logger.info("TRADING BOT STARTING")
+        logger.info("=" * 60)
+        logger.info(f"Mode: {'REAL' if self.om.use_real else 'PAPER TRADING'}")
+        logger.info(f"Entry: {self.strategy.entry_mode}" + (f" @ {self.strategy.limit_price:,.0f}" if self.strategy.entry_mode == 'LIMIT' else ""))
+        logger.info(f"Interval: {self.check_interval_seconds}s")
+        logger.info(f"Symbols: {[s['symbol'] for s in self.strategy.get_symbols()]}")
+        logger.info(f"Stop Loss: {self.strategy.stop_loss_pct}%")
+        logger.info(f"Take Profit: {self.strategy.take_profit_pct}%")
+        logger.info("=" * 60)
 
         self.strategy.start()
         self.running = True
@@ -77,7 +82,7 @@ class TradingBot:
                 self.check_count += 1
                 self.last_check_time = datetime.now()
 
-                print(f"\n[Bot] Check #{self.check_count} at {self.last_check_time.strftime('%H:%M:%S')}")
+                logger.info(f"[Bot] Check #{self.check_count} at {self.last_check_time.strftime('%H:%M:%S')}")
 
                 await self.check_signals()
                 await self.manage_positions()
@@ -85,10 +90,10 @@ class TradingBot:
                 await asyncio.sleep(self.check_interval_seconds)
 
             except asyncio.CancelledError:
-                print("[Bot] Task cancelled")
+                logger.info("[Bot] Task cancelled")
                 break
             except Exception as e:
-                print(f"[Bot] Error: {e}")
+                logger.error(f"[Bot] Error: {e}")
                 await asyncio.sleep(5)
 
     async def check_signals(self):
@@ -102,7 +107,7 @@ class TradingBot:
 
             try:
                 # Get analysis from API
-                response = requests.get(
+                response = self._session.get(
                     f"{self.api_base_url}/analyze",
                     params={
                         'symbol': symbol,
@@ -125,51 +130,56 @@ class TradingBot:
                 # Check entry signal
                 if self.strategy.check_entry_signal(symbol, market, analysis):
                     self.signal_count += 1
-                    print(f"\n[ENTRY SIGNAL] {symbol} ({market})")
+                    logger.info(f"[ENTRY SIGNAL] {symbol} ({market})")
                     self.strategy.execute_entry(symbol, market, analysis, current_price)
 
             except requests.exceptions.Timeout:
-                print(f"[Bot] Timeout checking {symbol}")
+                logger.warning(f"[Bot] Timeout checking {symbol}")
             except Exception as e:
-                print(f"[Bot] Error checking {symbol}: {e}")
+                logger.warning(f"[Bot] Error checking {symbol}: {e}")
 
     async def manage_positions(self):
         """Manage existing positions and pending orders"""
 
         # Check pending limit orders first
         pending = self.strategy.get_pending_orders()
+        prices = self.om._get_current_prices({
+            symbol: order.get('market', 'KR') for symbol, order in pending.items()
+        })
         for symbol, order in pending.items():
-            market = order.get('market', 'KR')
             try:
-                current_price = self.om._get_current_price(symbol, market)
-                self.strategy.check_pending_orders(symbol, current_price)
+                self.strategy.check_pending_orders(symbol, prices[symbol])
             except Exception as e:
-                print(f"[Bot] Error checking pending {symbol}: {e}")
+                logger.warning(f"[Bot] Error checking pending {symbol}: {e}")
 
         # Check existing positions for exit signals
         positions = self.om.get_all_positions()
+        prices = self.om._get_current_prices({
+            symbol: position.get('market', 'KR')
+            for symbol, position in positions.items()
+        })
 
-        for symbol, position in positions.items():
-            market = position.get('market', 'KR')
-
-            try:
-                current_price = self.om._get_current_price(symbol, market)
+        try:
+            exits = self.strategy.check_exit_signals(prices)
+        except Exception as e:
+            logger.warning(f"[Bot] Error checking exits: {e}")
+            return
 
-                # Check exit signal
-                exit_reason = self.strategy.check_exit_signal(symbol, current_price)
+        for symbol, exit_reason in exits.items():
+            market = positions[symbol].get('market', 'KR')
 
-                if exit_reason:
-                    print(f"\n[EXIT SIGNAL] {symbol}: {exit_reason}")
-                    self.strategy.execute_exit(symbol, market, exit_reason)
+            try:
+                logger.info(f"[EXIT SIGNAL] {symbol}: {exit_reason}")
+                self.strategy.execute_exit(symbol, market, exit_reason)
 
             except Exception as e:
-                print(f"[Bot] Error managing {symbol}: {e}")
+                logger.warning(f"[Bot] Error managing {symbol}: {e}")
 
     def stop(self):
         """Stop the bot"""
         self.running = False
         self.strategy.stop()
-        print("\n[Bot] Stopped")
+        logger.info("[Bot] Stopped")
 
     def get_status(self) -> Dict:
         """Get bot status"""
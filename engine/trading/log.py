@@ -0,0 +1,40 @@
+"""
+Trading Log - Queue-backed logging for the trading loop
+
+The bot runs inside the API's event loop, so its log output is handed to
+a QueueHandler and written to stdout by a QueueListener thread instead of
+blocking the loop on stdio.
+"""
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+_listener: Optional[QueueListener] = None
+
+
+def start_trading_log(level: int = logging.INFO) -> QueueListener:
+    """
+    Route engine.trading logs through a background listener
+
+    Safe to call more than once; the listener is only started the first time.
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    log_queue: queue.Queue = queue.Queue(-1)
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    trading_logger = logging.getLogger("engine.trading")
+    trading_logger.addHandler(QueueHandler(log_queue))
+    trading_logger.setLevel(level)
+
+    _listener = QueueListener(log_queue, handler)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    return _listener
@@ -2,9 +2,17 @@
 Order Manager - Handles buy/sell orders
 """
 import os
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, Dict, List
 
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
 class OrderManager:
     """
     Manages trading orders via KIS API
@@ -12,14 +20,35 @@ class OrderManager:
     SAFETY: Uses MOCK account by default (paper trading)
     """
 
+    # Max concurrent KIS quote requests in _get_current_prices
+    MAX_PRICE_WORKERS = 8
+
+    # Seconds a fetched quote is reused, so the signal and position passes
+    # of one bot tick share a single KIS lookup per symbol
+    PRICE_CACHE_TTL = 3.0
+
+    # Capacity step for the position arrays
+    POSITION_CHUNK = 64
+
     def __init__(self, use_real_account: bool = False):
         self.use_real = use_real_account
 
         self.orders: List[Dict] = []
         self.positions: Dict[str, Dict] = {}
 
+        # Structure-of-arrays mirror of self.positions for vectorized exit
+        # checks; slots [0, pos_len) are live and kept dense by swap-remove
+        self._pos_index: Dict[str, int] = {}
+        self.pos_symbols = np.empty(self.POSITION_CHUNK, dtype=object)
+        self.pos_avg = np.zeros(self.POSITION_CHUNK, dtype=np.float64)
+        self.pos_qty = np.zeros(self.POSITION_CHUNK, dtype=np.float64)
+        self.pos_len = 0
+
+        # (symbol, market) -> (price, expires_at monotonic)
+        self._price_cache: Dict[tuple, tuple] = {}
+
         mode = "REAL ACCOUNT" if self.use_real else "PAPER TRADING"
-        print(f"[OrderManager] Initialized: {mode}")
+        logger.info(f"[OrderManager] Initialized: {mode}")
 
     def buy_market(
         self,
@@ -33,9 +62,10 @@ class OrderManager:
         current_price = self._get_current_price(symbol, market)
 
         if not self.use_real:
-            # Mock order
+            # Mock order (one clock read serves both ID and timestamp)
+            now_ns = time.time_ns()
             order = {
-                'order_id': f"MOCK_{int(datetime.now().timestamp() * 1000)}",
+                'order_id': f"MOCK_{now_ns // 1_000_000}",
                 'symbol': symbol,
                 'market': market,
                 'quantity': quantity,
@@ -44,11 +74,11 @@ class OrderManager:
                 'status': 'FILLED',
                 'filled_price': current_price,
                 'filled_quantity': quantity,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': datetime.fromtimestamp(now_ns / 1e9).isoformat(),
                 'reason': reason,
                 'is_mock': True
             }
-            print(f"[MOCK BUY] {symbol} x{quantity} @ {current_price:,.0f}")
+            logger.info(f"[MOCK BUY] {symbol} x{quantity} @ {current_price:,.0f}")
         else:
             # Real order via KIS API
             try:
@@ -67,7 +97,7 @@ class OrderManager:
                     'is_mock': False
                 }
             except Exception as e:
-                print(f"[ERROR] Real order failed: {e}")
+                logger.error(f"[ERROR] Real order failed: {e}")
                 return {'error': str(e)}
 
         self.orders.append(order)
@@ -87,8 +117,9 @@ class OrderManager:
         current_price = self._get_current_price(symbol, market)
 
         if not self.use_real:
+            now_ns = time.time_ns()
             order = {
-                'order_id': f"MOCK_{int(datetime.now().timestamp() * 1000)}",
+                'order_id': f"MOCK_{now_ns // 1_000_000}",
                 'symbol': symbol,
                 'market': market,
                 'quantity': quantity,
@@ -97,11 +128,11 @@ class OrderManager:
                 'status': 'FILLED',
                 'filled_price': current_price,
                 'filled_quantity': quantity,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': datetime.fromtimestamp(now_ns / 1e9).isoformat(),
                 'reason': reason,
                 'is_mock': True
             }
-            print(f"[MOCK SELL] {symbol} x{quantity} @ {current_price:,.0f}")
+            logger.info(f"[MOCK SELL] {symbol} x{quantity} @ {current_price:,.0f}")
         else:
             # Real order
             order = {
@@ -122,7 +153,13 @@ class OrderManager:
         return order
 
     def _get_current_price(self, symbol: str, market: str = "KR") -> float:
-        """Get current price from KIS API"""
+        """Get current price from KIS API (cached for PRICE_CACHE_TTL seconds)"""
+        key = (symbol, market)
+        now = time.monotonic()
+        cached = self._price_cache.get(key)
+        if cached and now < cached[1]:
+            return cached[0]
+
         try:
             from engine.data.kis_api import get_kis_client
             client = get_kis_client()
@@ -131,13 +168,38 @@ class OrderManager:
                 if price_data:
                     for field in ["current_price", "stck_prpr", "close", "price"]:
                         if field in price_data:
-                            return float(price_data[field])
+                            price = float(price_data[field])
+                            self._price_cache[key] = (price, now + self.PRICE_CACHE_TTL)
+                            return price
         except Exception as e:
-            print(f"[OrderManager] Price fetch error: {e}")
+            logger.warning(f"[OrderManager] Price fetch error: {e}")
 
         # Fallback price
         return 50000.0 if market == "KR" else 100.0
 
+    def _get_current_prices(self, symbols: Dict[str, str]) -> Dict[str, float]:
+        """
+        Get current prices for several symbols at once
+
+        KIS has no multi-symbol quote endpoint, so the single-symbol
+        lookups run concurrently instead of one round-trip after another.
+
+        Args:
+            symbols: symbol -> market
+
+        Returns:
+            symbol -> current price
+        """
+        if len(symbols) <= 1:
+            return {s: self._get_current_price(s, m) for s, m in symbols.items()}
+
+        workers = min(len(symbols), self.MAX_PRICE_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            prices = executor.map(
+                lambda item: self._get_current_price(*item), symbols.items()
+            )
+            return dict(zip(symbols, prices))
+
     def _update_position(self, order: Dict):
         """Update position tracking"""
         symbol = order['symbol']
@@ -168,6 +230,43 @@ class OrderManager:
                 if self.positions[symbol]['quantity'] <= 0:
                     del self.positions[symbol]
 
+        self._sync_position_arrays(symbol)
+
+    def _sync_position_arrays(self, symbol: str):
+        """Mirror self.positions[symbol] into the position arrays"""
+        pos = self.positions.get(symbol)
+        idx = self._pos_index.get(symbol)
+
+        if pos is None:
+            if idx is None:
+                return
+            # Swap-remove: move the last live slot into the freed one
+            last = self.pos_len - 1
+            if idx != last:
+                moved = self.pos_symbols[last]
+                self.pos_symbols[idx] = moved
+                self.pos_avg[idx] = self.pos_avg[last]
+                self.pos_qty[idx] = self.pos_qty[last]
+                self._pos_index[moved] = idx
+            self.pos_symbols[last] = None
+            del self._pos_index[symbol]
+            self.pos_len = last
+            return
+
+        if idx is None:
+            if self.pos_len == len(self.pos_avg):
+                size = self.pos_len + self.POSITION_CHUNK
+                self.pos_symbols = np.resize(self.pos_symbols, size)
+                self.pos_avg = np.resize(self.pos_avg, size)
+                self.pos_qty = np.resize(self.pos_qty, size)
+            idx = self.pos_len
+            self._pos_index[symbol] = idx
+            self.pos_symbols[idx] = symbol
+            self.pos_len += 1
+
+        self.pos_avg[idx] = pos['avg_price']
+        self.pos_qty[idx] = pos['quantity']
+
     def get_position(self, symbol: str) -> Optional[Dict]:
         """Get current position"""
         return self.positions.get(symbol)
@@ -182,10 +281,11 @@ class OrderManager:
 
     def get_total_pnl(self) -> float:
         """Calculate total P&L"""
-        total = 0.0
-        for symbol, pos in self.positions.items():
-            market = pos.get('market', 'KR')
-            current_price = self._get_current_price(symbol, market)
-            pnl = (current_price - pos['avg_price']) * pos['quantity']
-            total += pnl
-        return total
+        prices = self._get_current_prices({
+            symbol: pos.get('market', 'KR')
+            for symbol, pos in self.positions.items()
+        })
+        return sum(
+            (prices[symbol] - pos['avg_price']) * pos['quantity']
+            for symbol, pos in self.positions.items()
+        )
@@ -1,9 +1,96 @@
 """
 Trading Strategy - Entry/Exit logic based on SMC + AI
 """
-from typing import Dict, Optional, List
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field, fields
+from itertools import islice
+from typing import Deque, Dict, Optional, List
 from datetime import datetime
 
+import numpy as np
+
+from engine.trading.trade_writer import TradeWriter
+
+logger = logging.getLogger(__name__)
+
+
+def _iso(timestamp_ns: int) -> str:
+    """Format a time.time_ns() value as a local ISO timestamp"""
+    return datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
+
+
+# Exit codes returned by _exit_codes
+_EXIT_REASONS = {1: 'STOP_LOSS', 2: 'TAKE_PROFIT'}
+
+
+def _exit_codes(
+    prices: np.ndarray,
+    avg_prices: np.ndarray,
+    stop_loss_pct: float,
+    take_profit_pct: float,
+) -> np.ndarray:
+    """
+    Vectorized stop-loss / take-profit check over many positions
+
+    Returns int8 codes: 0 = hold, 1 = stop loss, 2 = take profit.
+    Positions with avg_price <= 0 always hold.
+    """
+    valid = avg_prices > 0
+    pnl_pct = np.divide(
+        prices - avg_prices, avg_prices,
+        out=np.zeros_like(prices), where=valid,
+    ) * 100
+
+    codes = np.zeros(len(prices), dtype=np.int8)
+    codes[valid & (pnl_pct >= take_profit_pct)] = 2
+    # Stop loss wins, matching the order of checks in check_exit_signal
+    codes[valid & (pnl_pct <= -stop_loss_pct)] = 1
+    return codes
+
+
+def _signal_tuple(analysis: Dict) -> tuple:
+    """
+    Reduce an /analyze payload to (has_confluence, score, direction)
+
+    /analyze always sends these keys, so the happy path indexes directly;
+    a malformed payload yields a tuple that never signals.
+    """
+    try:
+        confluence = analysis['confluence']
+        ob = analysis['orderblocks'][0]
+        direction = ob.get('direction', '') if ob else ''
+        return (bool(confluence['has_confluence']), confluence['score'], direction)
+    except (KeyError, IndexError, TypeError, AttributeError):
+        return (False, 0, '')
+
+
+@dataclass(slots=True)
+class TradeRecord:
+    """Entry or exit recorded by the strategy."""
+    type: str  # 'ENTRY' or 'EXIT'
+    symbol: str
+    market: str
+    order: Dict
+    reason: Optional[str] = None  # EXIT only
+    pnl: Optional[float] = None  # EXIT only
+    pnl_pct: Optional[float] = None  # EXIT only
+    entry_mode: Optional[str] = None  # 'LIMIT' for filled limit entries
+    target_price: Optional[float] = None  # LIMIT entries only
+    timestamp_ns: int = field(default_factory=time.time_ns)
+
+    def to_dict(self) -> Dict:
+        """Serialize for the API, omitting fields that do not apply"""
+        record = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if value is not None:
+                record[f.name] = value
+        record['timestamp'] = _iso(self.timestamp_ns)
+        return record
+
+
 class TradingStrategy:
     """
     SMC + AI based trading strategy
@@ -18,7 +105,12 @@ class TradingStrategy:
     - Take profit hit
     """
 
-    def __init__(self, order_manager):
+    # Trades kept in memory; stats come from running counters, so older
+    # trades can be dropped without affecting them (the full history goes
+    # to trade_log_path when one is given)
+    MAX_TRADE_HISTORY = 10_000
+
+    def __init__(self, order_manager, trade_log_path: Optional[str] = None):
         self.om = order_manager
 
         # Strategy parameters
@@ -33,29 +125,45 @@ class TradingStrategy:
 
         self.active = False
         self.monitored_symbols: List[Dict] = []  # [{symbol, market}]
+        self._monitored_keys: set = set()  # {(symbol, market)} for O(1) lookups
 
         # Pending limit orders (symbol -> order info)
         self.pending_orders: Dict[str, Dict] = {}
 
-        # Trade history
-        self.trades: List[Dict] = []
+        # Trade history (bounded, newest last)
+        self.trades: Deque[TradeRecord] = deque(maxlen=self.MAX_TRADE_HISTORY)
+        self._trade_log_path = trade_log_path
+        self._trade_writer = TradeWriter(trade_log_path) if trade_log_path else None
+
+        # Running exit aggregates, updated in execute_exit so get_stats
+        # never has to walk the history
+        self._exit_count = 0
+        self._wins = 0
+        self._losses = 0
+        self._total_pnl = 0
 
     def start(self):
         """Start trading"""
+        if self._trade_log_path and self._trade_writer is None:
+            self._trade_writer = TradeWriter(self._trade_log_path)
         self.active = True
-        print("[Strategy] ACTIVE")
+        logger.info("[Strategy] ACTIVE")
 
     def stop(self):
-        """Stop trading"""
+        """Stop trading and release the trade log"""
         self.active = False
-        print("[Strategy] STOPPED")
+        if self._trade_writer is not None:
+            self._trade_writer.close()
+            self._trade_writer = None
+        logger.info("[Strategy] STOPPED")
 
     def add_symbol(self, symbol: str, market: str = "KR"):
         """Add symbol to monitor"""
-        item = {'symbol': symbol, 'market': market}
-        if item not in self.monitored_symbols:
-            self.monitored_symbols.append(item)
-            print(f"[Strategy] Added {symbol} ({market})")
+        key = (symbol, market)
+        if key not in self._monitored_keys:
+            self._monitored_keys.add(key)
+            self.monitored_symbols.append({'symbol': symbol, 'market': market})
+            logger.info(f"[Strategy] Added {symbol} ({market})")
 
     def remove_symbol(self, symbol: str):
         """Remove symbol"""
@@ -63,7 +171,8 @@ class TradingStrategy:
             s for s in self.monitored_symbols
             if s['symbol'] != symbol
         ]
-        print(f"[Strategy] Removed {symbol}")
+        self._monitored_keys = {k for k in self._monitored_keys if k[0] != symbol}
+        logger.info(f"[Strategy] Removed {symbol}")
 
     def get_symbols(self) -> List[Dict]:
         """Get monitored symbols"""
@@ -87,28 +196,20 @@ class TradingStrategy:
         if self.om.get_position(symbol):
             return False
 
-        # Check for orderblocks
-        orderblocks = analysis.get('orderblocks', [])
-        if not orderblocks:
-            return False
-
-        # Check confluence
-        confluence = analysis.get('confluence', {})
-        if not confluence:
-            return False
-
-        has_confluence = confluence.get('has_confluence', False)
-        if not has_confluence:
-            return False
+        # (has_confluence, score, direction) is fixed for a given analysis,
+        # so it is memoized on the dict for other strategies / re-checks
+        signal = analysis.get('_signal_tuple')
+        if signal is None:
+            signal = _signal_tuple(analysis)
+            analysis['_signal_tuple'] = signal
+        has_confluence, score, direction = signal
 
-        score = confluence.get('score', 0)
-        if score < self.min_confluence_score:
+        if not has_confluence or score < self.min_confluence_score:
             return False
 
         # Check direction (prefer buy signals for now)
-        ob = orderblocks[0] if orderblocks else None
-        if ob and ob.get('direction') == 'buy':
-            print(f"[Signal] {symbol}: OB+FVG confluence, score={score}")
+        if direction == 'buy':
+            logger.info(f"[Signal] {symbol}: OB+FVG confluence, score={score}")
             return True
 
         return False
@@ -144,6 +245,33 @@ class TradingStrategy:
 
         return None
 
+    def check_exit_signals(self, prices: Dict[str, float]) -> Dict[str, str]:
+        """
+        Batch version of check_exit_signal
+
+        Args:
+            prices: symbol -> current price
+
+        Returns:
+            symbol -> 'STOP_LOSS' | 'TAKE_PROFIT' for positions that should exit
+        """
+        # Read the order manager's position arrays directly; positions
+        # without a quote get NaN, which compares False and so holds
+        om = self.om
+        n = om.pos_len
+        if n == 0 or not prices:
+            return {}
+
+        symbols = om.pos_symbols[:n].tolist()
+        current = np.fromiter(
+            (prices.get(s, np.nan) for s in symbols), dtype=np.float64, count=n
+        )
+        codes = _exit_codes(
+            current, om.pos_avg[:n], self.stop_loss_pct, self.take_profit_pct
+        )
+
+        return {s: _EXIT_REASONS[c] for s, c in zip(symbols, codes.tolist()) if c}
+
     def execute_entry(self, symbol: str, market: str, analysis: Dict, current_price: float = 0) -> Dict:
         """Execute buy order based on entry mode"""
 
@@ -165,7 +293,7 @@ class TradingStrategy:
                 'status': 'PENDING'
             }
             self.pending_orders[symbol] = pending
-            print(f"[LIMIT ORDER] {symbol}: 목표가 {target_price:,.0f} 대기 중")
+            logger.info(f"[LIMIT ORDER] {symbol}: 목표가 {target_price:,.0f} 대기 중")
             return pending
 
         # MARKET mode - execute immediately
@@ -177,27 +305,26 @@ class TradingStrategy:
         )
 
         # Record trade
-        self.trades.append({
-            'type': 'ENTRY',
-            'symbol': symbol,
-            'market': market,
-            'order': order,
-            'timestamp': datetime.now().isoformat()
-        })
+        self._record_trade(TradeRecord(
+            type='ENTRY',
+            symbol=symbol,
+            market=market,
+            order=order,
+        ))
 
         return order
 
     def check_pending_orders(self, symbol: str, current_price: float) -> Optional[Dict]:
         """Check if pending limit order should be filled"""
-        if symbol not in self.pending_orders:
+        pending = self.pending_orders.get(symbol)
+        if pending is None:
             return None
 
-        pending = self.pending_orders[symbol]
         target_price = pending.get('target_price', 0)
 
         # Fill if price drops to or below target
         if current_price <= target_price:
-            print(f"[LIMIT FILLED] {symbol}: 목표가 {target_price:,.0f} 도달!")
+            logger.info(f"[LIMIT FILLED] {symbol}: 목표가 {target_price:,.0f} 도달!")
 
             # Execute the order
             order = self.om.buy_market(
@@ -208,27 +335,25 @@ class TradingStrategy:
             )
 
             # Record trade
-            self.trades.append({
-                'type': 'ENTRY',
-                'symbol': symbol,
-                'market': pending['market'],
-                'order': order,
-                'entry_mode': 'LIMIT',
-                'target_price': target_price,
-                'timestamp': datetime.now().isoformat()
-            })
+            self._record_trade(TradeRecord(
+                type='ENTRY',
+                symbol=symbol,
+                market=pending['market'],
+                order=order,
+                entry_mode='LIMIT',
+                target_price=target_price,
+            ))
 
             # Remove from pending
-            del self.pending_orders[symbol]
+            self.pending_orders.pop(symbol, None)
             return order
 
         return None
 
     def cancel_pending_order(self, symbol: str) -> bool:
         """Cancel a pending limit order"""
-        if symbol in self.pending_orders:
-            del self.pending_orders[symbol]
-            print(f"[CANCELLED] {symbol} 대기 주문 취소")
+        if self.pending_orders.pop(symbol, None) is not None:
+            logger.info(f"[CANCELLED] {symbol} 대기 주문 취소")
             return True
         return False
 
@@ -258,33 +383,51 @@ class TradingStrategy:
         pnl = (exit_price - entry_price) * quantity
         pnl_pct = ((exit_price - entry_price) / entry_price) * 100 if entry_price > 0 else 0
 
-        print(f"[Trade] {symbol}: P&L {pnl:+,.0f} ({pnl_pct:+.2f}%)")
+        logger.info(f"[Trade] {symbol}: P&L {pnl:+,.0f} ({pnl_pct:+.2f}%)")
+
+        self._exit_count += 1
+        self._total_pnl += pnl
+        if pnl > 0:
+            self._wins += 1
+        elif pnl < 0:
+            self._losses += 1
 
         # Record trade
-        self.trades.append({
-            'type': 'EXIT',
-            'symbol': symbol,
-            'market': market,
-            'reason': reason,
-            'order': order,
-            'pnl': pnl,
-            'pnl_pct': pnl_pct,
-            'timestamp': datetime.now().isoformat()
-        })
+        self._record_trade(TradeRecord(
+            type='EXIT',
+            symbol=symbol,
+            market=market,
+            order=order,
+            reason=reason,
+            pnl=pnl,
+            pnl_pct=pnl_pct,
+        ))
 
         return order
 
+    def _record_trade(self, record: TradeRecord):
+        """Keep the record in memory and hand it to the disk writer"""
+        self.trades.append(record)
+        if self._trade_writer is not None:
+            self._trade_writer.write(record)
+
     def get_trade_history(self, limit: int = 50) -> List[Dict]:
         """Get trade history"""
-        return self.trades[-limit:]
+        # Walk from the right end so only `limit` records are touched;
+        # timestamps are formatted here rather than when trades are recorded
+        tail = [
+            t.to_dict()
+            for t in islice(reversed(self.trades), max(0, limit))
+        ]
+        tail.reverse()
+        return tail
 
     def get_stats(self) -> Dict:
         """Get strategy statistics"""
-        total_trades = len([t for t in self.trades if t['type'] == 'EXIT'])
-        wins = len([t for t in self.trades if t['type'] == 'EXIT' and t.get('pnl', 0) > 0])
-        losses = len([t for t in self.trades if t['type'] == 'EXIT' and t.get('pnl', 0) < 0])
-
-        total_pnl = sum([t.get('pnl', 0) for t in self.trades if t['type'] == 'EXIT'])
+        total_trades = self._exit_count
+        wins = self._wins
+        losses = self._losses
+        total_pnl = self._total_pnl
 
         return {
             'total_trades': total_trades,
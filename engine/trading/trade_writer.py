@@ -0,0 +1,81 @@
+"""
+Trade Writer - Streams trade records to disk from a background thread
+
+The strategy keeps only a bounded tail of trades in memory; the full
+history is appended here as ND-JSON (one record per line) without the
+trading loop ever waiting on file I/O.
+"""
+import atexit
+import json
+import logging
+import queue
+import threading
+from pathlib import Path
+
+# orjson is optional; it encodes several times faster than stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Queue sentinel that tells the writer thread to finish
+_STOP = object()
+
+
+def _dumps_line(record: dict) -> bytes:
+    """Serialize one record as a newline-terminated JSON line"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            record,
+            default=str,
+            option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    return (json.dumps(record, default=str) + "\n").encode("utf-8")
+
+
+class TradeWriter:
+    """
+    Background ND-JSON writer for trade records
+
+    Records are anything with a to_dict() method (TradeRecord); they are
+    serialized on the writer thread, so write() is just a queue put.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._run, name="TradeWriter", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, record):
+        """Queue a record for writing (never blocks)"""
+        self._queue.put(record)
+
+    def close(self, timeout: float = 5.0):
+        """Flush queued records and stop the writer thread"""
+        atexit.unregister(self.close)
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+
+    def _run(self):
+        with open(self.path, "ab") as f:
+            while True:
+                record = self._queue.get()
+                if record is _STOP:
+                    break
+                try:
+                    f.write(_dumps_line(record.to_dict()))
+                except Exception as e:
+                    logger.error(f"[TradeWriter] Failed to write trade: {e}")
+                # Flush once the burst is drained, not per record
+                if self._queue.empty():
+                    f.flush()
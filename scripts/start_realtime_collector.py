@@ -17,6 +17,7 @@ Features:
 import sys
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add project root to path
@@ -43,22 +44,22 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _read_list(path: Path) -> list:
+    """Read one symbol per line, skipping blanks (missing file -> [])"""
+    if not path.exists():
+        return []
+    with open(path, 'r') as f:
+        return [line.strip() for line in f if line.strip()]
+
+
 def load_watchlist_symbols():
     """Load symbols from watchlist files"""
-    kr_symbols = []
-    us_symbols = []
-
-    # Load KR watchlist
     kr_file = project_root / "data" / "kr_watchlist.txt"
-    if kr_file.exists():
-        with open(kr_file, 'r') as f:
-            kr_symbols = [line.strip() for line in f if line.strip()]
-
-    # Load US watchlist
     us_file = project_root / "data" / "us_watchlist.txt"
-    if us_file.exists():
-        with open(us_file, 'r') as f:
-            us_symbols = [line.strip() for line in f if line.strip()]
+
+    # Read both files in parallel (slow on network filesystems)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        kr_symbols, us_symbols = executor.map(_read_list, (kr_file, us_file))
 
     return kr_symbols, us_symbols
 
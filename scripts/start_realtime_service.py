@@ -13,9 +13,10 @@ Runs continuously - press Ctrl+C to stop
 """
 import sys
 import os
-import time
+import asyncio
 import threading
 import logging
+from datetime import datetime, timezone
 from pathlib import Path
 
 # Add project root to path
@@ -42,57 +43,76 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def run_collector():
-    """Run the real-time price collector"""
-    from engine.data.realtime_collector import RealtimeCollector
-
-    collector = RealtimeCollector(interval_seconds=60)
-    collector.start()
+async def run_candle_builder(tick_event: threading.Event):
+    """
+    Build candles once per minute, skipping minutes without new ticks
 
-
-def run_candle_builder():
-    """Build candles periodically"""
+    tick_event is set by the collector whenever it persists a tick.
+    DB work runs in a worker thread so the event loop never blocks.
+    """
     from engine.data.candle_builder import CandleBuilder
 
     builder = CandleBuilder()
-    builder.ensure_tables()
+    await asyncio.to_thread(builder.ensure_tables)
 
     logger.info("Candle builder started - building every 60 seconds")
 
     while True:
         try:
-            # Build 1-minute candles
-            count = builder.build_candles('1min')
-            if count > 0:
-                logger.info(f"Built {count} 1min candles")
+            now = datetime.now(timezone.utc)
+            minute, hour, second = now.minute, now.hour, now.second
+
+            # Only touch the DB when ticks arrived since the last pass
+            if tick_event.is_set():
+                tick_event.clear()
 
-            # Build higher timeframes at appropriate intervals
-            from datetime import datetime
-            now = datetime.utcnow()
+                # Build 1-minute candles
+                count = await asyncio.to_thread(builder.build_candles, '1min')
+                if count > 0:
+                    logger.info(f"Built {count} 1min candles")
 
-            # 5min candles every 5 minutes
-            if now.minute % 5 == 0:
-                builder.build_candles('5min')
+                # Build higher timeframes at appropriate intervals
 
-            # 15min candles every 15 minutes
-            if now.minute % 15 == 0:
-                builder.build_candles('15min')
+                # 5min candles every 5 minutes
+                if minute % 5 == 0:
+                    await asyncio.to_thread(builder.build_candles, '5min')
 
-            # 1h candles every hour
-            if now.minute == 0:
-                builder.build_candles('1h')
+                # 15min candles every 15 minutes
+                if minute % 15 == 0:
+                    await asyncio.to_thread(builder.build_candles, '15min')
 
-            # 1D candles at midnight UTC
-            if now.hour == 0 and now.minute == 0:
-                builder.build_candles('1D')
+                # 1h candles every hour
+                if minute == 0:
+                    await asyncio.to_thread(builder.build_candles, '1h')
+
+                # 1D candles at midnight UTC
+                if hour == 0 and minute == 0:
+                    await asyncio.to_thread(builder.build_candles, '1D')
 
             # Sleep until next minute
-            sleep_seconds = 60 - now.second
-            time.sleep(sleep_seconds)
+            sleep_seconds = 60 - second
+            await asyncio.sleep(sleep_seconds)
 
         except Exception as e:
             logger.error(f"Candle builder error: {e}")
-            time.sleep(10)
+            await asyncio.sleep(10)
+
+
+async def run_service():
+    """Run the collector and candle builder on one event loop"""
+    from engine.data.realtime_collector import RealtimeCollector
+
+    collector = RealtimeCollector(interval_seconds=60)
+    # Process any ticks left unprocessed by a previous run on the first pass
+    collector.tick_event.set()
+
+    collector_task = asyncio.create_task(collector.run(), name="Collector")
+    logger.info("Started collector task")
+
+    # Give collector time to initialize
+    await asyncio.sleep(2)
+
+    await asyncio.gather(collector_task, run_candle_builder(collector.tick_event))
 
 
 def main():
@@ -111,18 +131,9 @@ def main():
     print("=" * 60)
     print()
 
-    # Start collector in a separate thread
-    collector_thread = threading.Thread(target=run_collector, daemon=True, name="Collector")
-    collector_thread.start()
-
-    logger.info("Started collector thread")
-
-    # Give collector time to initialize
-    time.sleep(2)
-
-    # Run candle builder in main thread
+    # Ctrl+C cancels both tasks; the collector closes its DB connection
     try:
-        run_candle_builder()
+        asyncio.run(run_service())
     except KeyboardInterrupt:
         logger.info("Shutting down...")
         sys.exit(0)
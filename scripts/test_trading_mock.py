@@ -9,15 +9,70 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import asyncio
-import random
+import itertools
+import logging
 from datetime import datetime
 
+import httpx
+import numpy as np
+
+from engine.trading.order_manager import OrderManager
+from engine.trading.strategy import TradingStrategy
+
+# Deterministic price offsets: seeded once, drawn by index per mock analysis
+_N_OFFSETS = 10_000
+_offsets = np.random.default_rng(0).integers(-500, 501, size=_N_OFFSETS)
+_offset_counter = itertools.count()
+
+
+class _Log:
+    """Collect a test phase's output and write it to stdout in one call"""
+
+    def __init__(self):
+        self.buf = []
+
+    def p(self, *args):
+        self.buf.append(' '.join(map(str, args)))
+
+    def flush(self):
+        if self.buf:
+            sys.stdout.write('\n'.join(self.buf) + '\n')
+            sys.stdout.flush()
+            self.buf.clear()
+
+
+log = _Log()
+
+
+class _LogHandler(logging.Handler):
+    """Append engine log records to the phase buffer, keeping them in order"""
+
+    def emit(self, record):
+        log.p(self.format(record))
+
+
+# Show trading engine logs inline with the test output
+_handler = _LogHandler()
+_handler.setFormatter(logging.Formatter("%(message)s"))
+logging.basicConfig(level=logging.INFO, handlers=[_handler])
+
+
+def _make_strategy(mode: str = 'MARKET', limit_price: float = 0.0, symbol: str = '005930'):
+    """Create a started paper-trading strategy monitoring one KR symbol"""
+    om = OrderManager(use_real_account=False)
+    strategy = TradingStrategy(om)
+    strategy.entry_mode = mode
+    strategy.limit_price = limit_price
+    strategy.add_symbol(symbol, 'KR')
+    strategy.start()
+    return om, strategy
+
 
 def create_mock_analysis(symbol: str, has_signal: bool = False):
     """Create mock analysis data"""
 
     base_price = 44000 if symbol == "005930" else 50000
-    current_price = base_price + random.randint(-500, 500)
+    current_price = base_price + int(_offsets[next(_offset_counter) % _N_OFFSETS])
 
     return {
         'symbol': symbol,
@@ -42,215 +97,202 @@ def create_mock_analysis(symbol: str, has_signal: bool = False):
 
 async def test_market_mode():
     """Test MARKET mode entry"""
-    print("\n" + "="*60)
-    print("TEST 1: MARKET MODE")
-    print("="*60)
-
-    from engine.trading.order_manager import OrderManager
-    from engine.trading.strategy import TradingStrategy
-
-    # Create components
-    om = OrderManager(use_real_account=False)
-    strategy = TradingStrategy(om)
+    log.p("\n" + "="*60)
+    log.p("TEST 1: MARKET MODE")
+    log.p("="*60)
 
-    # Set MARKET mode
-    strategy.entry_mode = 'MARKET'
-    strategy.add_symbol('005930', 'KR')
-    strategy.start()
+    om, strategy = _make_strategy('MARKET')
 
-    print("\n1. Testing entry signal detection...")
+    log.p("\n1. Testing entry signal detection...")
 
     # Mock analysis with signal
     analysis = create_mock_analysis('005930', has_signal=True)
-    print(f"   Current price: {analysis['current_price']:,}")
-    print(f"   Confluence score: {analysis['confluence']['score']}")
+    log.p(f"   Current price: {analysis['current_price']:,}")
+    log.p(f"   Confluence score: {analysis['confluence']['score']}")
 
     # Check entry
     should_enter = strategy.check_entry_signal('005930', 'KR', analysis)
-    print(f"   Should enter? {should_enter}")
+    log.p(f"   Should enter? {should_enter}")
 
     if should_enter:
-        print("\n2. Executing entry...")
+        log.p("\n2. Executing entry...")
         order = strategy.execute_entry('005930', 'KR', analysis, analysis['current_price'])
-        print(f"   Order ID: {order.get('order_id', 'N/A')}")
-        print(f"   Price: {order.get('filled_price', 0):,.0f}")
-        print(f"   Quantity: {order.get('filled_quantity', order.get('quantity', 0))}")
+        log.p(f"   Order ID: {order.get('order_id', 'N/A')}")
+        log.p(f"   Price: {order.get('filled_price', 0):,.0f}")
+        log.p(f"   Quantity: {order.get('filled_quantity', order.get('quantity', 0))}")
 
     # Check position
-    print("\n3. Checking position...")
+    log.p("\n3. Checking position...")
     pos = om.get_position('005930')
     if pos:
-        print(f"   Position exists")
-        print(f"   Quantity: {pos['quantity']}")
-        print(f"   Avg price: {pos['avg_price']:,.0f}")
+        log.p(f"   Position exists")
+        log.p(f"   Quantity: {pos['quantity']}")
+        log.p(f"   Avg price: {pos['avg_price']:,.0f}")
 
     # Test exit (stop loss)
-    print("\n4. Testing exit signal (stop loss -2.5%)...")
+    log.p("\n4. Testing exit signal (stop loss -2.5%)...")
     exit_price = pos['avg_price'] * 0.975  # -2.5% loss
     exit_reason = strategy.check_exit_signal('005930', exit_price)
-    print(f"   Exit price: {exit_price:,.0f}")
-    print(f"   Exit reason: {exit_reason}")
+    log.p(f"   Exit price: {exit_price:,.0f}")
+    log.p(f"   Exit reason: {exit_reason}")
 
     if exit_reason:
-        print("\n5. Executing exit...")
+        log.p("\n5. Executing exit...")
         exit_order = strategy.execute_exit('005930', 'KR', exit_reason)
-        print(f"   Exit order placed")
+        log.p(f"   Exit order placed")
 
     # Check stats
     stats = strategy.get_stats()
-    print(f"\n6. Stats: {stats}")
+    log.p(f"\n6. Stats: {stats}")
+
+    # Orders fill synchronously, so stopping is all the cleanup needed
+    strategy.stop()
 
-    print("\n" + "="*60)
-    print("MARKET MODE TEST COMPLETE")
-    print("="*60)
+    log.p("\n" + "="*60)
+    log.p("MARKET MODE TEST COMPLETE")
+    log.p("="*60)
 
 
 async def test_limit_mode():
     """Test LIMIT mode entry"""
-    print("\n" + "="*60)
-    print("TEST 2: LIMIT MODE")
-    print("="*60)
-
-    from engine.trading.order_manager import OrderManager
-    from engine.trading.strategy import TradingStrategy
-
-    # Create components
-    om = OrderManager(use_real_account=False)
-    strategy = TradingStrategy(om)
+    log.p("\n" + "="*60)
+    log.p("TEST 2: LIMIT MODE")
+    log.p("="*60)
 
-    # Set LIMIT mode
     target_price = 43500
-    strategy.entry_mode = 'LIMIT'
-    strategy.limit_price = target_price
-    strategy.add_symbol('005930', 'KR')
-    strategy.start()
+    om, strategy = _make_strategy('LIMIT', limit_price=target_price)
 
-    print(f"\n1. Testing LIMIT order (target: {target_price:,})...")
+    log.p(f"\n1. Testing LIMIT order (target: {target_price:,})...")
 
     # Mock analysis with signal
     analysis = create_mock_analysis('005930', has_signal=True)
     analysis['current_price'] = 44000  # Above target
 
-    print(f"   Current price: {analysis['current_price']:,}")
-    print(f"   Target price: {target_price:,}")
+    log.p(f"   Current price: {analysis['current_price']:,}")
+    log.p(f"   Target price: {target_price:,}")
 
     # Check entry signal
     should_enter = strategy.check_entry_signal('005930', 'KR', analysis)
-    print(f"   Signal detected? {should_enter}")
+    log.p(f"   Signal detected? {should_enter}")
 
     if should_enter:
         # Execute entry - should create pending order
         result = strategy.execute_entry('005930', 'KR', analysis, analysis['current_price'])
-        print(f"   Result: {result.get('status', 'order placed')}")
+        log.p(f"   Result: {result.get('status', 'order placed')}")
 
     # Check pending orders
     pending = strategy.get_pending_orders()
-    print(f"\n2. Pending orders: {len(pending)}")
+    log.p(f"\n2. Pending orders: {len(pending)}")
     for symbol, order in pending.items():
-        print(f"   {symbol}: target {order['target_price']:,}")
+        log.p(f"   {symbol}: target {order['target_price']:,}")
 
     # Simulate price drop to target
-    print(f"\n3. Simulating price drop to {target_price:,}...")
+    log.p(f"\n3. Simulating price drop to {target_price:,}...")
     triggered = strategy.check_pending_orders('005930', target_price)
     if triggered:
-        print(f"   LIMIT order TRIGGERED!")
-        print(f"   Order: {triggered.get('order_id', 'N/A')}")
+        log.p(f"   LIMIT order TRIGGERED!")
+        log.p(f"   Order: {triggered.get('order_id', 'N/A')}")
     else:
-        print("   Not triggered yet")
+        log.p("   Not triggered yet")
 
     # Check position
     pos = om.get_position('005930')
     if pos:
-        print(f"\n4. Position created:")
-        print(f"   Quantity: {pos['quantity']}")
-        print(f"   Avg price: {pos['avg_price']:,.0f}")
+        log.p(f"\n4. Position created:")
+        log.p(f"   Quantity: {pos['quantity']}")
+        log.p(f"   Avg price: {pos['avg_price']:,.0f}")
 
     # Check pending orders again (should be empty)
     pending_after = strategy.get_pending_orders()
-    print(f"\n5. Pending orders after fill: {len(pending_after)}")
+    log.p(f"\n5. Pending orders after fill: {len(pending_after)}")
+
+    strategy.stop()
 
-    print("\n" + "="*60)
-    print("LIMIT MODE TEST COMPLETE")
-    print("="*60)
+    log.p("\n" + "="*60)
+    log.p("LIMIT MODE TEST COMPLETE")
+    log.p("="*60)
 
 
 async def test_api_endpoints():
     """Test API endpoints"""
-    print("\n" + "="*60)
-    print("TEST 3: API ENDPOINTS")
-    print("="*60)
-
-    import requests
+    log.p("\n" + "="*60)
+    log.p("TEST 3: API ENDPOINTS")
+    log.p("="*60)
 
     base_url = "http://localhost:8000"
 
-    # Test start endpoint
-    print("\n1. Testing /api/trading/start...")
-    try:
-        response = requests.post(
-            f"{base_url}/api/trading/start",
-            json={
-                'interval_minutes': 1,
-                'symbols': ['005930'],
-                'market': 'KR',
-                'stop_loss': 2.0,
-                'take_profit': 5.0,
-                'position_size': 10,
-                'entry_mode': 'MARKET',
-                'use_real': False
-            },
-            timeout=5
-        )
-
-        if response.status_code == 200:
-            print("   Bot started")
-            data = response.json()
-            params = data.get('config', {}).get('strategy_params', {})
-            print(f"   Entry mode: {params.get('entry_mode')}")
-            print(f"   Stop loss: {params.get('stop_loss')}%")
-        else:
-            print(f"   Error: {response.status_code} - {response.text[:100]}")
-    except requests.exceptions.ConnectionError:
-        print("   Skipped (server not running)")
-        return
-    except Exception as e:
-        print(f"   Error: {e}")
-        return
-
-    # Wait a bit
-    await asyncio.sleep(2)
-
-    # Test status endpoint
-    print("\n2. Testing /api/trading/status...")
-    try:
-        response = requests.get(f"{base_url}/api/trading/status", timeout=5)
-
-        if response.status_code == 200:
-            data = response.json()
-            print("   Status retrieved")
-            print(f"   Running: {data.get('running')}")
-            print(f"   Entry mode: {data.get('strategy_params', {}).get('entry_mode')}")
-            print(f"   Check count: {data.get('check_count', 0)}")
-        else:
-            print(f"   Error: {response.status_code}")
-    except Exception as e:
-        print(f"   Error: {e}")
-
-    # Test stop endpoint
-    print("\n3. Testing /api/trading/stop...")
-    try:
-        response = requests.post(f"{base_url}/api/trading/stop", timeout=5)
-
-        if response.status_code == 200:
-            print("   Bot stopped")
-        else:
-            print(f"   Error: {response.status_code}")
-    except Exception as e:
-        print(f"   Error: {e}")
-
-    print("\n" + "="*60)
-    print("API ENDPOINTS TEST COMPLETE")
-    print("="*60)
+    # One async client for all probes so the event loop is never blocked
+    async with httpx.AsyncClient(base_url=base_url, timeout=5.0) as client:
+        # Test start endpoint
+        log.p("\n1. Testing /api/trading/start...")
+        log.flush()
+        try:
+            response = await client.post(
+                "/api/trading/start",
+                json={
+                    'interval_minutes': 1,
+                    'symbols': ['005930'],
+                    'market': 'KR',
+                    'stop_loss': 2.0,
+                    'take_profit': 5.0,
+                    'position_size': 10,
+                    'entry_mode': 'MARKET',
+                    'use_real': False
+                },
+            )
+
+            if response.status_code == 200:
+                log.p("   Bot started")
+                data = response.json()
+                params = data.get('config', {}).get('strategy_params', {})
+                log.p(f"   Entry mode: {params.get('entry_mode')}")
+                log.p(f"   Stop loss: {params.get('stop_loss')}%")
+            else:
+                log.p(f"   Error: {response.status_code} - {response.text[:100]}")
+        except httpx.ConnectError:
+            log.p("   Skipped (server not running)")
+            return
+        except Exception as e:
+            log.p(f"   Error: {e}")
+            return
+
+        # Wait a bit
+        log.flush()
+        await asyncio.sleep(2)
+
+        # Test status endpoint
+        log.p("\n2. Testing /api/trading/status...")
+        log.flush()
+        try:
+            response = await client.get("/api/trading/status")
+
+            if response.status_code == 200:
+                data = response.json()
+                log.p("   Status retrieved")
+                log.p(f"   Running: {data.get('running')}")
+                log.p(f"   Entry mode: {data.get('strategy_params', {}).get('entry_mode')}")
+                log.p(f"   Check count: {data.get('check_count', 0)}")
+            else:
+                log.p(f"   Error: {response.status_code}")
+        except Exception as e:
+            log.p(f"   Error: {e}")
+
+        # Test stop endpoint
+        log.p("\n3. Testing /api/trading/stop...")
+        log.flush()
+        try:
+            response = await client.post("/api/trading/stop")
+
+            if response.status_code == 200:
+                log.p("   Bot stopped")
+            else:
+                log.p(f"   Error: {response.status_code}")
+        except Exception as e:
+            log.p(f"   Error: {e}")
+
+    log.p("\n" + "="*60)
+    log.p("API ENDPOINTS TEST COMPLETE")
+    log.p("="*60)
 
 
 async def main():
@@ -265,16 +307,15 @@ async def main():
     try:
         # Test 1: Market mode
         await test_market_mode()
-
-        await asyncio.sleep(0.5)
+        log.flush()
 
         # Test 2: Limit mode
         await test_limit_mode()
-
-        await asyncio.sleep(0.5)
+        log.flush()
 
         # Test 3: API endpoints
         await test_api_endpoints()
+        log.flush()
 
         print("\n")
         print("=" * 60)
@@ -284,6 +325,7 @@ async def main():
         print("\n")
 
     except Exception as e:
+        log.flush()
         print(f"\nTest failed: {e}")
         import traceback
         traceback.print_exc()
@@ -57,8 +57,8 @@ def validate_result(result: dict, label: str):
 
     # Check bar format
     bar = bars[0]
-    for key in ("time", "open", "high", "low", "close", "volume"):
-        assert key in bar, f"Bar missing '{key}'"
+    missing_bar_keys = {"time", "open", "high", "low", "close", "volume"} - bar.keys()
+    assert not missing_bar_keys, f"Bar missing {sorted(missing_bar_keys)}"
 
     # Check indicator keys exist
     expected_indicators = [
@@ -75,10 +75,16 @@ def validate_result(result: dict, label: str):
         "kc_upper", "kc_lower",
         "squeeze",
     ]
-    for key in expected_indicators:
-        assert key in indicators, f"Missing indicator '{key}'"
-        assert len(indicators[key]) == len(bars), \
-            f"Indicator '{key}' length {len(indicators[key])} != bars {len(bars)}"
+    # Collect every problem so one run reports all of them
+    n = len(bars)
+    missing = [key for key in expected_indicators if key not in indicators]
+    wrong_len = {
+        key: len(indicators[key])
+        for key in expected_indicators
+        if key in indicators and len(indicators[key]) != n
+    }
+    assert not missing, f"Missing indicators {missing}"
+    assert not wrong_len, f"Indicator lengths {wrong_len} != bars {n}"
 
     print(f"  ✅ All {len(expected_indicators)} indicators present, lengths match")
     print(f"     First bar: time={bar['time']} C={bar['close']}")
@@ -182,6 +182,20 @@ class TestFreshness:
         assert not _is_ob_fresh(high, low, ob, from_idx=1, to_idx=3)
 
 
+def _make_bars(n_setup, setup, appended):
+    """
+    Build open/high/low/close arrays: `n_setup` copies of the `setup`
+    (open, high, low, close) bar followed by the `appended` bars.
+    """
+    n = n_setup + len(appended)
+    bars = np.empty((4, n), dtype=np.float64)
+    bars[:, :n_setup] = np.asarray(setup, dtype=np.float64)[:, None]
+    for i, bar in enumerate(appended):
+        bars[:, n_setup + i] = bar
+    open_, high, low, close = bars
+    return open_, high, low, close
+
+
 class TestOrderBlockDetection:
     """Tests for complete Order Block detection."""
 
@@ -189,36 +203,15 @@ class TestOrderBlockDetection:
         """Test detection of bullish order block."""
         # Build scenario: bearish candle followed by bullish displacement
         # Need 20 bars for median calculation, then OB + displacement
-        n_setup = 20
-
-        # Setup bars with body size ~1.0
-        open_ = [10.0] * n_setup
-        high = [11.0] * n_setup
-        low = [9.0] * n_setup
-        close = [11.0] * n_setup  # Bullish candles, body = 1.0
-
-        # Add bearish candle (OB candidate)
-        open_.append(12.0)
-        high.append(12.5)
-        low.append(10.5)
-        close.append(11.0)  # Bearish: close < open, body = 1.0
-
-        # Add bullish displacement candle (body >= 1.5)
-        open_.append(11.0)
-        high.append(14.0)
-        low.append(10.5)
-        close.append(13.5)  # Bullish: close > open, body = 2.5
-
-        # Add confirmation bar for FVG check
-        open_.append(13.5)
-        high.append(15.0)
-        low.append(13.0)
-        close.append(14.5)
-
-        open_ = np.array(open_)
-        high = np.array(high)
-        low = np.array(low)
-        close = np.array(close)
+        # Setup bars with body size ~1.0: bullish candles, body = 1.0
+        open_, high, low, close = _make_bars(20, (10.0, 11.0, 9.0, 11.0), [
+            # Bearish candle (OB candidate): close < open, body = 1.0
+            (12.0, 12.5, 10.5, 11.0),
+            # Bullish displacement candle: close > open, body = 2.5
+            (11.0, 14.0, 10.5, 13.5),
+            # Confirmation bar for FVG check
+            (13.5, 15.0, 13.0, 14.5),
+        ])
 
         ob = detect_orderblock(open_, high, low, close)
 
@@ -230,36 +223,15 @@ class TestOrderBlockDetection:
 
     def test_bearish_ob_detected(self):
         """Test detection of bearish order block."""
-        n_setup = 20
-
-        # Setup bars
-        open_ = [10.0] * n_setup
-        high = [11.0] * n_setup
-        low = [9.0] * n_setup
-        close = [9.0] * n_setup  # Bearish candles, body = 1.0
-
-        # Add bullish candle (OB candidate)
-        open_.append(8.0)
-        high.append(10.0)
-        low.append(7.5)
-        close.append(9.0)  # Bullish: close > open
-
-        # Add bearish displacement candle
-        open_.append(9.0)
-        high.append(9.5)
-        low.append(6.0)
-        close.append(6.5)  # Bearish: close < open, body = 2.5
-
-        # Add bar after
-        open_.append(6.5)
-        high.append(7.0)
-        low.append(5.5)
-        close.append(6.0)
-
-        open_ = np.array(open_)
-        high = np.array(high)
-        low = np.array(low)
-        close = np.array(close)
+        # Setup bars: bearish candles, body = 1.0
+        open_, high, low, close = _make_bars(20, (10.0, 11.0, 9.0, 9.0), [
+            # Bullish candle (OB candidate): close > open
+            (8.0, 10.0, 7.5, 9.0),
+            # Bearish displacement candle: close < open, body = 2.5
+            (9.0, 9.5, 6.0, 6.5),
+            # Bar after
+            (6.5, 7.0, 5.5, 6.0),
+        ])
 
         ob = detect_orderblock(open_, high, low, close)
 
@@ -281,35 +253,14 @@ class TestOrderBlockDetection:
 
     def test_ob_invalidated_when_touched(self):
         """Test that OB is invalidated when price touches zone."""
-        n_setup = 20
-
-        open_ = [10.0] * n_setup
-        high = [11.0] * n_setup
-        low = [9.0] * n_setup
-        close = [11.0] * n_setup
-
-        # Bearish OB candle
-        open_.append(12.0)
-        high.append(12.5)
-        low.append(10.5)
-        close.append(11.0)
-
-        # Bullish displacement
-        open_.append(11.0)
-        high.append(14.0)
-        low.append(10.5)
-        close.append(13.5)
-
-        # Price comes back and touches OB zone (11.0 - 12.0)
-        open_.append(13.5)
-        high.append(14.0)
-        low.append(11.5)  # Touches inside OB zone
-        close.append(13.8)
-
-        open_ = np.array(open_)
-        high = np.array(high)
-        low = np.array(low)
-        close = np.array(close)
+        open_, high, low, close = _make_bars(20, (10.0, 11.0, 9.0, 11.0), [
+            # Bearish OB candle
+            (12.0, 12.5, 10.5, 11.0),
+            # Bullish displacement
+            (11.0, 14.0, 10.5, 13.5),
+            # Price comes back and touches OB zone (11.0 - 12.0): low 11.5
+            (13.5, 14.0, 11.5, 13.8),
+        ])
 
         ob = detect_orderblock(open_, high, low, close)
 
@@ -318,45 +269,16 @@ class TestOrderBlockDetection:
 
     def test_single_zone_returns_most_recent(self):
         """Test that only the most recent valid OB is returned."""
-        n_setup = 20
-
-        open_ = [10.0] * n_setup
-        high = [11.0] * n_setup
-        low = [9.0] * n_setup
-        close = [11.0] * n_setup
-
-        # First OB + displacement
-        open_.append(12.0)
-        high.append(12.5)
-        low.append(10.5)
-        close.append(11.0)
-
-        open_.append(11.0)
-        high.append(14.0)
-        low.append(10.5)
-        close.append(13.5)
-
-        # Second OB + displacement (more recent)
-        open_.append(15.0)
-        high.append(15.5)
-        low.append(13.5)
-        close.append(14.0)  # Bearish candle
-
-        open_.append(14.0)
-        high.append(17.0)
-        low.append(13.5)
-        close.append(16.5)  # Bullish displacement
-
-        # Final bar
-        open_.append(16.5)
-        high.append(18.0)
-        low.append(16.0)
-        close.append(17.5)
-
-        open_ = np.array(open_)
-        high = np.array(high)
-        low = np.array(low)
-        close = np.array(close)
+        open_, high, low, close = _make_bars(20, (10.0, 11.0, 9.0, 11.0), [
+            # First OB + displacement
+            (12.0, 12.5, 10.5, 11.0),
+            (11.0, 14.0, 10.5, 13.5),
+            # Second OB + displacement (more recent)
+            (15.0, 15.5, 13.5, 14.0),  # Bearish candle
+            (14.0, 17.0, 13.5, 16.5),  # Bullish displacement
+            # Final bar
+            (16.5, 18.0, 16.0, 17.5),
+        ])
 
         ob = detect_orderblock(open_, high, low, close)
 
@@ -366,35 +288,14 @@ class TestOrderBlockDetection:
 
     def test_ob_zone_is_body_only(self):
         """Test that OB zone is based on body (open/close), not high/low."""
-        n_setup = 20
-
-        open_ = [10.0] * n_setup
-        high = [11.0] * n_setup
-        low = [9.0] * n_setup
-        close = [11.0] * n_setup
-
-        # OB candle with long wicks
-        open_.append(12.0)
-        high.append(15.0)  # Long upper wick
-        low.append(8.0)    # Long lower wick
-        close.append(11.0)
-
-        # Displacement
-        open_.append(11.0)
-        high.append(14.0)
-        low.append(10.5)
-        close.append(13.5)
-
-        # Final bar
-        open_.append(13.5)
-        high.append(15.0)
-        low.append(13.0)
-        close.append(14.5)
-
-        open_ = np.array(open_)
-        high = np.array(high)
-        low = np.array(low)
-        close = np.array(close)
+        open_, high, low, close = _make_bars(20, (10.0, 11.0, 9.0, 11.0), [
+            # OB candle with long wicks (upper 15.0, lower 8.0)
+            (12.0, 15.0, 8.0, 11.0),
+            # Displacement
+            (11.0, 14.0, 10.5, 13.5),
+            # Final bar
+            (13.5, 15.0, 13.0, 14.5),
+        ])
 
         ob = detect_orderblock(open_, high, low, close)
 
@@ -405,36 +306,16 @@ class TestOrderBlockDetection:
 
     def test_ob_with_fvg(self):
         """Test that FVG is properly attached to OB."""
-        n_setup = 20
-
         # Setup with body=1.0 so median is meaningful
-        open_ = [10.0] * n_setup
-        high = [11.5] * n_setup
-        low = [9.5] * n_setup
-        close = [11.0] * n_setup  # body = 1.0
-
-        # c1: before displacement (also OB candle - bearish)
-        open_.append(11.0)
-        high.append(11.5)  # c1 high
-        low.append(9.0)
-        close.append(10.0)  # Bearish, body = 1.0
-
-        # c2: displacement - bullish with large body
-        open_.append(10.0)
-        high.append(15.0)
-        low.append(9.5)
-        close.append(14.5)  # Bullish, body = 4.5 >= 1.5 * 1.0
-
-        # c3: creates FVG (c3 low > c1 high)
-        open_.append(14.0)
-        high.append(16.0)
-        low.append(13.0)  # c3 low (13.0) > c1 high (11.5), so bullish FVG
-        close.append(14.5)  # Small body = 0.5, not displacement
-
-        open_ = np.array(open_)
-        high = np.array(high)
-        low = np.array(low)
-        close = np.array(close)
+        open_, high, low, close = _make_bars(20, (10.0, 11.5, 9.5, 11.0), [
+            # c1: before displacement (also OB candle - bearish), high 11.5
+            (11.0, 11.5, 9.0, 10.0),
+            # c2: displacement - bullish, body = 4.5 >= 1.5 * 1.0
+            (10.0, 15.0, 9.5, 14.5),
+            # c3: low (13.0) > c1 high (11.5), so bullish FVG;
+            # small body = 0.5, not displacement
+            (14.0, 16.0, 13.0, 14.5),
+        ])
 
         ob = detect_orderblock(open_, high, low, close)
 
@@ -445,44 +326,15 @@ class TestOrderBlockDetection:
 
     def test_find_all_orderblocks(self):
         """Test finding all order blocks."""
-        n_setup = 20
-
-        open_ = [10.0] * n_setup
-        high = [11.0] * n_setup
-        low = [9.0] * n_setup
-        close = [11.0] * n_setup
-
-        # First OB
-        open_.append(12.0)
-        high.append(12.5)
-        low.append(10.5)
-        close.append(11.0)
-
-        open_.append(11.0)
-        high.append(14.0)
-        low.append(10.5)
-        close.append(13.5)
-
-        # Second OB
-        open_.append(15.0)
-        high.append(15.5)
-        low.append(13.5)
-        close.append(14.0)
-
-        open_.append(14.0)
-        high.append(17.0)
-        low.append(13.5)
-        close.append(16.5)
-
-        open_.append(16.5)
-        high.append(18.0)
-        low.append(16.0)
-        close.append(17.5)
-
-        open_ = np.array(open_)
-        high = np.array(high)
-        low = np.array(low)
-        close = np.array(close)
+        open_, high, low, close = _make_bars(20, (10.0, 11.0, 9.0, 11.0), [
+            # First OB
+            (12.0, 12.5, 10.5, 11.0),
+            (11.0, 14.0, 10.5, 13.5),
+            # Second OB
+            (15.0, 15.5, 13.5, 14.0),
+            (14.0, 17.0, 13.5, 16.5),
+            (16.5, 18.0, 16.0, 17.5),
+        ])
 
         obs = find_all_orderblocks(open_, high, low, close)
 
@@ -0,0 +1,71 @@
+"""Tests that detect_latest_orderblock selects the same OB as detect_orderblock."""
+
+import numpy as np
+import pytest
+
+from engine.core.orderblock import detect_orderblock, detect_latest_orderblock
+
+
+def _random_ohlcv(seed: int, n: int = 300):
+    """Random-walk OHLCV with plenty of engulfings and gaps."""
+    rng = np.random.default_rng(seed)
+    close = 100.0 + np.cumsum(rng.normal(0.0, 1.0, n))
+    open_ = close + rng.normal(0.0, 1.0, n)
+    high = np.maximum(open_, close) + rng.uniform(0.0, 1.0, n)
+    low = np.minimum(open_, close) - rng.uniform(0.0, 1.0, n)
+    volume = rng.uniform(1_000, 10_000, n)
+    return open_, high, low, close, volume
+
+
+def _same_ob(a, b):
+    if a is None or b is None:
+        return a is None and b is None
+    return (
+        a.index == b.index
+        and a.direction == b.direction
+        and a.zone_top == b.zone_top
+        and a.zone_bottom == b.zone_bottom
+        and a.displacement_index == b.displacement_index
+        and a.has_fvg == b.has_fvg
+        and a.volume_strength == b.volume_strength
+        and a.volume_ratio == b.volume_ratio
+        and (a.fvg is None) == (b.fvg is None)
+        and (a.fvg is None or a.fvg.index == b.fvg.index)
+    )
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("filter_weak", [False, True])
+def test_matches_detect_orderblock(seed, filter_weak):
+    """Random series: same selected OB, with and without weak filtering."""
+    open_, high, low, close, volume = _random_ohlcv(seed)
+
+    expected, _ = detect_orderblock(
+        open_, high, low, close, volume=volume, filter_weak=filter_weak
+    )
+    latest = detect_latest_orderblock(
+        open_, high, low, close, volume=volume, filter_weak=filter_weak
+    )
+
+    assert _same_ob(latest, expected)
+
+
+@pytest.mark.parametrize("n", [50, 120, 300])
+def test_matches_every_prefix_length(n):
+    """Right edge moves, as in /replay: agreement at each bar."""
+    open_, high, low, close, volume = _random_ohlcv(n)
+
+    for end in range(0, n + 1, 7):
+        expected, _ = detect_orderblock(
+            open_[:end], high[:end], low[:end], close[:end], volume=volume[:end]
+        )
+        latest = detect_latest_orderblock(
+            open_[:end], high[:end], low[:end], close[:end], volume=volume[:end]
+        )
+        assert _same_ob(latest, expected)
+
+
+def test_short_series_has_no_ob():
+    """Fewer than 3 bars: no OB."""
+    bars = np.array([10.0, 11.0])
+    assert detect_latest_orderblock(bars, bars + 1, bars - 1, bars) is None
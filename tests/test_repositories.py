@@ -2,9 +2,13 @@
 Repository Pattern Validation Test
 Verifies each repository returns correctly formatted OHLCVData.
 """
+import os
 import sys
 sys.path.insert(0, '.')
 
+import numpy as np
+import pytest
+
 from engine.repositories.base import OHLCVData
 from engine.repositories.kis_repository import KISRepository
 from engine.repositories.alpaca_repository import AlpacaRepository
@@ -33,28 +37,72 @@ def validate_ohlcv(data: OHLCVData, label: str):
         return
 
     # Timestamps must be Unix seconds (int), not milliseconds, not strings
-    for i, ts in enumerate(data.timestamps[:5]):
-        assert isinstance(ts, int), f"timestamps[{i}] must be int, got {type(ts).__name__}: {ts}"
-        assert 946684800 < ts < 2000000000, f"timestamps[{i}]={ts} out of range (must be Unix seconds)"
+    not_int = [i for i, t in enumerate(data.timestamps) if type(t) is not int]
+    assert not not_int, \
+        f"timestamps[{not_int[0]}] must be int, got {type(data.timestamps[not_int[0]]).__name__}"
+    ts = np.asarray(data.timestamps)
+    out_of_range = np.flatnonzero((ts <= 946684800) | (ts >= 2000000000))
+    assert out_of_range.size == 0, \
+        f"timestamps[{out_of_range[0]}]={ts[out_of_range[0]]} out of range (must be Unix seconds)"
 
     # Must be sorted ascending
-    for i in range(1, min(n, 20)):
-        assert data.timestamps[i] >= data.timestamps[i-1], \
-            f"Not sorted at [{i}]: {data.timestamps[i-1]} > {data.timestamps[i]}"
+    unsorted = np.flatnonzero(ts[1:] < ts[:-1])
+    assert unsorted.size == 0, \
+        f"Not sorted at [{unsorted[0] + 1}]: {ts[unsorted[0]]} > {ts[unsorted[0] + 1]}"
 
     # Price sanity check
-    for i in range(min(n, 5)):
-        assert data.high[i] >= data.low[i], f"high < low at [{i}]"
-        assert data.open[i] >= data.low[i], f"open < low at [{i}]"
-        assert data.close[i] >= data.low[i], f"close < low at [{i}]"
-        assert data.open[i] <= data.high[i], f"open > high at [{i}]"
-        assert data.close[i] <= data.high[i], f"close > high at [{i}]"
+    o = np.asarray(data.open, dtype=np.float64)
+    h = np.asarray(data.high, dtype=np.float64)
+    l = np.asarray(data.low, dtype=np.float64)
+    c = np.asarray(data.close, dtype=np.float64)
+    for check, ok in (
+        ("high < low", h >= l),
+        ("open < low", o >= l),
+        ("close < low", c >= l),
+        ("open > high", o <= h),
+        ("close > high", c <= h),
+    ):
+        bad = np.flatnonzero(~ok)
+        assert bad.size == 0, f"{check} at [{bad[0]}]"
 
     print(f"  ✅ {n} bars | Format valid | Sorted ascending")
     print(f"     First bar: time={data.timestamps[0]} O={data.open[0]} H={data.high[0]} L={data.low[0]} C={data.close[0]} V={data.volume[0]}")
     print(f"     Last bar:  time={data.timestamps[-1]} O={data.open[-1]} H={data.high[-1]} L={data.low[-1]} C={data.close[-1]} V={data.volume[-1]}")
 
 
+@pytest.mark.parametrize("timestamps", [[1.7, 2.9], ["1700000000", "1700086400"]])
+def test_ohlcv_rejects_non_int_timestamps(timestamps):
+    """Float or string timestamps raise instead of being floored/parsed."""
+    with pytest.raises(TypeError):
+        OHLCVData(timestamps, [1.0, 1.0], [1.0, 1.0], [1.0, 1.0], [1.0, 1.0], [1.0, 1.0])
+
+
+def test_alpaca_cache_round_trip(tmp_path):
+    """A written cache file reads back as the same bars while fresh."""
+    data = OHLCVData(
+        timestamps=[1700000000, 1700086400, 1700172800],
+        open=[10.0, 11.0, 12.0],
+        high=[11.5, 12.5, 13.5],
+        low=[9.5, 10.5, 11.5],
+        close=[11.0, 12.0, 13.0],
+        volume=[1000.0, 2000.0, 3000.0],
+    )
+    path = tmp_path / "us" / "AAPL_1Day_10000.npy"
+
+    AlpacaRepository._write_cache(path, data)
+    cached = AlpacaRepository._read_cache(path, "1Day")
+
+    assert cached is not None
+    for name in OHLCVData.FIELDS:
+        assert np.array_equal(cached.array(name), data.array(name)), name
+    assert list(tmp_path.rglob("*.tmp")) == []
+
+    # Past the TTL, or with no file, the cache is a miss
+    os.utime(path, (0, 0))
+    assert AlpacaRepository._read_cache(path, "1Day") is None
+    assert AlpacaRepository._read_cache(tmp_path / "missing.npy", "1Day") is None
+
+
 def main():
     print("=" * 60)
     print("  LiquidityHunter — Repository Pattern Test")
@@ -0,0 +1,239 @@
+"""Tests for the desktop screener results model (ui_desktop.results_model).
+
+The model only needs QAbstractTableModel's row/change notifications, so
+these run against a small stand-in for PySide6.QtCore that records them.
+"""
+
+import importlib
+import sys
+import types
+
+import pytest
+
+from ui_desktop.models import ScreenResult
+
+
+class _Signal:
+    def __init__(self):
+        self.calls = []
+
+    def emit(self, *args):
+        self.calls.append(args)
+
+
+class _QModelIndex:
+    def __init__(self, row=-1, column=-1):
+        self._row = row
+        self._column = column
+
+    def isValid(self):
+        return self._row >= 0
+
+    def row(self):
+        return self._row
+
+    def column(self):
+        return self._column
+
+
+class _QAbstractTableModel:
+    """Records begin/end notifications and checks rowCount around them."""
+
+    def __init__(self, parent=None):
+        self.dataChanged = _Signal()
+        self.events = []
+        self._expected_rows = None
+
+    def index(self, row, column):
+        return _QModelIndex(row, column)
+
+    def beginRemoveRows(self, parent, first, last):
+        assert 0 <= first <= last < self.rowCount()
+        self.events.append(("remove", first, last))
+        self._expected_rows = self.rowCount() - (last - first + 1)
+
+    def endRemoveRows(self):
+        assert self.rowCount() == self._expected_rows
+
+    def beginInsertRows(self, parent, first, last):
+        assert 0 <= first <= self.rowCount() and first <= last
+        self.events.append(("insert", first, last))
+        self._expected_rows = self.rowCount() + (last - first + 1)
+
+    def endInsertRows(self):
+        assert self.rowCount() == self._expected_rows
+
+
+class _Qt:
+    class ItemDataRole:
+        DisplayRole = 0
+        EditRole = 2
+        UserRole = 256
+
+    class Orientation:
+        Horizontal = 1
+
+
+@pytest.fixture
+def rm(monkeypatch):
+    """ui_desktop.results_model imported against the stand-in QtCore."""
+    qtcore = types.ModuleType("PySide6.QtCore")
+    qtcore.QAbstractTableModel = _QAbstractTableModel
+    qtcore.QModelIndex = _QModelIndex
+    qtcore.Qt = _Qt
+    monkeypatch.setitem(sys.modules, "PySide6", types.ModuleType("PySide6"))
+    monkeypatch.setitem(sys.modules, "PySide6.QtCore", qtcore)
+    monkeypatch.delitem(sys.modules, "ui_desktop.results_model", raising=False)
+    module = importlib.import_module("ui_desktop.results_model")
+    yield module
+    sys.modules.pop("ui_desktop.results_model", None)
+
+
+def _result(symbol, score=50, last_close=100.0, days_to_cross=3):
+    return ScreenResult(
+        symbol=symbol,
+        market="KR",
+        last_close=last_close,
+        ema20=99.0,
+        ema200=95.0,
+        gap=0.0123456,
+        slope_diff=0.000123456,
+        days_to_cross=days_to_cross,
+        score=score,
+        reason="r",
+    )
+
+
+def _rows(symbols, **kwargs):
+    return [_result(symbol, **kwargs) for symbol in symbols]
+
+
+def _read_all(model):
+    for row in range(model.rowCount()):
+        model.data(_QModelIndex(row, 0))
+
+
+class TestSetRows:
+    def test_first_batch_then_fetch_more(self, rm):
+        model = rm.ScreenResultsModel()
+        rows = _rows(f"S{i}" for i in range(rm.FETCH_BATCH + 50))
+
+        model.set_rows(rows)
+
+        assert model.events == [("insert", 0, rm.FETCH_BATCH - 1)]
+        assert model.rowCount() == rm.FETCH_BATCH
+        assert model.canFetchMore()
+
+        model.fetchMore()
+
+        assert model.rowCount() == len(rows)
+        assert not model.canFetchMore()
+        assert all(model.row_at(i) is rows[i] for i in range(len(rows)))
+
+    def test_same_symbols_update_in_place(self, rm):
+        model = rm.ScreenResultsModel()
+        model.set_rows(_rows(["A", "B", "C", "D"]))
+        _read_all(model)
+        memo = list(model._values)
+        model.events.clear()
+
+        refreshed = _rows(["A", "B", "C", "D"])
+        refreshed[2] = _result("C", score=90)
+        model.set_rows(refreshed)
+
+        # No rows removed or inserted, one dataChanged over the changed row
+        assert model.events == []
+        ((top_left, bottom_right, _roles),) = model.dataChanged.calls
+        assert (top_left.row(), bottom_right.row()) == (2, 2)
+        assert bottom_right.column() == len(rm.COLUMNS) - 1
+
+        # Unchanged rows keep their memoized values; the changed row recomputes
+        assert [model._values[i] is memo[i] for i in range(4)] == [True, True, False, True]
+        assert model._values[2] is None
+        assert model.data(_QModelIndex(2, 1)) == 90
+
+    def test_identical_rows_emit_nothing(self, rm):
+        model = rm.ScreenResultsModel()
+        model.set_rows(_rows(["A", "B"]))
+        model.events.clear()
+
+        model.set_rows(_rows(["A", "B"]))
+
+        assert model.events == []
+        assert model.dataChanged.calls == []
+
+    def test_diverging_symbols_replace_the_tail(self, rm):
+        model = rm.ScreenResultsModel()
+        model.set_rows(_rows(["A", "B", "C", "D"]))
+        _read_all(model)
+        kept = model._values[:2]
+        model.events.clear()
+
+        rows = _rows(["A", "B", "X", "Y", "Z"])
+        model.set_rows(rows)
+
+        assert model.events == [("remove", 2, 3), ("insert", 2, 4)]
+        assert model.dataChanged.calls == []
+        assert all(model._values[i] is kept[i] for i in range(2))
+        assert all(model.row_at(i) is rows[i] for i in range(5))
+
+    def test_shrinking_to_empty(self, rm):
+        model = rm.ScreenResultsModel()
+        model.set_rows(_rows(["A", "B", "C"]))
+        model.events.clear()
+
+        model.set_rows([])
+
+        assert model.events == [("remove", 0, 2)]
+        assert model.rowCount() == 0
+        assert not model.canFetchMore()
+
+    def test_loaded_depth_survives_refresh(self, rm):
+        model = rm.ScreenResultsModel()
+        symbols = [f"S{i}" for i in range(3 * rm.FETCH_BATCH)]
+        model.set_rows(_rows(symbols))
+        model.fetchMore()
+        depth = model.rowCount()
+        assert depth == 2 * rm.FETCH_BATCH
+
+        # First symbol changes: every loaded row is replaced, at the same depth
+        model.events.clear()
+        model.set_rows(_rows(["NEW"] + symbols[1:]))
+
+        assert model.events == [("remove", 0, depth - 1), ("insert", 0, depth - 1)]
+        assert model.rowCount() == depth
+
+
+class TestData:
+    def test_display_edit_and_sort_roles(self, rm):
+        display = _Qt.ItemDataRole.DisplayRole
+        edit = _Qt.ItemDataRole.EditRole
+        model = rm.ScreenResultsModel()
+        model.set_rows([_result("A"), _result("B", days_to_cross=None)])
+
+        assert model.data(_QModelIndex(0, 0), display) == "A"
+        assert model.data(_QModelIndex(0, 6), display) == "0.0123"
+        assert model.data(_QModelIndex(0, 7), display) == "0.000123"
+        assert model.data(_QModelIndex(0, 6), edit) == 0.0123456
+        assert model.data(_QModelIndex(0, 2), rm.SORT_ROLE) == 3
+
+        # Missing days_to_cross shows "-" and sorts last
+        assert model.data(_QModelIndex(1, 2), display) == "-"
+        assert model.data(_QModelIndex(1, 2), edit) == "-"
+        assert model.data(_QModelIndex(1, 2), rm.SORT_ROLE) == float("inf")
+
+        assert model.data(_QModelIndex()) is None
+        assert model.headerData(0, _Qt.Orientation.Horizontal) == "Symbol"
+
+    def test_row_values_are_memoized(self, rm):
+        model = rm.ScreenResultsModel()
+        model.set_rows([_result("A")])
+        assert model._values == [None]
+
+        model.data(_QModelIndex(0, 0))
+        values = model._values[0]
+        assert values == tuple(getter(model.row_at(0)) for _, getter, _ in rm.COLUMNS)
+
+        for column in range(len(rm.COLUMNS)):
+            model.data(_QModelIndex(0, column))
+        assert model._values[0] is values
@@ -7,12 +7,22 @@ from engine.core.screener import (
     ema,
     forecast_cross_days,
     score_candidate,
+    score_candidates,
     screen_symbol,
     screen_watchlist,
     ScreenResult,
 )
 
 
+@pytest.fixture(scope="module")
+def closes_converging():
+    """Flat base then a mild rally (EMA20 approaching EMA200); shared, read-only."""
+    return np.concatenate([
+        np.full(200, 100.0),
+        np.linspace(100, 110, 50),
+    ])
+
+
 class TestEMA:
     """Tests for EMA calculation."""
 
@@ -135,6 +145,25 @@ class TestScoreCandidate:
         score = score_candidate(5, 10.0, 2.0, 0.0)
         assert score == 0
 
+    def test_vectorized_matches_scalar(self):
+        """Test score_candidates against score_candidate element-wise."""
+        cases = [
+            (None, 10.0, 2.0, 100.0),
+            (0, 0.0, 2.0, 100.0),
+            (30, 30.0, 1.0, 100.0),
+            (10, 5.0, 3.0, 100.0),
+            (0, -10.0, 10.0, 100.0),
+            (50, 100.0, -10.0, 100.0),
+            (5, 10.0, 2.0, 0.0),
+            (3, 1.0, 500.0, -100.0),
+        ]
+        days = np.array([np.nan if c[0] is None else c[0] for c in cases])
+        d0, v, ema_slow = (np.array(col) for col in list(zip(*cases))[1:])
+
+        scores = score_candidates(days, d0, v, ema_slow)
+
+        assert scores.tolist() == [score_candidate(*c) for c in cases]
+
 
 class TestScreenSymbol:
     """Tests for screen_symbol."""
@@ -216,15 +245,12 @@ class TestScreenWatchlist:
         # Only OK results returned, so empty
         assert result == []
 
-    def test_mixed_results(self):
+    def test_mixed_results(self, closes_converging):
         """Test with mixed results."""
         def get_closes(symbol):
             if symbol == "GOOD":
                 # Create convergence scenario
-                return np.concatenate([
-                    np.full(200, 100.0),
-                    np.linspace(100, 110, 50),
-                ])
+                return closes_converging
             else:
                 return np.arange(1.0, 51.0)  # Insufficient
 
@@ -234,13 +260,10 @@ class TestScreenWatchlist:
         for r in result:
             assert r.reason == "OK"
 
-    def test_top_n_limit(self):
+    def test_top_n_limit(self, closes_converging):
         """Test top_n limiting."""
         def get_closes(symbol):
-            return np.concatenate([
-                np.full(200, 100.0),
-                np.linspace(100, 110, 50),
-            ])
+            return closes_converging  # Same array for every symbol
 
         symbols = [f"SYM{i}" for i in range(10)]
         result = screen_watchlist(symbols, "US", get_closes, top_n=3)
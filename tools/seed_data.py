@@ -5,54 +5,87 @@ Reports the status of CSV data files for all symbols in watchlists.
 Does NOT download or modify any data.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 # Constants
 MIN_ROWS_REQUIRED = 250
 DATA_DIR = Path(__file__).parent.parent / "data"
+MAX_WORKERS = 8  # Files are checked in parallel (I/O bound)
+READ_CHUNK = 1 << 20  # Bytes per read when counting lines
+CSV_SUFFIX = "_1D.csv"  # Daily data files are {symbol}_1D.csv
 
 
 def read_watchlist(filepath: Path) -> List[str]:
     """Read symbols from a watchlist file."""
-    if not filepath.exists():
+    try:
+        text = filepath.read_text()
+    except FileNotFoundError:
         return []
 
-    symbols = []
-    with open(filepath, "r") as f:
-        for line in f:
-            symbol = line.strip()
-            if symbol:
-                symbols.append(symbol)
-    return symbols
+    # One read; lines are stripped and blanks dropped in a single pass
+    return [symbol for symbol in map(str.strip, text.splitlines()) if symbol]
 
 
 def count_csv_rows(filepath: Path) -> int:
     """Count data rows in CSV (excluding header)."""
-    if not filepath.exists():
+    # Count newlines a chunk at a time in C rather than iterating lines
+    lines = 0
+    last = b"\n"
+    try:
+        with open(filepath, "rb") as f:
+            for chunk in iter(lambda: f.read(READ_CHUNK), b""):
+                lines += chunk.count(b"\n")
+                last = chunk[-1:]
+    except FileNotFoundError:
         return 0
 
-    count = 0
-    with open(filepath, "r") as f:
-        next(f, None)  # Skip header
-        for _ in f:
-            count += 1
-    return count
+    if last != b"\n":
+        lines += 1  # Last line has no trailing newline
 
+    return max(0, lines - 1)  # Skip header
 
-def check_symbol(symbol: str, market: str) -> Tuple[str, int]:
+
+def scan_market_dir(market: str) -> Dict[str, os.DirEntry]:
+    """List a market's daily CSVs once, keyed by symbol."""
+    try:
+        with os.scandir(DATA_DIR / market.lower()) as it:
+            return {
+                entry.name[:-len(CSV_SUFFIX)]: entry
+                for entry in it
+                if entry.name.endswith(CSV_SUFFIX) and entry.is_file()
+            }
+    except FileNotFoundError:
+        return {}
+
+
+def check_symbol(
+    symbol: str,
+    market: str,
+    inventory: Optional[Dict[str, os.DirEntry]] = None,
+) -> Tuple[str, int]:
     """Check status of a symbol's data file.
 
+    Args:
+        symbol: Stock ticker
+        market: Market code (KR or US)
+        inventory: Pre-scanned directory listing from scan_market_dir()
+            (scanned here if not provided)
+
     Returns:
         Tuple of (status, row_count)
         status: "OK", "INSUFFICIENT_ROWS", or "MISSING"
     """
-    csv_path = DATA_DIR / market.lower() / f"{symbol}_1D.csv"
+    if inventory is None:
+        inventory = scan_market_dir(market)
 
-    if not csv_path.exists():
+    entry = inventory.get(symbol)
+    if entry is None:
         return ("MISSING", 0)
 
-    row_count = count_csv_rows(csv_path)
+    row_count = count_csv_rows(Path(entry.path))
 
     if row_count >= MIN_ROWS_REQUIRED:
         return ("OK", row_count)
@@ -122,9 +155,15 @@ def main():
             print(f"  Watchlist not found: {watchlist_path}")
             continue
 
+        # One directory listing per market instead of a stat per symbol
+        inventory = scan_market_dir(market)
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            statuses = list(pool.map(
+                lambda s: check_symbol(s, market, inventory), symbols
+            ))
+
         results = []
-        for symbol in symbols:
-            status, row_count = check_symbol(symbol, market)
+        for symbol, (status, row_count) in zip(symbols, statuses):
             results.append((symbol, status, row_count))
 
             if status == "OK":
@@ -91,7 +91,12 @@ function adaptV2Response(v2: any): any {
   if (!adapted.kc_middle) adapted.kc_middle = new Array(barCount).fill(null);
   if (!adapted.rsi_bb_middle) adapted.rsi_bb_middle = new Array(barCount).fill(null);
 
-  // 5. Clean up: remove nested indicators and data_source
+  // 5. Squeeze arrives as 0/1 ints; restore booleans
+  if (Array.isArray(adapted.squeeze)) {
+    adapted.squeeze = adapted.squeeze.map(Boolean);
+  }
+
+  // 6. Clean up: remove nested indicators and data_source
   delete adapted.indicators;
   delete adapted.data_source;
   delete adapted.last_updated;
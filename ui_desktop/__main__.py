@@ -11,15 +11,17 @@ Prerequisites:
        python -m ui_desktop
 """
 
+import os
 import sys
 
-from PySide6.QtWidgets import QApplication
-
-from .main_window import MainWindow
-
 
 def main():
     """Main entry point."""
+    # Qt is imported here so importing this module stays cheap
+    from PySide6.QtWidgets import QApplication
+
+    from .main_window import MainWindow
+
     app = QApplication(sys.argv)
 
     # Set application metadata
@@ -32,7 +34,13 @@ def main():
     window.show()
 
     # Run event loop
-    sys.exit(app.exec())
+    rc = app.exec()
+
+    # Exit without interpreter teardown: finalizing the Qt object graph
+    # is slow and there is no state left to save once the window closed
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(rc)
 
 
 if __name__ == "__main__":
@@ -3,15 +3,41 @@
 This module handles all communication with the backend server.
 """
 
+import dbm
+import os
+import shelve
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Dict, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError, Timeout, RequestException
 
 from .models import AnalyzeResult, ScreenResponse, ServerHealth
 
+# orjson is optional; it parses the response bytes several times faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Keep-alive connections kept per host: enough for every UI pool thread
+# that may call concurrently, so none are discarded
+POOL_MAXSIZE = max(16, os.cpu_count() or 1)
+
+
+def _json(response: requests.Response):
+    """Decode a JSON response body (raises ValueError on bad JSON)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
 
 @dataclass
 class ClientResult:
@@ -35,48 +61,210 @@ class AnalyzeClientResult:
 
 
 class AnalysisCache:
-    """In-memory session cache for analysis results.
+    """Session cache for analysis results, optionally persisted to disk.
 
     Cache key: (symbol, market)
-    No persistence - cleared when app restarts.
+    Bounded LRU: beyond maxsize the least recently used entry is evicted.
+    Entries older than ttl seconds are dropped when next looked up.
+    With a path, entries are also written to a shelve file there, so a
+    restarted app can reuse analyses that are still within ttl; otherwise
+    the cache is cleared when the app restarts.
     """
 
-    def __init__(self):
-        self._cache: Dict[Tuple[str, str], AnalyzeResult] = {}
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0, path: Optional[Path] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (result, monotonic insert time); order = recency
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[AnalyzeResult, float]]" = OrderedDict()
+        self._lock = threading.Lock()  # UI pool threads share the cache
+        # "market:symbol" -> (result, wall-clock insert time)
+        self._disk: Optional[shelve.Shelf] = None
+        if path is not None:
+            self._disk = self._open_disk(path)
+
+    def _open_disk(self, path: Path) -> Optional[shelve.Shelf]:
+        """Open the shelve file, dropping expired entries (None on failure)."""
+        try:
+            path.mkdir(parents=True, exist_ok=True)
+            disk = shelve.open(str(path / "analysis"))
+            now = time.time()
+            for key in list(disk.keys()):
+                try:
+                    expired = now - disk[key][1] > self.ttl
+                except Exception:  # Unreadable entry (e.g. models changed)
+                    expired = True
+                if expired:
+                    del disk[key]
+            return disk
+        except (OSError, dbm.error):
+            return None  # Memory-only
+
+    @staticmethod
+    def _disk_key(key: Tuple[str, str]) -> str:
+        symbol, market = key
+        return f"{market}:{symbol}"
+
+    def _lookup(self, key: Tuple[str, str]) -> Optional[AnalyzeResult]:
+        """Fresh entry for key (marked recently used), or None. Lock held."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return self._lookup_disk(key)
+        result, inserted_at = entry
+        if time.monotonic() - inserted_at > self.ttl:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return result
+
+    def _lookup_disk(self, key: Tuple[str, str]) -> Optional[AnalyzeResult]:
+        """Fresh disk entry for key, promoted to memory, or None. Lock held."""
+        if self._disk is None:
+            return None
+        try:
+            result, saved_at = self._disk[self._disk_key(key)]
+        except Exception:  # Missing or unreadable
+            return None
+        age = time.time() - saved_at
+        if age > self.ttl:
+            return None
+        self._store(key, result, time.monotonic() - age)
+        return result
+
+    def _store(self, key: Tuple[str, str], result: AnalyzeResult, inserted_at: float) -> None:
+        """Insert into the in-memory LRU. Lock held."""
+        self._cache[key] = (result, inserted_at)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
 
     def get(self, symbol: str, market: str) -> Optional[AnalyzeResult]:
         """Get cached result if available."""
-        return self._cache.get((symbol, market))
+        with self._lock:
+            return self._lookup((symbol, market))
 
     def put(self, symbol: str, market: str, result: AnalyzeResult) -> None:
         """Store result in cache."""
-        self._cache[(symbol, market)] = result
+        key = (symbol, market)
+        with self._lock:
+            self._store(key, result, time.monotonic())
+            if self._disk is not None:
+                self._disk[self._disk_key(key)] = (result, time.time())
 
     def clear(self) -> None:
         """Clear all cached results."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
+            if self._disk is not None:
+                self._disk.clear()
 
     def remove(self, symbol: str, market: str) -> None:
         """Remove a specific entry from cache."""
-        self._cache.pop((symbol, market), None)
+        key = (symbol, market)
+        with self._lock:
+            self._cache.pop(key, None)
+            if self._disk is not None:
+                self._disk.pop(self._disk_key(key), None)
+
+    def close(self) -> None:
+        """Flush and close the disk store (memory entries are kept)."""
+        with self._lock:
+            if self._disk is not None:
+                self._disk.close()
+                self._disk = None
 
     @property
     def size(self) -> int:
-        """Number of cached entries."""
-        return len(self._cache)
+        """Number of fresh cached entries (memory and disk, each counted once)."""
+        with self._lock:
+            now = time.monotonic()
+            keys = {
+                self._disk_key(key)
+                for key, (_, inserted_at) in self._cache.items()
+                if now - inserted_at <= self.ttl
+            }
+            if self._disk is not None:
+                now = time.time()
+                for key in self._disk.keys():
+                    if key in keys:
+                        continue
+                    try:
+                        fresh = now - self._disk[key][1] <= self.ttl
+                    except Exception:  # Unreadable entry
+                        fresh = False
+                    if fresh:
+                        keys.add(key)
+            return len(keys)
 
     def has(self, symbol: str, market: str) -> bool:
         """Check if result is cached."""
-        return (symbol, market) in self._cache
+        with self._lock:
+            return self._lookup((symbol, market)) is not None
 
 
 class LHClient:
     """HTTP client for LiquidityHunter API."""
 
-    def __init__(self, base_url: str = "http://127.0.0.1:8000"):
+    def __init__(
+        self,
+        base_url: str = "http://127.0.0.1:8000",
+        cache_dir: Optional[Path] = None,
+    ):
         self.base_url = base_url
         self.timeout = 30  # seconds
-        self.analysis_cache = AnalysisCache()
+        # cache_dir persists analyses across restarts (memory-only if None)
+        self.analysis_cache = AnalysisCache(path=cache_dir)
+
+        # One keep-alive session for every call (shared by worker threads)
+        self._session = requests.Session()
+        self._session.headers["Accept"] = "application/json"
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_MAXSIZE)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # endpoint -> whether HEAD is allowed (learned by test_endpoint)
+        self._head_supported: Dict[str, bool] = {}
+
+    def close(self) -> None:
+        """Close pooled connections and the analysis cache's disk store."""
+        self._session.close()
+        self.analysis_cache.close()
+
+    def _request(
+        self,
+        path: str,
+        params: Optional[dict] = None,
+        timeout: Optional[float] = None,
+        method: str = "GET",
+        connect_error: str = "Server unavailable",
+        timeout_error: Optional[str] = None,
+    ) -> Tuple[Optional[requests.Response], Optional[str], float]:
+        """Send a request on the pooled session.
+
+        Args:
+            path: Endpoint path (e.g., "/screen")
+            params: Query parameters
+            timeout: Seconds (defaults to self.timeout)
+            method: HTTP method
+            connect_error: Message when the server can't be reached
+            timeout_error: Message on timeout (defaults to "Request timed out after Ns")
+
+        Returns:
+            (response, error, elapsed_ms) - exactly one of response/error is set
+        """
+        timeout = timeout or self.timeout
+        start_time = time.perf_counter()
+        response = error = None
+        try:
+            response = self._session.request(
+                method, f"{self.base_url}{path}", params=params, timeout=timeout
+            )
+        except ConnectionError:
+            error = connect_error
+        except Timeout:
+            error = timeout_error or f"Request timed out after {timeout}s"
+        except RequestException as e:
+            error = f"Request error: {e}"
+        return response, error, (time.perf_counter() - start_time) * 1000
 
     def fetch_screen(self, market: str, top_n: int = 20) -> ClientResult:
         """Fetch screening results for a market.
@@ -88,48 +276,45 @@ class LHClient:
         Returns:
             ClientResult with either data or error message
         """
-        url = f"{self.base_url}/screen"
+        return self.fetch_screen_with_health(market, top_n)[0]
+
+    def fetch_screen_with_health(
+        self, market: str, top_n: int = 20
+    ) -> Tuple[ClientResult, ServerHealth]:
+        """Fetch screening results and judge server health from the same call.
+
+        The /screen response is exactly what check_health() inspects, so a
+        refresh doesn't need a separate health request.
+
+        Args:
+            market: Market code (KR or US)
+            top_n: Maximum number of candidates to return
+
+        Returns:
+            (ClientResult, ServerHealth) for the one /screen request
+        """
         params = {"market": market, "top_n": top_n}
 
-        start_time = time.time()
-        try:
-            response = requests.get(url, params=params, timeout=self.timeout)
-            elapsed_ms = (time.time() - start_time) * 1000
-            response.raise_for_status()
-            data = response.json()
-            return ClientResult(
-                success=True,
-                data=ScreenResponse.from_dict(data),
-                response_time_ms=elapsed_ms,
-            )
-        except ConnectionError:
-            elapsed_ms = (time.time() - start_time) * 1000
-            return ClientResult(
-                success=False,
-                error="Connection failed: Is the server running on port 8000?",
-                response_time_ms=elapsed_ms,
-            )
-        except Timeout:
-            elapsed_ms = (time.time() - start_time) * 1000
-            return ClientResult(
-                success=False,
-                error=f"Request timed out after {self.timeout}s",
-                response_time_ms=elapsed_ms,
-            )
-        except RequestException as e:
-            elapsed_ms = (time.time() - start_time) * 1000
-            return ClientResult(
-                success=False,
-                error=f"Request error: {e}",
-                response_time_ms=elapsed_ms,
-            )
-        except (KeyError, ValueError) as e:
-            elapsed_ms = (time.time() - start_time) * 1000
-            return ClientResult(
-                success=False,
-                error=f"Invalid response format: {e}",
-                response_time_ms=elapsed_ms,
-            )
+        response, error, elapsed_ms = self._request(
+            "/screen",
+            params,
+            connect_error="Connection failed: Is the server running on port 8000?",
+        )
+        health = self._screen_health(market, response, error, elapsed_ms)
+        if error is None:
+            try:
+                response.raise_for_status()
+                return ClientResult(
+                    success=True,
+                    data=ScreenResponse.from_dict(_json(response)),
+                    response_time_ms=elapsed_ms,
+                ), health
+            except RequestException as e:
+                error = f"Request error: {e}"
+            except (KeyError, ValueError) as e:
+                error = f"Invalid response format: {e}"
+
+        return ClientResult(success=False, error=error, response_time_ms=elapsed_ms), health
 
     def fetch_analyze(
         self,
@@ -160,7 +345,6 @@ class LHClient:
                     from_cache=True,
                 )
 
-        url = f"{self.base_url}/analyze"
         params = {
             "symbol": symbol,
             "tf": "1D",
@@ -168,67 +352,33 @@ class LHClient:
             "market": market,
         }
 
-        start_time = time.time()
-        try:
-            response = requests.get(url, params=params, timeout=self.timeout)
-            elapsed_ms = (time.time() - start_time) * 1000
-
-            if response.status_code == 404:
-                return AnalyzeClientResult(
-                    success=False,
-                    error=f"Data not found for {symbol} in {market}",
-                    response_time_ms=elapsed_ms,
-                )
-
-            if response.status_code == 400:
-                error_detail = response.json().get("detail", "Bad request")
-                return AnalyzeClientResult(
-                    success=False,
-                    error=f"Invalid request: {error_detail}",
-                    response_time_ms=elapsed_ms,
-                )
-
-            response.raise_for_status()
-            data = response.json()
-            result = AnalyzeResult.from_dict(data)
-
-            # Cache the result
-            self.analysis_cache.put(symbol, market, result)
-
-            return AnalyzeClientResult(
-                success=True,
-                data=result,
-                response_time_ms=elapsed_ms,
-                from_cache=False,
-            )
-        except ConnectionError:
-            elapsed_ms = (time.time() - start_time) * 1000
-            return AnalyzeClientResult(
-                success=False,
-                error="Server unavailable",
-                response_time_ms=elapsed_ms,
-            )
-        except Timeout:
-            elapsed_ms = (time.time() - start_time) * 1000
-            return AnalyzeClientResult(
-                success=False,
-                error=f"Request timed out after {self.timeout}s",
-                response_time_ms=elapsed_ms,
-            )
-        except RequestException as e:
-            elapsed_ms = (time.time() - start_time) * 1000
-            return AnalyzeClientResult(
-                success=False,
-                error=f"Request error: {e}",
-                response_time_ms=elapsed_ms,
-            )
-        except (KeyError, ValueError) as e:
-            elapsed_ms = (time.time() - start_time) * 1000
-            return AnalyzeClientResult(
-                success=False,
-                error=f"Invalid response format: {e}",
-                response_time_ms=elapsed_ms,
-            )
+        response, error, elapsed_ms = self._request("/analyze", params)
+        if error is None:
+            try:
+                if response.status_code == 404:
+                    error = f"Data not found for {symbol} in {market}"
+                elif response.status_code == 400:
+                    error_detail = _json(response).get("detail", "Bad request")
+                    error = f"Invalid request: {error_detail}"
+                else:
+                    response.raise_for_status()
+                    result = AnalyzeResult.from_dict(_json(response))
+
+                    # Cache the result
+                    self.analysis_cache.put(symbol, market, result)
+
+                    return AnalyzeClientResult(
+                        success=True,
+                        data=result,
+                        response_time_ms=elapsed_ms,
+                        from_cache=False,
+                    )
+            except RequestException as e:
+                error = f"Request error: {e}"
+            except (KeyError, ValueError) as e:
+                error = f"Invalid response format: {e}"
+
+        return AnalyzeClientResult(success=False, error=error, response_time_ms=elapsed_ms)
 
     def clear_analysis_cache(self) -> int:
         """Clear the analysis cache.
@@ -252,66 +402,43 @@ class LHClient:
         Returns:
             ServerHealth with detailed status information
         """
-        url = f"{self.base_url}/screen"
         params = {"market": market, "top_n": 1}  # Minimal request
 
-        start_time = time.time()
-        try:
-            response = requests.get(url, params=params, timeout=5)
-            elapsed_ms = (time.time() - start_time) * 1000
+        response, error, elapsed_ms = self._request(
+            "/screen",
+            params,
+            timeout=5,
+            connect_error="Connection refused - server not running",
+            timeout_error="Connection timed out",
+        )
+        return self._screen_health(market, response, error, elapsed_ms)
 
-            if response.status_code == 200:
-                return ServerHealth(
-                    is_healthy=True,
-                    status_code=response.status_code,
-                    response_time_ms=elapsed_ms,
-                    message=f"/screen endpoint OK for {market}",
-                    base_url=url,
-                )
-            elif response.status_code == 422:
-                # Validation error - server is up but request issue
-                return ServerHealth(
-                    is_healthy=True,
-                    status_code=response.status_code,
-                    response_time_ms=elapsed_ms,
-                    message="Server reachable (validation error)",
-                    base_url=url,
-                )
-            else:
-                return ServerHealth(
-                    is_healthy=False,
-                    status_code=response.status_code,
-                    response_time_ms=elapsed_ms,
-                    message=f"Endpoint error: HTTP {response.status_code}",
-                    base_url=url,
-                )
-        except ConnectionError:
-            elapsed_ms = (time.time() - start_time) * 1000
-            return ServerHealth(
-                is_healthy=False,
-                status_code=None,
-                response_time_ms=elapsed_ms,
-                message="Connection refused - server not running",
-                base_url=url,
-            )
-        except Timeout:
-            elapsed_ms = (time.time() - start_time) * 1000
-            return ServerHealth(
-                is_healthy=False,
-                status_code=None,
-                response_time_ms=elapsed_ms,
-                message="Connection timed out",
-                base_url=url,
-            )
-        except RequestException as e:
-            elapsed_ms = (time.time() - start_time) * 1000
-            return ServerHealth(
-                is_healthy=False,
-                status_code=None,
-                response_time_ms=elapsed_ms,
-                message=str(e),
-                base_url=url,
-            )
+    def _screen_health(
+        self,
+        market: str,
+        response: Optional[requests.Response],
+        error: Optional[str],
+        elapsed_ms: float,
+    ) -> ServerHealth:
+        """ServerHealth for the outcome of a /screen request."""
+        if error is not None:
+            is_healthy, status_code, message = False, None, error
+        elif response.status_code == 200:
+            is_healthy, status_code, message = True, 200, f"/screen endpoint OK for {market}"
+        elif response.status_code == 422:
+            # Validation error - server is up but request issue
+            is_healthy, status_code, message = True, 422, "Server reachable (validation error)"
+        else:
+            status_code = response.status_code
+            is_healthy, message = False, f"Endpoint error: HTTP {status_code}"
+
+        return ServerHealth(
+            is_healthy=is_healthy,
+            status_code=status_code,
+            response_time_ms=elapsed_ms,
+            message=message,
+            base_url=f"{self.base_url}/screen",
+        )
 
     def test_endpoint(self, endpoint: str) -> ServerHealth:
         """Test a specific endpoint.
@@ -322,27 +449,28 @@ class LHClient:
         Returns:
             ServerHealth with test results
         """
-        url = f"{self.base_url}{endpoint}"
-        start_time = time.time()
-        try:
-            # Use HEAD if possible, fall back to GET
-            response = requests.head(url, timeout=5)
-            if response.status_code == 405:  # Method not allowed, try GET
-                response = requests.get(url, timeout=5)
-            elapsed_ms = (time.time() - start_time) * 1000
-            return ServerHealth(
-                is_healthy=response.status_code < 500,
-                status_code=response.status_code,
-                response_time_ms=elapsed_ms,
-                message=f"Endpoint {endpoint}: HTTP {response.status_code}",
-                base_url=url,
-            )
-        except Exception as e:
-            elapsed_ms = (time.time() - start_time) * 1000
-            return ServerHealth(
-                is_healthy=False,
-                status_code=None,
-                response_time_ms=elapsed_ms,
-                message=str(e),
-                base_url=url,
-            )
+        # Use HEAD if possible, fall back to GET; remember endpoints that
+        # reject HEAD so later checks skip the extra round trip
+        elapsed_ms = 0.0
+        if self._head_supported.get(endpoint, True):
+            response, error, elapsed_ms = self._request(endpoint, timeout=5, method="HEAD")
+            if error is None:
+                self._head_supported[endpoint] = response.status_code != 405
+        if not self._head_supported.get(endpoint, True):  # Method not allowed, use GET
+            response, error, get_ms = self._request(endpoint, timeout=5)
+            elapsed_ms += get_ms
+
+        if error is not None:
+            is_healthy, status_code, message = False, None, error
+        else:
+            status_code = response.status_code
+            is_healthy = status_code < 500
+            message = f"Endpoint {endpoint}: HTTP {status_code}"
+
+        return ServerHealth(
+            is_healthy=is_healthy,
+            status_code=status_code,
+            response_time_ms=elapsed_ms,
+            message=message,
+            base_url=f"{self.base_url}{endpoint}",
+        )
@@ -4,8 +4,11 @@ This module scans the local filesystem to compute coverage statistics
 WITHOUT using any engine code. It operates entirely on file I/O.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from .models import CoverageInfo, SymbolStatus
 
@@ -13,6 +16,47 @@ from .models import CoverageInfo, SymbolStatus
 # Minimum rows required for sufficient data (EMA200 needs ~200 bars)
 MIN_ROWS_REQUIRED = 250
 
+# Shortest possible daily row: "YYYY-MM-DD,o,h,l,c,v\n" with one-digit
+# fields is 21 bytes, and real rows are longer. A CSV smaller than
+# MIN_ROWS_REQUIRED * MIN_BYTES_PER_ROW therefore cannot hold enough rows
+# and is marked insufficient from its size alone (row_count=-1).
+MIN_BYTES_PER_ROW = 21
+
+# Daily CSV file name suffix ({symbol}_1D.csv)
+CSV_SUFFIX = "_1D.csv"
+
+# Bytes per read when counting CSV rows
+READ_CHUNK = 1 << 20
+
+# Threads scanning CSVs in parallel (the work is disk I/O bound)
+MAX_WORKERS = 32
+
+# Last CoverageInfo per (data_root, market), stamped with the watchlist
+# and market directory mtimes it was computed from
+_coverage_cache: Dict[Tuple[str, str], Tuple[Tuple[int, int], CoverageInfo]] = {}
+
+
+def clear_coverage_cache(market: Optional[str] = None) -> None:
+    """Drop cached coverage for one market (all markets if None).
+
+    Call after CSVs may have been rewritten in place: that changes row
+    counts without touching the directory mtime the cache checks.
+    """
+    if market is None:
+        _coverage_cache.clear()
+        return
+    market_lower = market.lower()
+    for key in [k for k in list(_coverage_cache) if k[1] == market_lower]:
+        del _coverage_cache[key]
+
+
+def _mtime_ns(path: Path) -> int:
+    """Modification time in ns (0 if the path doesn't exist)."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
 
 def _read_watchlist(watchlist_path: Path) -> List[str]:
     """Read symbols from a watchlist file.
@@ -35,57 +79,69 @@ def _read_watchlist(watchlist_path: Path) -> List[str]:
     return symbols
 
 
-def _count_csv_rows(csv_path: Path) -> int:
+def _count_csv_rows(csv_path: Path | str, limit: int | None = None) -> int:
     """Count data rows in a CSV file (excluding header).
 
+    Counts newline bytes in large binary chunks instead of iterating
+    decoded lines. With a limit, counting stops once `limit` rows are
+    seen and `limit` is returned, which is all a `>=` check needs.
+
     Args:
         csv_path: Path to CSV file
+        limit: Optional row count at which to stop counting
 
     Returns:
-        Number of data rows (0 if file doesn't exist)
+        Number of data rows, capped at limit (0 if file doesn't exist)
     """
-    if not csv_path.exists():
+    lines = 0
+    last = b"\n"
+    try:
+        with open(csv_path, "rb") as f:
+            read = f.read
+            while chunk := read(READ_CHUNK):
+                lines += chunk.count(b"\n")
+                last = chunk[-1:]
+                if limit is not None and lines > limit:
+                    return limit
+    except FileNotFoundError:
         return 0
+    if last != b"\n":
+        lines += 1  # Final line without a trailing newline
+    rows = max(0, lines - 1)  # Skip header
+    return rows if limit is None else min(rows, limit)
 
-    count = 0
-    with open(csv_path, "r") as f:
-        # Skip header
-        next(f, None)
-        for _ in f:
-            count += 1
-    return count
 
-
-def _find_csv_for_symbol(data_dir: Path, symbol: str) -> Path | None:
-    """Find the CSV file for a symbol.
-
-    Looks for {symbol}_1D.csv in the data directory.
+def _scan_csv_files(data_dir: Path) -> Dict[str, os.DirEntry]:
+    """Map symbols to their CSV entries with one directory read.
 
     Args:
-        data_dir: Directory containing CSV files
-        symbol: Stock symbol
+        data_dir: Directory containing {symbol}_1D.csv files
 
     Returns:
-        Path to CSV if found, None otherwise
+        Dict of symbol -> os.DirEntry (empty if the directory doesn't exist)
     """
-    csv_path = data_dir / f"{symbol}_1D.csv"
-    if csv_path.exists():
-        return csv_path
-    return None
-
-
-def _analyze_symbol(data_dir: Path, symbol: str) -> SymbolStatus:
+    entries: Dict[str, os.DirEntry] = {}
+    try:
+        with os.scandir(data_dir) as it:
+            for entry in it:
+                if entry.name.endswith(CSV_SUFFIX):
+                    entries[entry.name[:-len(CSV_SUFFIX)]] = entry
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return entries
+
+
+def _analyze_symbol(symbol: str, entry: Optional[os.DirEntry]) -> SymbolStatus:
     """Analyze a single symbol's data status.
 
     Args:
-        data_dir: Directory containing CSV files
         symbol: Stock symbol
+        entry: Directory entry of the symbol's CSV (None if missing)
 
     Returns:
         SymbolStatus with availability details
     """
-    csv_path = _find_csv_for_symbol(data_dir, symbol)
-    if csv_path is None:
+    if entry is None:
         return SymbolStatus(
             symbol=symbol,
             has_csv=False,
@@ -93,7 +149,21 @@ def _analyze_symbol(data_dir: Path, symbol: str) -> SymbolStatus:
             is_sufficient=False,
         )
 
-    row_count = _count_csv_rows(csv_path)
+    try:
+        size = entry.stat().st_size
+    except FileNotFoundError:
+        size = 0
+    if size < MIN_ROWS_REQUIRED * MIN_BYTES_PER_ROW:
+        # Too small to be sufficient; skip reading it
+        return SymbolStatus(
+            symbol=symbol,
+            has_csv=True,
+            row_count=-1,
+            is_sufficient=False,
+        )
+
+    # Only insufficient counts are displayed, so stop at the threshold
+    row_count = _count_csv_rows(entry.path, limit=MIN_ROWS_REQUIRED)
     return SymbolStatus(
         symbol=symbol,
         has_csv=True,
@@ -111,6 +181,9 @@ def compute_coverage(data_root: Path, market: str) -> CoverageInfo:
         data_root: Root data directory (e.g., /path/to/data/)
         market: Market code (KR or US)
 
+    Results are cached until the watchlist or the market directory changes
+    (adding or removing CSVs); see clear_coverage_cache().
+
     Returns:
         CoverageInfo with computed statistics and detailed symbol lists
     """
@@ -120,17 +193,31 @@ def compute_coverage(data_root: Path, market: str) -> CoverageInfo:
     watchlist_path = data_root / f"{market_lower}_watchlist.txt"
     market_data_dir = data_root / market_lower
 
+    cache_key = (str(data_root), market_lower)
+    stamp = (_mtime_ns(watchlist_path), _mtime_ns(market_data_dir))
+    cached = _coverage_cache.get(cache_key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
     # Read watchlist
     symbols = _read_watchlist(watchlist_path)
     selected_size = len(symbols)
+    csv_entries = _scan_csv_files(market_data_dir)
 
     # Analyze each symbol
     missing_symbols: List[str] = []
     insufficient_symbols: List[SymbolStatus] = []
     ready_symbols: List[str] = []
 
-    for symbol in symbols:
-        status = _analyze_symbol(market_data_dir, symbol)
+    statuses: List[SymbolStatus] = []
+    if symbols:
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(symbols))) as ex:
+            statuses = list(ex.map(
+                lambda s: _analyze_symbol(s, csv_entries.get(s)), symbols
+            ))
+
+    # Bucket in watchlist order
+    for symbol, status in zip(symbols, statuses):
         if not status.has_csv:
             missing_symbols.append(symbol)
         elif not status.is_sufficient:
@@ -142,7 +229,7 @@ def compute_coverage(data_root: Path, market: str) -> CoverageInfo:
     missing_count = len(missing_symbols)
     insufficient_data_count = len(insufficient_symbols)
 
-    return CoverageInfo(
+    coverage = CoverageInfo(
         selected_size=selected_size,
         available_count=available_count,
         missing_count=missing_count,
@@ -151,11 +238,16 @@ def compute_coverage(data_root: Path, market: str) -> CoverageInfo:
         insufficient_symbols=insufficient_symbols,
         ready_symbols=ready_symbols,
     )
+    _coverage_cache[cache_key] = (stamp, coverage)
+    return coverage
 
 
+@cache
 def get_data_root() -> Path:
     """Get the data root directory.
 
+    Resolved once per process; later calls return the same Path.
+
     Returns:
         Path to data/ directory relative to project root
     """
@@ -1,9 +1,17 @@
 """Main PySide6 window for the diagnostic desktop app."""
 
-from datetime import datetime
-from typing import List, Optional
-
-from PySide6.QtCore import Qt, QThread, Signal
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from PySide6.QtCore import (
+    QObject,
+    QRunnable,
+    QSortFilterProxyModel,
+    Qt,
+    QThreadPool,
+    Signal,
+)
 from PySide6.QtGui import QFont, QKeySequence, QShortcut
 from PySide6.QtWidgets import (
     QApplication,
@@ -12,21 +20,21 @@ from PySide6.QtWidgets import (
     QHeaderView,
     QLabel,
     QListWidget,
-    QListWidgetItem,
     QMainWindow,
+    QMenu,
     QMessageBox,
     QPushButton,
     QSplitter,
     QStatusBar,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
 from .client import LHClient
-from .coverage import compute_coverage, get_data_root
+from .coverage import clear_coverage_cache, compute_coverage, get_data_root
 from .models import CoverageInfo, ScreenResponse, ScreenResult, ScanMode
+from .results_model import SORT_ROLE, ScreenResultsModel
 from .widgets import (
     CoverageCard,
     CoverageDetailDialog,
@@ -38,51 +46,59 @@ from .widgets import (
     WatchlistEditorDialog,
 )
 
+# "Last refresh" timestamp format
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
 
-class FetchWorker(QThread):
-    """Background worker for fetching screen data."""
-
-    finished = Signal(object)  # ClientResult
+# Widget stylesheets
+MODE_INDICATOR_CSS = (
+    "background: #3498db; color: white; padding: 6px 18px; "
+    "border-radius: 4px; font-weight: bold;"
+)
+MARKET_INDICATOR_CSS = (
+    "background: #2ecc71; color: white; padding: 6px 18px; "
+    "border-radius: 4px; font-weight: bold;"
+)
+DISCLAIMER_CSS = (
+    "color: #999; font-size: 9px; "
+    "border-top: 1px solid #ccc; padding-top: 10px;"
+)
+CLEAR_CACHE_BTN_CSS = "font-size: 10px;"
+ZOOM_LABEL_CSS = "color: #666;"
+SERVER_OK_CSS = "color: green;"
+SERVER_ERROR_CSS = "color: red;"
 
-    def __init__(self, client: LHClient, market: str):
-        super().__init__()
-        self.client = client
-        self.market = market
 
-    def run(self):
-        result = self.client.fetch_screen(self.market)
-        self.finished.emit(result)
+class WorkerSignals(QObject):
+    """Signals for pool workers (QRunnable is not a QObject)."""
 
+    finished = Signal(object)
 
-class HealthCheckWorker(QThread):
-    """Background worker for health checks."""
 
-    finished = Signal(object)  # ServerHealth
+class Worker(QRunnable):
+    """Runs fn(*args) on the thread pool and emits its return value."""
 
-    def __init__(self, client: LHClient, market: str = "KR"):
+    def __init__(self, fn: Callable, *args):
         super().__init__()
-        self.client = client
-        self.market = market
+        self.signals = WorkerSignals()  # finished(fn's return value)
+        self.fn = fn
+        self.args = args
 
     def run(self):
-        health = self.client.check_health(self.market)
-        self.finished.emit(health)
-
+        self.signals.finished.emit(self.fn(*self.args))
 
-class AnalyzeWorker(QThread):
-    """Background worker for OB analysis."""
 
-    finished = Signal(object)  # AnalyzeClientResult
+def _analyze(client: LHClient, symbol: str, market: str):
+    """((symbol, market), AnalyzeClientResult) for an analyze Worker."""
+    return (symbol, market), client.fetch_analyze(symbol, market)
 
-    def __init__(self, client: LHClient, symbol: str, market: str):
-        super().__init__()
-        self.client = client
-        self.symbol = symbol
-        self.market = market
 
-    def run(self):
-        result = self.client.fetch_analyze(self.symbol, self.market)
-        self.finished.emit(result)
+def _scan_coverage(data_root: Path, market: str, seq: int):
+    """(seq, market, CoverageInfo or None) for a coverage Worker."""
+    try:
+        coverage = compute_coverage(data_root, market)
+    except Exception:
+        coverage = None
+    return seq, market, coverage
 
 
 class MainWindow(QMainWindow):
@@ -95,15 +111,25 @@ class MainWindow(QMainWindow):
     SCALE_STEP = 0.1
     BASE_FONT_SIZE = 13  # Default macOS font size
 
+    # Market list rows, in order (on_market_changed maps rows back)
+    MARKETS = ("KR", "US")
+    MODE_LABELS = {mode: f"Mode: {mode.value}" for mode in ScanMode}
+
     def __init__(self):
         super().__init__()
-        self.client = LHClient()
+        self._data_root = get_data_root()  # Fixed for the session
+        self.client = LHClient(cache_dir=self._data_root / "cache" / "analysis")
+        self.pool = QThreadPool.globalInstance()  # Runs the workers below
         self.current_market = "KR"
         self.current_scan_mode = ScanMode.WATCHLIST_ONLY
-        self.worker: Optional[FetchWorker] = None
-        self.health_worker: Optional[HealthCheckWorker] = None
-        self.analyze_worker: Optional[AnalyzeWorker] = None
+        # In-flight workers (None when idle)
+        self.worker: Optional[Worker] = None  # Screen fetch
+        self.health_worker: Optional[Worker] = None
+        # (symbol, market) -> in-flight analysis; a request is never doubled
+        self._pending_analyses: Dict[Tuple[str, str], Worker] = {}
         self.current_coverage: Optional[CoverageInfo] = None
+        self._coverage_seq = 0  # Latest coverage scan; older results are stale
+        self._banner_candidates: Optional[int] = None  # Set while a fetch awaits coverage
         self.current_results: List[ScreenResult] = []
         self.coverage_dialog: Optional[CoverageDetailDialog] = None
         self.watchlist_dialog: Optional[WatchlistEditorDialog] = None
@@ -172,13 +198,22 @@ class MainWindow(QMainWindow):
         self.candidates_label = QLabel("Candidates: -")
         self.cache_label = QLabel("Cache: 0")
         self.zoom_label = QLabel("Zoom: 100%")
-        self.zoom_label.setStyleSheet("color: #666;")
+        self.zoom_label.setStyleSheet(ZOOM_LABEL_CSS)
         self.status_bar.addWidget(self.connection_label)
         self.status_bar.addWidget(self.candidates_label)
         self.status_bar.addWidget(self.cache_label)
         self.status_bar.addWidget(self.zoom_label)
         self.status_bar.addPermanentWidget(self.timestamp_label)
 
+    def closeEvent(self, event):
+        """Close the HTTP pool and flush the on-disk analysis cache.
+
+        __main__ exits with os._exit, so this is the only point where the
+        persisted analyses are written out.
+        """
+        self.client.close()
+        super().closeEvent(event)
+
     def setup_zoom_shortcuts(self):
         """Set up keyboard shortcuts for zoom controls."""
         # Cmd+Plus (Cmd+=) to zoom in
@@ -236,10 +271,10 @@ class MainWindow(QMainWindow):
                 * {{
                     font-size: {scaled_font_size}pt;
                 }}
-                QTableWidget {{
+                QTableView {{
                     font-size: {scaled_font_size}pt;
                 }}
-                QTableWidget::item {{
+                QTableView::item {{
                     padding: {int(5 * self._scale_factor)}px;
                 }}
                 QHeaderView::section {{
@@ -301,10 +336,7 @@ class MainWindow(QMainWindow):
         self.market_list = QListWidget()
         self.market_list.setMaximumHeight(70)
 
-        kr_item = QListWidgetItem("KR")
-        us_item = QListWidgetItem("US")
-        self.market_list.addItem(kr_item)
-        self.market_list.addItem(us_item)
+        self.market_list.addItems(self.MARKETS)
 
         self.market_list.setCurrentRow(0)
         self.market_list.currentRowChanged.connect(self.on_market_changed)
@@ -348,7 +380,7 @@ class MainWindow(QMainWindow):
 
         # Clear cache button
         self.clear_cache_btn = QPushButton("Clear Analysis Cache")
-        self.clear_cache_btn.setStyleSheet("font-size: 10px;")
+        self.clear_cache_btn.setStyleSheet(CLEAR_CACHE_BTN_CSS)
         self.clear_cache_btn.clicked.connect(self.on_clear_cache_clicked)
         layout.addWidget(self.clear_cache_btn)
 
@@ -360,10 +392,7 @@ class MainWindow(QMainWindow):
             "No trading functionality"
         )
         disclaimer.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        disclaimer.setStyleSheet(
-            "color: #999; font-size: 9px; "
-            "border-top: 1px solid #ccc; padding-top: 10px;"
-        )
+        disclaimer.setStyleSheet(DISCLAIMER_CSS)
         layout.addWidget(disclaimer)
 
         return sidebar
@@ -379,18 +408,12 @@ class MainWindow(QMainWindow):
         # Top bar with scan mode indicator
         top_bar = QHBoxLayout()
         self.mode_indicator = QLabel("Mode: WATCHLIST_ONLY")
-        self.mode_indicator.setStyleSheet(
-            "background: #3498db; color: white; padding: 6px 18px; "
-            "border-radius: 4px; font-weight: bold;"
-        )
+        self.mode_indicator.setStyleSheet(MODE_INDICATOR_CSS)
         top_bar.addWidget(self.mode_indicator)
         top_bar.addStretch()
 
         self.market_indicator = QLabel("Market: KR")
-        self.market_indicator.setStyleSheet(
-            "background: #2ecc71; color: white; padding: 6px 18px; "
-            "border-radius: 4px; font-weight: bold;"
-        )
+        self.market_indicator.setStyleSheet(MARKET_INDICATOR_CSS)
         top_bar.addWidget(self.market_indicator)
         layout.addLayout(top_bar)
 
@@ -431,30 +454,38 @@ class MainWindow(QMainWindow):
         results_layout = QVBoxLayout(results_group)
         results_layout.setContentsMargins(8, 12, 8, 8)
 
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(9)
-        self.results_table.setHorizontalHeaderLabels([
-            "Symbol", "Score", "Days to Cross", "Last Close",
-            "EMA20", "EMA200", "Gap", "Slope Diff", "Reason"
-        ])
+        # Cells come from the model; sorting only reorders proxy indices
+        self.results_model = ScreenResultsModel(self)
+        self.results_proxy = QSortFilterProxyModel(self)
+        self.results_proxy.setSourceModel(self.results_model)
+        self.results_proxy.setSortRole(SORT_ROLE)
+
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_proxy)
 
         # Configure table for professional appearance
         header = self.results_table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         header.setStretchLastSection(True)
         header.setMinimumSectionSize(60)
+        # Widths are measured once (first results) or on request, never per refresh
+        self._columns_sized = False
+        header.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        header.customContextMenuRequested.connect(self.show_header_menu)
 
         self.results_table.setAlternatingRowColors(True)
         self.results_table.setSelectionBehavior(
-            QTableWidget.SelectionBehavior.SelectRows
+            QTableView.SelectionBehavior.SelectRows
         )
         self.results_table.setSelectionMode(
-            QTableWidget.SelectionMode.SingleSelection
+            QTableView.SelectionMode.SingleSelection
         )
         self.results_table.setSortingEnabled(True)
         self.results_table.setShowGrid(True)
         self.results_table.verticalHeader().setVisible(False)
-        self.results_table.itemSelectionChanged.connect(self.on_row_selected)
+        self.results_table.selectionModel().selectionChanged.connect(
+            self.on_row_selected
+        )
 
         results_layout.addWidget(self.results_table)
         layout.addWidget(results_group, stretch=1)
@@ -463,45 +494,79 @@ class MainWindow(QMainWindow):
 
     def check_server_health(self):
         """Check if the backend server is reachable."""
-        if self.health_worker is not None and self.health_worker.isRunning():
+        if self.health_worker is not None:
             return
 
         self.health_panel.set_checking()
-        self.health_worker = HealthCheckWorker(self.client, self.current_market)
-        self.health_worker.finished.connect(self.on_health_check_finished)
-        self.health_worker.start()
+        self.health_worker = Worker(self.client.check_health, self.current_market)
+        self.health_worker.signals.finished.connect(self.on_health_check_finished)
+        self.pool.start(self.health_worker)
 
     def on_health_check_finished(self, health):
         """Handle health check completion."""
+        self.health_worker = None
         self.health_panel.update_health(health)
         self.health_panel.set_ready()
 
         if health.is_healthy:
-            self.connection_label.setText("Server: OK")
-            self.connection_label.setStyleSheet("color: green;")
+            self.set_connection_status("Server: OK", SERVER_OK_CSS)
             # Don't override state banner if we have results
             if not self.current_results:
                 self.state_banner.show_ready()
         else:
-            self.connection_label.setText(f"Server: {health.message[:30]}")
-            self.connection_label.setStyleSheet("color: red;")
+            self.set_connection_status(f"Server: {health.message[:30]}", SERVER_ERROR_CSS)
             self.state_banner.show_server_disconnected(health.message)
 
+    def set_connection_status(self, text: str, css: str):
+        """Update the status bar server label.
+
+        The stylesheet is only re-applied when it changes: every
+        setStyleSheet call re-polishes the widget.
+        """
+        self.connection_label.setText(text)
+        if self.connection_label.styleSheet() != css:
+            self.connection_label.setStyleSheet(css)
+
     def update_coverage(self):
-        """Update coverage cards from local files."""
+        """Show coverage for the current market.
+
+        Coverage is computed on the pool (compute_coverage returns its
+        cached result while the market's files are unchanged) and the cards
+        update in on_coverage_ready; until then current_coverage is None.
+        """
+        self._coverage_seq += 1
+        self._banner_candidates = None
+
+        self.current_coverage = None
+        worker = Worker(_scan_coverage, self._data_root, self.current_market, self._coverage_seq)
+        worker.signals.finished.connect(self.on_coverage_ready)
+        self.pool.start(worker)
+
+    def on_coverage_ready(self, outcome):
+        """Show computed coverage (results of superseded scans are dropped)."""
+        seq, market, coverage = outcome
+        if seq != self._coverage_seq:
+            return
+
+        self.current_coverage = coverage
+        self.setUpdatesEnabled(False)
         try:
-            data_root = get_data_root()
-            self.current_coverage = compute_coverage(data_root, self.current_market)
-            self.display_coverage(self.current_coverage)
-            self.data_status_panel.update_from_coverage(self.current_coverage)
-        except Exception as e:
-            self.current_coverage = None
-            self.card_selected.set_value("-")
-            self.card_available.set_value("-")
-            self.card_missing.set_value("-")
-            self.card_insufficient.set_value("-")
-            self.card_ready.set_value("-")
-            self.data_status_panel.update_from_coverage(None)
+            if coverage is not None:
+                self.display_coverage(coverage)
+            else:
+                self.card_selected.set_value("-")
+                self.card_available.set_value("-")
+                self.card_missing.set_value("-")
+                self.card_insufficient.set_value("-")
+                self.card_ready.set_value("-")
+            self.data_status_panel.update_from_coverage(coverage)
+
+            # A finished fetch waits for coverage to pick its banner
+            if self._banner_candidates is not None:
+                self._update_state_banner(self._banner_candidates)
+                self._banner_candidates = None
+        finally:
+            self.setUpdatesEnabled(True)
 
     def display_coverage(self, coverage: CoverageInfo):
         """Display coverage statistics in cards."""
@@ -533,13 +598,11 @@ class MainWindow(QMainWindow):
 
     def on_market_changed(self, row: int):
         """Handle market selection change."""
-        markets = ["KR", "US"]
-        if 0 <= row < len(markets):
-            self.current_market = markets[row]
+        if 0 <= row < len(self.MARKETS):
+            self.current_market = self.MARKETS[row]
             self.market_indicator.setText(f"Market: {self.current_market}")
             self.update_coverage()
-            self.results_table.setRowCount(0)
-            self.current_results = []
+            self.clear_results()
             self.detail_drawer.clear()
             self.candidates_label.setText("Candidates: -")
             self.state_banner.show_ready()
@@ -549,51 +612,59 @@ class MainWindow(QMainWindow):
     def on_scan_mode_changed(self, mode: ScanMode):
         """Handle scan mode change."""
         self.current_scan_mode = mode
-        self.mode_indicator.setText(f"Mode: {mode.value}")
+        self.mode_indicator.setText(self.MODE_LABELS[mode])
 
     def on_refresh_clicked(self):
         """Handle refresh button click."""
-        if self.worker is not None and self.worker.isRunning():
+        if self.worker is not None:
             return
 
         self.refresh_btn.setEnabled(False)
         self.refresh_btn.setText("Loading...")
         self.state_banner.show_loading()
 
-        self.worker = FetchWorker(self.client, self.current_market)
-        self.worker.finished.connect(self.on_fetch_finished)
-        self.worker.start()
+        self.worker = Worker(self.client.fetch_screen_with_health, self.current_market)
+        self.worker.signals.finished.connect(self.on_fetch_finished)
+        self.pool.start(self.worker)
 
-    def on_fetch_finished(self, result):
+    def on_fetch_finished(self, outcome):
         """Handle fetch completion."""
-        self.refresh_btn.setEnabled(True)
-        self.refresh_btn.setText("Refresh Data")
-
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.timestamp_label.setText(f"Last refresh: {timestamp}")
-
-        # Update coverage first so we have the latest data
-        self.update_coverage()
+        # Apply all widget changes below in one repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self.worker = None
+            result, health = outcome
+            # The fetch doubles as a health check
+            self.health_panel.update_health(health)
+            self.refresh_btn.setEnabled(True)
+            self.refresh_btn.setText("Refresh Data")
+
+            timestamp = time.strftime(TIMESTAMP_FORMAT)
+            self.timestamp_label.setText(f"Last refresh: {timestamp}")
+
+            # Rescan coverage so the banner reflects the latest data
+            # (the fetch may have rewritten CSVs in place)
+            clear_coverage_cache(self.current_market)
+            self.update_coverage()
 
-        if result.success:
-            self.display_results(result.data)
-            self.connection_label.setText("Server: OK")
-            self.connection_label.setStyleSheet("color: green;")
+            if result.success:
+                self.display_results(result.data)
+                self.set_connection_status("Server: OK", SERVER_OK_CSS)
 
-            candidate_count = len(result.data.candidates)
-            self.candidates_label.setText(f"Candidates: {candidate_count}")
+                candidate_count = len(result.data.candidates)
+                self.candidates_label.setText(f"Candidates: {candidate_count}")
 
-            # Update state banner based on results and coverage
-            self._update_state_banner(candidate_count)
-        else:
-            self.connection_label.setText(f"Server: {result.error[:30]}")
-            self.connection_label.setStyleSheet("color: red;")
-            self.results_table.setRowCount(0)
-            self.current_results = []
-            self.candidates_label.setText("Candidates: Error")
-            self.state_banner.show_server_disconnected(result.error)
+                # Update state banner once the coverage scan above lands
+                self._banner_candidates = candidate_count
+            else:
+                self.set_connection_status(f"Server: {result.error[:30]}", SERVER_ERROR_CSS)
+                self.clear_results()
+                self.candidates_label.setText("Candidates: Error")
+                self.state_banner.show_server_disconnected(result.error)
 
-        self.update_cache_label()
+            self.update_cache_label()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _update_state_banner(self, candidate_count: int):
         """Update state banner based on results and coverage."""
@@ -619,91 +690,59 @@ class MainWindow(QMainWindow):
     def display_results(self, response: ScreenResponse):
         """Display screening results in the table."""
         self.current_results = response.candidates
-        candidates = response.candidates
-        self.results_table.setSortingEnabled(False)
-        self.results_table.setRowCount(len(candidates))
-
-        for row, candidate in enumerate(candidates):
-            # Store the candidate index for later retrieval
-            symbol_item = QTableWidgetItem(candidate.symbol)
-            symbol_item.setData(Qt.ItemDataRole.UserRole, row)
-            self.results_table.setItem(row, 0, symbol_item)
-
-            # Score as numeric for sorting
-            score_item = QTableWidgetItem()
-            score_item.setData(Qt.ItemDataRole.EditRole, candidate.score)
-            self.results_table.setItem(row, 1, score_item)
-
-            # Days to cross
-            dtc_item = QTableWidgetItem()
-            if candidate.days_to_cross is not None:
-                dtc_item.setData(Qt.ItemDataRole.EditRole, candidate.days_to_cross)
-            else:
-                dtc_item.setText("-")
-            self.results_table.setItem(row, 2, dtc_item)
-
-            # Price values
-            close_item = QTableWidgetItem()
-            close_item.setData(Qt.ItemDataRole.EditRole, candidate.last_close)
-            self.results_table.setItem(row, 3, close_item)
-
-            ema20_item = QTableWidgetItem()
-            ema20_item.setData(Qt.ItemDataRole.EditRole, candidate.ema20)
-            self.results_table.setItem(row, 4, ema20_item)
-
-            ema200_item = QTableWidgetItem()
-            ema200_item.setData(Qt.ItemDataRole.EditRole, candidate.ema200)
-            self.results_table.setItem(row, 5, ema200_item)
-
-            # Gap and slope diff
-            gap_item = QTableWidgetItem()
-            gap_item.setData(Qt.ItemDataRole.EditRole, round(candidate.gap, 4))
-            self.results_table.setItem(row, 6, gap_item)
-
-            slope_item = QTableWidgetItem()
-            slope_item.setData(Qt.ItemDataRole.EditRole, round(candidate.slope_diff, 6))
-            self.results_table.setItem(row, 7, slope_item)
-
-            self.results_table.setItem(
-                row, 8, QTableWidgetItem(candidate.reason)
-            )
-
-        self.results_table.setSortingEnabled(True)
+        self.results_model.set_rows(response.candidates)
+        if not self._columns_sized and response.candidates:
+            self.results_table.resizeColumnsToContents()
+            self._columns_sized = True
+
+    def show_header_menu(self, pos):
+        """Results header context menu (column auto-sizing)."""
+        menu = QMenu(self)
+        menu.addAction("Auto-size Columns", self.results_table.resizeColumnsToContents)
+        menu.exec(self.results_table.horizontalHeader().mapToGlobal(pos))
+
+    def clear_results(self):
+        """Empty the results table."""
+        self.current_results = []
+        self.results_model.set_rows([])
 
-    def on_row_selected(self):
+    def on_row_selected(self, selected=None, deselected=None):
         """Handle row selection in results table."""
-        selected = self.results_table.selectedItems()
-        if not selected:
+        # Single selection: at most one selected row
+        rows = self.results_table.selectionModel().selectedRows()[:1]
+        if not rows:
             self.detail_drawer.clear()
             return
 
-        # Get the row index from the first column's UserRole data
-        row = selected[0].row()
-        symbol_item = self.results_table.item(row, 0)
-        if symbol_item is None:
-            return
-
-        original_index = symbol_item.data(Qt.ItemDataRole.UserRole)
-        if original_index is not None and original_index < len(self.current_results):
-            result = self.current_results[original_index]
-            self.detail_drawer.show_result(result)
+        # Map the sorted view row back to the model's row
+        row = self.results_proxy.mapToSource(rows[0]).row()
+        self.detail_drawer.show_result(self.results_model.row_at(row))
 
     def on_load_analysis(self, symbol: str, market: str):
         """Handle request to load OB analysis."""
-        if self.analyze_worker is not None and self.analyze_worker.isRunning():
-            return
-
         self.detail_drawer.set_analysis_loading()
 
-        self.analyze_worker = AnalyzeWorker(self.client, symbol, market)
-        self.analyze_worker.finished.connect(self.on_analyze_finished)
-        self.analyze_worker.start()
+        key = (symbol, market)
+        if key in self._pending_analyses:
+            return  # Already in flight; its result will be shown
 
-    def on_analyze_finished(self, result):
+        worker = Worker(_analyze, self.client, symbol, market)
+        worker.signals.finished.connect(self.on_analyze_finished)
+        self._pending_analyses[key] = worker
+        self.pool.start(worker)
+
+    def on_analyze_finished(self, outcome):
         """Handle analysis completion."""
-        self.detail_drawer.set_analysis_ready()
+        key, result = outcome
+        self._pending_analyses.pop(key, None)
         self.update_cache_label()
 
+        # Only show it if that symbol is still selected (it is cached anyway)
+        current = self.detail_drawer.current_result
+        if current is None or (current.symbol, current.market) != key:
+            return
+
+        self.detail_drawer.set_analysis_ready()
         if result.success:
             self.detail_drawer.show_analysis_result(result.data, result.from_cache)
         else:
@@ -726,10 +765,9 @@ class MainWindow(QMainWindow):
 
     def on_edit_watchlist_clicked(self):
         """Open the watchlist editor dialog."""
-        from .coverage import get_data_root, get_watchlist_path
+        from .coverage import get_watchlist_path
 
-        data_root = get_data_root()
-        watchlist_path = get_watchlist_path(data_root, self.current_market)
+        watchlist_path = get_watchlist_path(self._data_root, self.current_market)
 
         self.watchlist_dialog = WatchlistEditorDialog(
             market=self.current_market,
@@ -741,9 +779,9 @@ class MainWindow(QMainWindow):
 
     def on_watchlist_saved(self):
         """Handle watchlist save - refresh coverage display."""
+        clear_coverage_cache(self.current_market)
         self.update_coverage()
-        self.results_table.setRowCount(0)
-        self.current_results = []
+        self.clear_results()
         self.detail_drawer.clear()
         self.candidates_label.setText("Candidates: -")
         self.state_banner.show_ready()
@@ -139,7 +139,7 @@ class SymbolStatus:
 
     symbol: str
     has_csv: bool
-    row_count: int
+    row_count: int  # -1 when not counted (file too small to be sufficient)
     is_sufficient: bool  # row_count >= MIN_ROWS_REQUIRED
 
     @property
@@ -147,6 +147,8 @@ class SymbolStatus:
         """Human-readable status."""
         if not self.has_csv:
             return "Missing CSV"
+        elif self.row_count < 0:
+            return "Insufficient (file too small)"
         elif not self.is_sufficient:
             return f"Insufficient ({self.row_count} rows)"
         else:
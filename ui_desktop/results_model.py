@@ -0,0 +1,143 @@
+"""Table model for screener results.
+
+Serves cells straight from the ScreenResult objects, so showing a new
+result set is one model reset instead of building an item per cell.
+Rows are exposed FETCH_BATCH at a time as the view scrolls (fetchMore).
+"""
+
+from typing import List, Optional
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from .models import ScreenResult
+
+
+# Rows exposed initially and per fetchMore
+FETCH_BATCH = 200
+
+# Role the proxy sorts on: raw values, missing days_to_cross last
+SORT_ROLE = Qt.ItemDataRole.UserRole
+
+# (header, getter, display format or None) per column. Formatting runs
+# only for cells being painted; other roles get the raw value.
+COLUMNS = (
+    ("Symbol", lambda c: c.symbol, None),
+    ("Score", lambda c: c.score, None),
+    ("Days to Cross", lambda c: c.days_to_cross, None),
+    ("Last Close", lambda c: c.last_close, None),
+    ("EMA20", lambda c: c.ema20, None),
+    ("EMA200", lambda c: c.ema200, None),
+    ("Gap", lambda c: c.gap, "{:.4f}"),
+    ("Slope Diff", lambda c: c.slope_diff, "{:.6f}"),
+    ("Reason", lambda c: c.reason, None),
+)
+
+
+class ScreenResultsModel(QAbstractTableModel):
+    """Read-only model over a list of ScreenResult.
+
+    Only the first `_loaded` rows are visible to views; a sorting proxy
+    therefore orders the loaded rows and places later batches as they
+    arrive.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[ScreenResult] = []
+        # Per-row tuple of column values, filled the first time a row is read
+        self._values: List[Optional[tuple]] = []
+        self._loaded = 0
+
+    def set_rows(self, rows: List[ScreenResult]) -> None:
+        """Replace all rows, touching only what differs from the current ones.
+
+        Rows whose symbols match the current rows position by position are
+        updated in place (dataChanged only where values differ), so they
+        keep their selection; the rest of the old rows are removed and the
+        new ones inserted. Already-loaded depth is kept across refreshes.
+        """
+        rows = list(rows)
+        old_loaded = self._loaded
+        new_loaded = min(len(rows), max(old_loaded, FETCH_BATCH))
+
+        # Leading rows that still show the same symbols
+        kept = 0
+        limit = min(old_loaded, new_loaded)
+        while kept < limit and self._rows[kept].symbol == rows[kept].symbol:
+            kept += 1
+
+        if old_loaded > kept:
+            self.beginRemoveRows(QModelIndex(), kept, old_loaded - 1)
+            self._loaded = kept
+            self.endRemoveRows()
+
+        changed = [i for i in range(kept) if self._rows[i] != rows[i]]
+        values: List[Optional[tuple]] = [None] * len(rows)
+        values[:kept] = self._values[:kept]
+        for i in changed:
+            values[i] = None
+        self._rows = rows
+        self._values = values
+        if changed:
+            self.dataChanged.emit(
+                self.index(changed[0], 0),
+                self.index(changed[-1], len(COLUMNS) - 1),
+                [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole, SORT_ROLE],
+            )
+
+        if new_loaded > kept:
+            self.beginInsertRows(QModelIndex(), kept, new_loaded - 1)
+            self._loaded = new_loaded
+            self.endInsertRows()
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._loaded < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        remainder = min(FETCH_BATCH, len(self._rows) - self._loaded)
+        if remainder <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + remainder - 1)
+        self._loaded += remainder
+        self.endInsertRows()
+
+    def row_at(self, row: int) -> ScreenResult:
+        """Result shown in a (source) row."""
+        return self._rows[row]
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        values = self._values[row]
+        if values is None:
+            result = self._rows[row]
+            values = self._values[row] = tuple(getter(result) for _, getter, _ in COLUMNS)
+        value = values[index.column()]
+        fmt = COLUMNS[index.column()][2]
+        if role == SORT_ROLE:
+            return float("inf") if value is None else value
+        if role == Qt.ItemDataRole.DisplayRole:
+            if value is None:
+                return "-"
+            return value if fmt is None else fmt.format(value)
+        if role == Qt.ItemDataRole.EditRole:
+            return "-" if value is None else value
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+        ):
+            return COLUMNS[section][0]
+        return None